@@ -1,100 +1,886 @@
 import os
 import json
-from typing import List, Optional
+import stat
+import hashlib
+import tempfile
+import importlib.util
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
 from dolphin.core import SkillFunction, Skillkit, get_logger
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    import datasketches
+except ImportError:
+    datasketches = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
+_NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+# Keep non-integral floats and huge uint64s apart from ints with the same bits
+_FLOAT_HASH_SALT = np.uint64(0xC2B2AE3D27D4EB4F)
+_UINT_HASH_SALT = np.uint64(0x165667B19E3779F9)
+_HLL_LG_K = 12  # 4096 buckets, ~1.6% relative error
+
+# Rust-backed Excel parser (pandas >= 2.2), much faster than openpyxl/xlrd
+_EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else None
+
+# Suffix -> reader(file_path, chunk_size) yielding the file as DataFrames
+_FRAME_READERS: Dict[str, Callable[[str, int], Iterable[pd.DataFrame]]] = {
+    ".csv": lambda path, chunk_size: pd.read_csv(path, chunksize=chunk_size),
+    ".xlsx": lambda path, _: [pd.read_excel(path, engine=_EXCEL_ENGINE)],
+    ".xls": lambda path, _: [pd.read_excel(path, engine=_EXCEL_ENGINE)],
+    ".json": lambda path, _: [pd.read_json(path)],
+    ".parquet": lambda path, _: [pd.read_parquet(path)],
+}
+
+
+# Column insights in output order; bit i of an insight flag selects entry i
+_INSIGHTS = (
+    "Low cardinality - likely categorical",
+    "High cardinality - likely unique identifiers",
+    "Mixed cardinality - potential text data",
+    "Integer data - could be counts, IDs, or discrete values",
+    "Float data - likely measurements or calculated values",
+    "Date/time data - temporal information",
+    "High null percentage - may need data imputation",
+    "Moderate null percentage - review data quality",
+    "All values unique - likely a primary key or ID column",
+)
+
+# Per-column record field -> parallel list in the struct-of-arrays layout
+_COLUMN_FIELDS = (
+    ("data_type", "data_types"),
+    ("non_null_count", "non_null_counts"),
+    ("null_percentage", "null_percentages"),
+    ("sample_values", "sample_values"),
+    ("unique_count", "unique_counts"),
+)
+_COLUMN_FORMATS = frozenset({"aos", "soa"})
+
+
+def _insight_flags(
+    kinds: np.ndarray, nulls: np.ndarray, ratios: np.ndarray, all_unique: np.ndarray
+) -> np.ndarray:
+    """Insight bit flags per column, computed from parallel per-column arrays
+
+    kinds holds each dtype.kind as an ASCII code. Unknown nulls/ratios are NaN
+    and fail every threshold.
+    """
+    is_text = kinds == 79  # "O": object and pandas string columns
+    return (
+        # Data type analysis; text could be string, categorical or mixed
+        np.where(is_text & (ratios < 0.1), 1, 0)
+        | np.where(is_text & (ratios > 0.8), 2, 0)
+        | np.where(is_text & (ratios >= 0.1) & (ratios <= 0.8), 4, 0)
+        | np.where((kinds == 105) | (kinds == 117), 8, 0)  # "i", "u"
+        | np.where(kinds == 102, 16, 0)  # "f"
+        | np.where(kinds == 77, 32, 0)  # "M"
+        # Null value analysis
+        | np.where(nulls > 50, 64, 0)
+        | np.where((nulls > 10) & (nulls <= 50), 128, 0)
+        # Unique value analysis
+        | np.where(all_unique, 256, 0)
+    )
+
+
+def _np_default(obj: Any) -> Any:
+    """json.dumps fallback for NumPy scalars and arrays left in the result"""
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any, indent: bool = True) -> str:
+    """Serialize a skill result, using orjson's C encoder when installed
+
+    Statistics are left as NumPy scalars; both encoders serialize them
+    natively instead of casting every value to a Python object up front.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(
+        obj, ensure_ascii=False, indent=2 if indent else None, default=_np_default
+    )
+
+
+def _select_columns(columns_info: dict, names: Iterable[str]) -> dict:
+    """Keep only the named columns of a struct-of-arrays column listing"""
+    wanted = set(names)
+    keep = [i for i, name in enumerate(columns_info["names"]) if name in wanted]
+    return {key: [values[i] for i in keep] for key, values in columns_info.items()}
+
+
+def _column_records(columns_info: dict) -> Dict[str, dict]:
+    """Expand a struct-of-arrays column listing into one dict per column"""
+    fields = [field for field, _ in _COLUMN_FIELDS]
+    rows = zip(*(columns_info[key] for _, key in _COLUMN_FIELDS))
+    return {
+        name: dict(zip(fields, row)) for name, row in zip(columns_info["names"], rows)
+    }
+
+
+def _hash_numbers(series: pd.Series) -> np.ndarray:
+    """Hash a numeric column so that equal numbers hash equally in any dtype
+
+    Integral values that fit in int64 are hashed as int64, so ints above 2**53
+    stay distinct and an int64 chunk agrees with a float64 chunk holding the
+    same integers. Other floats, and uint64 values beyond int64, are hashed in
+    their own dtype under a salt so they never collide with an int's bits.
+    """
+    if series.dtype.kind == "u":
+        raw = series.to_numpy(dtype=np.uint64, na_value=0)
+        hashes = pd.util.hash_array(raw.astype(np.int64))
+        beyond_int64 = raw > np.iinfo(np.int64).max
+        if beyond_int64.any():
+            hashes = np.where(
+                beyond_int64, pd.util.hash_array(raw) ^ _UINT_HASH_SALT, hashes
+            )
+        return hashes
+    if series.dtype.kind == "i":
+        return pd.util.hash_array(series.to_numpy(dtype=np.int64, na_value=0))
+
+    floats = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        integral = (
+            (floats == np.trunc(floats)) & (floats >= -(2.0**63)) & (floats < 2.0**63)
+        )
+    ints = np.where(integral, floats, 0).astype(np.int64)
+    return np.where(
+        integral,
+        pd.util.hash_array(ints),
+        pd.util.hash_array(floats) ^ _FLOAT_HASH_SALT,
+    )
+
+
+def _hash_rows(chunk: pd.DataFrame) -> np.ndarray:
+    """Hash every row to a uint64 that is stable across chunks
+
+    A column's inferred dtype may differ between chunks (int64 vs float64, bool
+    vs object, or float64 for an all-NaN chunk), so numbers are hashed by value
+    (see _hash_numbers), bools like the True/False objects of a chunk with
+    nulls, and nulls as one fixed value before the column hashes are combined.
+    """
+    row_hashes = np.zeros(len(chunk), dtype=np.uint64)
+    for col in chunk.columns:
+        series = chunk[col]
+        if pd.api.types.is_bool_dtype(series):
+            col_hashes = pd.util.hash_pandas_object(
+                series.astype(object), index=False
+            ).to_numpy()
+        elif series.dtype.kind in "iuf":
+            col_hashes = _hash_numbers(series)
+        else:
+            col_hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        col_hashes = np.where(series.isna().to_numpy(), _NULL_HASH, col_hashes)
+        row_hashes = row_hashes * np.uint64(1_000_003) ^ col_hashes
+    return row_hashes
+
+
+def _merge_sorted_unique(seen: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Add the distinct values not yet in seen (sorted, distinct) to it
+
+    Only the new values are sorted; they are located in seen by binary search
+    and inserted with one copy, so merging a chunk costs O(chunk log n + n)
+    instead of re-sorting everything seen so far.
+    """
+    # Sort and drop repeats; np.unique's hash-based path is slower here
+    values = np.sort(values)
+    if len(values) > 1:
+        values = values[np.concatenate(([True], values[1:] != values[:-1]))]
+    positions = np.searchsorted(seen, values)
+    found = positions < len(seen)
+    found[found] = seen[positions[found]] == values[found]
+    if found.all():
+        return seen
+    return np.insert(seen, positions[~found], values[~found])
+
+
+def _dtype_with_nulls(dtype: Any) -> Any:
+    """The dtype pandas reports for a column of this dtype that holds nulls
+
+    NumPy ints and bools have no missing value, so pandas widens them to
+    float64 (NaN) and object (None) respectively.
+    """
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iu":
+            return np.dtype("float64")
+        if dtype.kind == "b":
+            return np.dtype(object)
+    return dtype
+
+
+def _categorize_text(
+    chunk: pd.DataFrame, probe_rows: int = 10_000, max_unique_ratio: float = 0.5
+) -> pd.DataFrame:
+    """Convert repetitive text columns to 'category'
+
+    Deduplication and hashing of a categorical column work on its compact
+    integer codes and hash each distinct string only once. A column is only
+    converted when a probe of its first rows looks low-cardinality, so the
+    probe stays O(probe_rows) regardless of the chunk size.
+    """
+    converted = {}
+    for col, dtype in chunk.dtypes.items():
+        if dtype != object and not pd.api.types.is_string_dtype(dtype):
+            continue
+        probe = chunk[col].iloc[:probe_rows]
+        if len(probe) and probe.nunique() / len(probe) < max_unique_ratio:
+            converted[col] = chunk[col].astype("category")
+    return chunk.assign(**converted) if converted else chunk
+
+
+def _head_non_null(values: Any, n: int, window: int = 64) -> list:
+    """First n non-null values of a pandas Series or pyarrow Array
+
+    Scans geometrically growing windows from the start, so the cost follows
+    how far in the n-th non-null value sits instead of the column length, and
+    no full non-null copy of the column is ever made.
+    """
+    found: list = []
+    start = 0
+    while len(found) < n and start < len(values):
+        missing = n - len(found)
+        if isinstance(values, pd.Series):
+            part = values.iloc[start : start + window].dropna()
+            found.extend(part.iloc[:missing].tolist())
+        else:
+            part = pc.drop_null(values.slice(start, window))
+            found.extend(part.slice(0, missing).to_pylist())
+        start += window
+        window *= 4
+    return found
+
+
+@lru_cache(maxsize=1)
+def _column_executor() -> ThreadPoolExecutor:
+    """Shared pool for per-column Arrow work, which releases the GIL"""
+    return ThreadPoolExecutor(
+        max_workers=os.cpu_count() or 1, thread_name_prefix="tabular-stats"
+    )
+
+
+class _ColumnStats:
+    """Per-column statistics accumulated incrementally over DataFrame chunks
+
+    Only O(chunk) rows are alive at a time; what survives between chunks is the
+    per-column distinct values (or a fixed-size HLL sketch when cardinality is
+    approximated), a handful of samples and (optionally) one 64-bit hash per
+    distinct row for duplicate detection.
+    """
+
+    def __init__(
+        self,
+        max_sample_rows: int,
+        track_rows: bool = False,
+        approximate_cardinality: bool = False,
+        deep_memory: bool = False,
+    ):
+        self.max_sample_rows = max_sample_rows
+        self.track_rows = track_rows  # Also accumulate memory and duplicate stats
+        self.approximate_cardinality = approximate_cardinality
+        # Measure every Python object in object columns (sys.getsizeof per cell)
+        self.deep_memory = deep_memory
+        self.total_rows = 0
+        self.memory_bytes = 0
+        self.dtypes: Dict[str, np.dtype] = {}
+        self.non_null_counts: Dict[str, int] = {}
+        # A set, or for Arrow numeric columns a sorted array, of distinct values
+        self.unique_values: Dict[str, Union[set, np.ndarray]] = {}
+        self.sketches: Dict[str, "datasketches.hll_sketch"] = {}
+        self.sample_values: Dict[str, list] = {}
+        self._row_hashes = np.empty(0, dtype=np.uint64)
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self.dtypes)
+
+    def unique_count(self, col: str) -> int:
+        if self.approximate_cardinality:
+            return self._estimate_unique_count(col)
+        # Missing values are never added, so every entry is a distinct value
+        return len(self.unique_values[col])
+
+    def is_all_unique(self, col: str) -> bool:
+        """Whether every row holds a distinct non-null value"""
+        if self.non_null_counts[col] != self.total_rows:
+            return False
+        if self.approximate_cardinality:
+            # Accept the estimate when the row count is within its error bound
+            return self.sketches[col].get_upper_bound(2) >= self.total_rows
+        return self.unique_count(col) == self.total_rows
+
+    def _estimate_unique_count(self, col: str) -> int:
+        # HLL may overshoot; a column never has more distinct than non-null values
+        estimate = round(self.sketches[col].get_estimate())
+        return min(estimate, self.non_null_counts[col])
+
+    def _update_sketch(self, col: str, values: list) -> None:
+        sketch = self.sketches[col]
+        for value in values:
+            if not isinstance(value, (int, float, str)):
+                value = str(value)
+            sketch.update(value)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold one chunk into the running statistics"""
+        self.total_rows += len(chunk)
+
+        # Frame-wide calls: one C pass per statistic instead of one per column
+        counts = chunk.count()
+        categorized = _categorize_text(chunk)
+
+        for col, dtype in chunk.dtypes.items():
+            non_null_count = counts[col]
+            self._update_dtype(col, dtype, non_null_count)
+            self.non_null_counts[col] += non_null_count
+
+            # Deduplicate before dropping nulls so only the uniques get copied
+            distinct = categorized[col].drop_duplicates().dropna()
+            if self.approximate_cardinality:
+                self._update_sketch(col, distinct.tolist())
+            else:
+                # Only the chunk's uniques are hashed into the running set, so
+                # each chunk costs O(chunk) however many values came before
+                self.unique_values[col].update(distinct.tolist())
+
+            missing = self.max_sample_rows - len(self.sample_values[col])
+            if missing > 0 and non_null_count > 0:
+                self.sample_values[col].extend(_head_non_null(chunk[col], missing))
+
+        if self.track_rows:
+            self._add_memory(chunk)
+            self._update_duplicates(categorized)
+
+    def _add_memory(self, frame: pd.DataFrame) -> None:
+        # The index is counted once, as for the whole file in one DataFrame
+        self.memory_bytes += frame.memory_usage(
+            index=self.total_rows == len(frame), deep=self.deep_memory
+        ).sum()
+
+    def _add_column(self, col: str, dtype: np.dtype) -> None:
+        self.dtypes[col] = dtype
+        self.non_null_counts[col] = 0
+        self.unique_values[col] = set()
+        if self.approximate_cardinality:
+            self.sketches[col] = datasketches.hll_sketch(_HLL_LG_K)
+        self.sample_values[col] = []
+
+    def _update_dtype(self, col: str, dtype: np.dtype, non_null_count: int) -> None:
+        if col not in self.dtypes:
+            self._add_column(col, dtype)
+            return
+
+        current = self.dtypes[col]
+        if non_null_count == 0 or current == dtype:
+            # An all-null chunk carries no type information
+            return
+        if self.non_null_counts[col] == 0:
+            self.dtypes[col] = dtype
+        elif isinstance(current, np.dtype) and isinstance(dtype, np.dtype):
+            # e.g. int64 in one chunk and float64 (with NaN) in the next
+            try:
+                self.dtypes[col] = np.result_type(current, dtype)
+            except TypeError:
+                self.dtypes[col] = np.dtype(object)
+        else:
+            self.dtypes[col] = np.dtype(object)
+
+    @property
+    def duplicate_rows(self) -> int:
+        """Rows identical to an earlier row, in this chunk or a previous one"""
+        return self.total_rows - len(self._row_hashes)
+
+    def _update_duplicates(self, chunk: pd.DataFrame) -> None:
+        # Only the chunk's new row hashes are inserted into the sorted distinct
+        # hashes seen so far; has-duplicates and the count derive from its length
+        self._row_hashes = _merge_sorted_unique(self._row_hashes, _hash_rows(chunk))
+
+
+class _ArrowColumnStats(_ColumnStats):
+    """Column statistics accumulated over pyarrow RecordBatches
+
+    Counting, per-batch deduplication and sampling run in Arrow's C++ compute
+    kernels; only each batch's distinct values reach Python.
+    """
+
+    def update_batch(self, batch: "pa.RecordBatch") -> None:
+        """Fold one RecordBatch into the running statistics"""
+        if not self.dtypes:
+            # Report the dtypes pandas would produce; pandas index columns
+            # stored in the file are left out just like pd.read_parquet does
+            for col, dtype in batch.schema.empty_table().to_pandas().dtypes.items():
+                self._add_column(col, dtype)
+        self.total_rows += batch.num_rows
+
+        columns = self.columns
+        arrays = [batch.column(col) for col in columns]
+        if len(columns) > 1:
+            # Columns are independent, and pyarrow.compute runs without the GIL
+            list(_column_executor().map(self._update_column, columns, arrays))
+        else:
+            for col, column in zip(columns, arrays):
+                self._update_column(col, column)
+
+        if self.track_rows:
+            # Memory is measured on the DataFrame pandas would build, not on
+            # the Arrow buffers, so both paths report the same usage
+            frame = batch.to_pandas()
+            self._add_memory(frame)
+            self._update_duplicates(frame)
+
+    def _update_column(self, col: str, column: "pa.Array") -> None:
+        # Only touches this column's entries, so columns can run concurrently
+        self.non_null_counts[col] += len(column) - column.null_count
+        if column.null_count:
+            self.dtypes[col] = _dtype_with_nulls(self.dtypes[col])
+
+        distinct = pc.drop_null(pc.unique(column))
+        if pa.types.is_floating(distinct.type):
+            # NaN is a value to Arrow but missing to pandas' nunique
+            distinct = distinct.filter(pc.invert(pc.is_nan(distinct)))
+        if self.approximate_cardinality:
+            self._update_sketch(col, distinct.to_pylist())
+        elif pa.types.is_integer(distinct.type) or pa.types.is_floating(distinct.type):
+            # Numbers never become Python objects: they are merged into a
+            # sorted array (a file's Arrow types are fixed, so no int/float mix)
+            seen = self.unique_values[col]
+            if isinstance(seen, set):
+                seen = np.empty(0, dtype=distinct.type.to_pandas_dtype())
+            self.unique_values[col] = _merge_sorted_unique(seen, distinct.to_numpy())
+        else:
+            self.unique_values[col].update(distinct.to_pylist())
+
+        missing = self.max_sample_rows - len(self.sample_values[col])
+        if missing > 0 and column.null_count < len(column):
+            self.sample_values[col].extend(_head_non_null(column, missing))
+
+
+class _ParquetFooterStats(_ColumnStats):
+    """Column statistics read from a Parquet footer, without data pages
+
+    Row/column counts, dtypes, null counts and on-disk size all live in the
+    footer; samples come from one small leading batch. Values that need a full
+    scan (distinct counts, duplicate rows) are reported as unknown (None),
+    except distinct counts the writer recorded for a single row group.
+    """
+
+    def __init__(self, file_path: str, max_sample_rows: int):
+        super().__init__(max_sample_rows)
+        parquet_file = pq.ParquetFile(file_path)
+        metadata = parquet_file.metadata
+        self.total_rows = metadata.num_rows
+        for col, dtype in (
+            parquet_file.schema_arrow.empty_table().to_pandas().dtypes.items()
+        ):
+            self._add_column(col, dtype)
+
+        null_counts: Dict[str, Optional[int]] = {col: 0 for col in self.dtypes}
+        self.footer_distinct_counts: Dict[str, int] = {}
+        for index in range(metadata.num_row_groups):
+            row_group = metadata.row_group(index)
+            self.memory_bytes += row_group.total_byte_size
+            for chunk_index in range(row_group.num_columns):
+                column_chunk = row_group.column(chunk_index)
+                col = column_chunk.path_in_schema
+                if col not in null_counts:
+                    # Nested leaf or pandas index column
+                    continue
+                statistics = column_chunk.statistics
+                if statistics is None or not statistics.has_null_count:
+                    null_counts[col] = None
+                elif null_counts[col] is not None:
+                    null_counts[col] += statistics.null_count
+                if (
+                    metadata.num_row_groups == 1
+                    and statistics is not None
+                    and statistics.has_distinct_count
+                ):
+                    self.footer_distinct_counts[col] = statistics.distinct_count
+
+        for col, null_count in null_counts.items():
+            self.non_null_counts[col] = (
+                None if null_count is None else self.total_rows - null_count
+            )
+            if null_count:
+                self.dtypes[col] = _dtype_with_nulls(self.dtypes[col])
+
+        batch_size = max(max_sample_rows, 1)
+        for batch in parquet_file.iter_batches(batch_size=batch_size):
+            for col in self.columns:
+                self.sample_values[col] = _head_non_null(
+                    batch.column(col), max_sample_rows
+                )
+            break
+
+    @property
+    def duplicate_rows(self) -> Optional[int]:
+        return None
+
+    def unique_count(self, col: str) -> Optional[int]:
+        return self.footer_distinct_counts.get(col)
+
+    def is_all_unique(self, col: str) -> bool:
+        return (
+            self.non_null_counts[col] == self.total_rows
+            and self.unique_count(col) == self.total_rows
+        )
+
 
 class TabularSkillkit(Skillkit):
     """Tabular data analysis skillkit"""
 
-    SUPPORTED_EXTENSIONS = [".csv", ".xlsx", ".xls", ".json", ".parquet"]
+    SUPPORTED_EXTENSIONS: FrozenSet[str] = frozenset(_FRAME_READERS)
+    CACHE_FORMAT_VERSION = 2  # Bump whenever the shape of cached results changes
 
     def __init__(self):
         super().__init__()
         self.max_sample_rows = 5  # Max sample rows
         self.max_column_preview = 10  # Max column preview length
+        self.chunk_size = 200_000  # Rows per streamed CSV/Parquet chunk
+        self.csv_block_size = 16 * 1024 * 1024  # Bytes per pyarrow CSV block
+        # Estimate unique counts with HyperLogLog (needs datasketches) so
+        # memory stays constant on high-cardinality columns
+        self.approximate_cardinality = False
+        # Results are reused while the file's (mtime, size) is unchanged: first
+        # from an in-process LRU, then (opt-in) from JSON files under cache_dir.
+        # The on-disk cache is unbounded, so it is off unless a directory is set
+        self.cache_dir: Optional[Path] = None
+        self.memory_cache_size = 64
+        self._memory_cache: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
 
     def getName(self) -> str:
         return "tabular_skillkit"
 
-    def _validate_file_path(self, file_path: str) -> None:
-        """Validate file path and format"""
+    def _validate_file_path(self, file_path: str) -> Tuple[Path, os.stat_result, str]:
+        """Validate file path and format
+
+        A single stat() call covers the existence and regular-file checks; the
+        (path, stat result, lowercase suffix) it returns is threaded through the
+        rest of the call so none of it is recomputed.
+        """
         if not file_path:
             raise ValueError("File path cannot be empty")
 
         path = Path(file_path)
-        if not path.exists():
+        try:
+            st = path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        if not path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Path is not a file: {file_path}")
 
-        if path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
+        suffix = path.suffix.lower()
+        if suffix not in self.SUPPORTED_EXTENSIONS:
             raise ValueError(
-                f"Unsupported file format: {path.suffix}. Supported: {self.SUPPORTED_EXTENSIONS}"
+                f"Unsupported file format: {path.suffix}. Supported: {sorted(self.SUPPORTED_EXTENSIONS)}"
             )
 
-    def _read_dataframe(self, file_path: str) -> pd.DataFrame:
-        """Read file as DataFrame"""
-        path = Path(file_path)
-        suffix = path.suffix.lower()
+        return path, st, suffix
+
+    def _iter_frames(self, file_path: str, suffix: str) -> Iterator[pd.DataFrame]:
+        """Read file as a sequence of DataFrames
 
+        CSV is streamed in chunks so peak memory stays O(chunk) instead of
+        O(file); the other formats are yielded as a single frame.
+        """
         try:
-            if suffix == ".csv":
-                return pd.read_csv(file_path)
-            elif suffix in [".xlsx", ".xls"]:
-                return pd.read_excel(file_path)
-            elif suffix == ".json":
-                return pd.read_json(file_path)
-            elif suffix == ".parquet":
-                return pd.read_parquet(file_path)
-            else:
+            reader = _FRAME_READERS.get(suffix)
+            if reader is None:
                 raise ValueError(f"Unsupported file format: {suffix}")
+            yield from reader(file_path, self.chunk_size)
         except Exception as e:
             logger.error(f"Failed to read file {file_path}: {str(e)}")
             raise ValueError(f"Failed to read file: {str(e)}")
 
-    def _get_column_info_basic(self, df: pd.DataFrame) -> dict:
-        """Get basic column information"""
-        columns_info = {}
-
-        for col in df.columns:
-            dtype = str(df[col].dtype)
-            non_null_count = int(df[col].count())  # Convert to Python int
-            total_count = len(df)
-            null_percentage = (
-                ((total_count - non_null_count) / total_count * 100)
-                if total_count > 0
-                else 0
+    def _cache_key(
+        self, file_path: str, st: os.stat_result, tool: str, **options: Any
+    ) -> Tuple[str, str]:
+        """Build the (slot, version) cache key of one tool call
+
+        The slot identifies the file and every option that shapes the result;
+        the version is the file's mtime and size at the time of the call.
+        """
+        options.update(
+            approximate_cardinality=self.approximate_cardinality,
+            max_sample_rows=self.max_sample_rows,
+            max_column_preview=self.max_column_preview,
+        )
+        slot = json.dumps(
+            [
+                self.CACHE_FORMAT_VERSION,
+                os.path.abspath(file_path),
+                file_path,
+                tool,
+                options,
+            ],
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return slot, f"{st.st_mtime_ns}:{st.st_size}"
+
+    def _cache_path(self, slot: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha1(slot.encode()).hexdigest()}.json"
+
+    def _cache_get(self, cache_key: Tuple[str, str]) -> Optional[str]:
+        slot, version = cache_key
+        entry = self._memory_cache.get(slot)
+        if entry is not None and entry[0] == version:
+            self._memory_cache.move_to_end(slot)
+            return entry[1]
+
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._cache_path(slot), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if entry.get("key") != version:
+            return None
+
+        self._remember(slot, version, entry["payload"])
+        return entry["payload"]
+
+    def _cache_put(self, cache_key: Tuple[str, str], payload: str) -> None:
+        slot, version = cache_key
+        self._remember(slot, version, payload)
+
+        if self.cache_dir is None:
+            return
+        # Write-then-rename so concurrent readers never see a partial file
+        temp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": version, "payload": payload}, f, ensure_ascii=False)
+            os.replace(temp_path, self._cache_path(slot))
+        except OSError as e:
+            logger.warning(f"Failed to write tabular metadata cache: {str(e)}")
+            if temp_path is not None and os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _remember(self, slot: str, version: str, payload: str) -> None:
+        self._memory_cache[slot] = (version, payload)
+        self._memory_cache.move_to_end(slot)
+        while len(self._memory_cache) > self.memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
+    def invalidate_cache(self) -> None:
+        """Drop all cached metadata, in memory and on disk"""
+        self._memory_cache.clear()
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return
+        for cache_file in self.cache_dir.glob("*.json"):
+            try:
+                cache_file.unlink()
+            except OSError as e:
+                logger.warning(f"Failed to remove cache file {cache_file}: {str(e)}")
+
+    def _use_approximate_cardinality(self) -> bool:
+        if self.approximate_cardinality and datasketches is None:
+            logger.warning(
+                "datasketches is not installed, falling back to exact unique counts"
             )
+            return False
+        return self.approximate_cardinality
 
-            # 获取样本值
-            sample_values = df[col].dropna().head(self.max_sample_rows).tolist()
-            sample_values = [
-                str(val)[: self.max_column_preview] for val in sample_values
+    def _open_csv(self, file_path: str) -> "pa_csv.CSVStreamingReader":
+        """Stream a CSV with the column types pd.read_csv would infer
+
+        pyarrow parses dates, times and timestamps and types an all-empty
+        column as null, while pandas keeps the former as text and reads the
+        latter as float64; such columns are re-read with those types.
+        """
+        read_options = pa_csv.ReadOptions(block_size=self.csv_block_size)
+        # Treat empty fields as missing, like pd.read_csv
+        convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+        reader = pa_csv.open_csv(
+            file_path, read_options=read_options, convert_options=convert_options
+        )
+        column_types = {
+            field.name: pa.string() if pa.types.is_temporal(field.type) else pa.float64()
+            for field in reader.schema
+            if pa.types.is_temporal(field.type) or pa.types.is_null(field.type)
+        }
+        if not column_types:
+            return reader
+
+        reader.close()
+        convert_options.column_types = column_types
+        return pa_csv.open_csv(
+            file_path, read_options=read_options, convert_options=convert_options
+        )
+
+    def _get_columns_fast(
+        self,
+        file_path: str,
+        suffix: str,
+        track_rows: bool = False,
+        deep_memory: bool = False,
+    ) -> Optional[_ColumnStats]:
+        """Collect column statistics through pyarrow's lazy columnar readers
+
+        Parquet row groups and CSV blocks are decoded one batch at a time and
+        never materialized as a DataFrame. Returns None when pyarrow is not
+        installed or cannot handle the file (e.g. a CSV column whose type
+        changes after the first block), so the caller falls back to pandas.
+        """
+        if pa is None or suffix not in (".csv", ".parquet"):
+            return None
+
+        stats = _ArrowColumnStats(
+            self.max_sample_rows,
+            track_rows=track_rows,
+            approximate_cardinality=self._use_approximate_cardinality(),
+            deep_memory=deep_memory,
+        )
+        try:
+            if suffix == ".parquet":
+                batches = pq.ParquetFile(file_path).iter_batches(
+                    batch_size=self.chunk_size
+                )
+            else:
+                batches = self._open_csv(file_path)
+            for batch in batches:
+                stats.update_batch(batch)
+        except pa.ArrowException as e:
+            logger.warning(
+                f"pyarrow could not read {file_path}, falling back to pandas: {str(e)}"
+            )
+            return None
+
+        return stats
+
+    def _collect_stats(
+        self,
+        file_path: str,
+        suffix: str,
+        track_rows: bool = False,
+        deep_memory: bool = False,
+        metadata_only: bool = False,
+    ) -> _ColumnStats:
+        """Stream the file through a column statistics accumulator"""
+        if metadata_only and suffix == ".parquet" and pa is not None:
+            return _ParquetFooterStats(file_path, self.max_sample_rows)
+
+        stats = self._get_columns_fast(
+            file_path, suffix, track_rows=track_rows, deep_memory=deep_memory
+        )
+        if stats is not None:
+            return stats
+
+        stats = _ColumnStats(
+            self.max_sample_rows,
+            track_rows=track_rows,
+            approximate_cardinality=self._use_approximate_cardinality(),
+            deep_memory=deep_memory,
+        )
+        for chunk in self._iter_frames(file_path, suffix):
+            stats.update(chunk)
+        return stats
+
+    def _get_column_info_basic(self, stats: _ColumnStats) -> dict:
+        """Get basic column information as parallel lists, one entry per column"""
+        columns = stats.columns
+        total_count = stats.total_rows
+        non_null_counts = [stats.non_null_counts[col] for col in columns]
+
+        if total_count > 0:
+            null_percentages = [
+                # None: not recorded in the file metadata
+                round((total_count - count) / total_count * 100, 2)
+                if count is not None
+                else None
+                for count in non_null_counts
             ]
+        else:
+            null_percentages = [0.0] * len(columns)
 
-            columns_info[col] = {
-                "data_type": dtype,
-                "non_null_count": non_null_count,
-                "null_percentage": round(
-                    float(null_percentage), 2
-                ),  # Convert to Python float
-                "sample_values": sample_values,
-                "unique_count": (
-                    int(df[col].nunique()) if non_null_count > 0 else 0
-                ),  # Convert to Python int
-            }
+        return {
+            "names": columns,
+            "data_types": [str(stats.dtypes[col]) for col in columns],
+            "non_null_counts": non_null_counts,
+            "null_percentages": null_percentages,
+            # 获取样本值
+            "sample_values": [
+                [str(val)[: self.max_column_preview] for val in stats.sample_values[col]]
+                for col in columns
+            ],
+            "unique_counts": [stats.unique_count(col) for col in columns],
+        }
 
-        return columns_info
+    def _column_insights(
+        self, stats: _ColumnStats, basic_info: dict
+    ) -> List[List[str]]:
+        """Intelligently infer column meaning, one list of insights per column
+
+        Works on parallel NumPy arrays (one entry per column) turned into insight
+        bit flags instead of branching on dtype strings per column.
+        """
+        columns = stats.columns
+        kinds = np.frombuffer(
+            "".join(stats.dtypes[col].kind for col in columns).encode("ascii"),
+            dtype=np.uint8,
+        )
+        # Unknown (None) values become NaN
+        non_nulls = np.array(
+            [stats.non_null_counts[col] for col in columns], dtype=float
+        )
+        uniques = np.array(basic_info["unique_counts"], dtype=float)
+        nulls = np.array(basic_info["null_percentages"], dtype=float)
+        all_unique = np.array([stats.is_all_unique(col) for col in columns])
+        ratios = uniques / np.fmax(non_nulls, 1)
+
+        flags = _insight_flags(kinds, nulls, ratios, all_unique)
+
+        # Stringify once per distinct flag combination, not once per column
+        insights_by_flag = {
+            flag: [text for bit, text in enumerate(_INSIGHTS) if flag >> bit & 1]
+            for flag in np.unique(flags).tolist()
+        }
+        return [list(insights_by_flag[flag]) for flag in flags.tolist()]
 
     def get_tabular_columns(
-        self, file_path: str, return_feat: Optional[List[str]] = None, **kwargs
+        self,
+        file_path: str,
+        return_feat: Optional[List[str]] = None,
+        format: str = "aos",
+        **kwargs,
     ) -> str:
         """
         Extract raw column metadata from tabular data files.
@@ -104,6 +890,7 @@ class TabularSkillkit(Skillkit):
         Args:
             file_path (str): Path to the tabular data file.
             return_feat (list[str], optional): List of specific features/columns to return. If None, returns all.
+            format (str, optional): "aos" (default) maps each column name to its info; "soa" returns parallel lists (names, data_types, non_null_counts, null_percentages, sample_values, unique_counts), which is more compact for very wide tables.
             **kwargs: Additional properties passed to the tool.
 
         Returns:
@@ -111,45 +898,69 @@ class TabularSkillkit(Skillkit):
         """
         try:
             # Validate file path
-            self._validate_file_path(file_path)
+            _, st, suffix = self._validate_file_path(file_path)
+            if format not in _COLUMN_FORMATS:
+                raise ValueError(
+                    f"Unsupported format: {format}. Supported formats: {sorted(_COLUMN_FORMATS)}"
+                )
 
-            # Read data
-            df = self._read_dataframe(file_path)
+            cache_key = self._cache_key(
+                file_path,
+                st,
+                "get_tabular_columns",
+                return_feat=return_feat,
+                format=format,
+            )
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-            if df.empty:
-                return json.dumps(
-                    {"error": "File is empty or contains no data"}, ensure_ascii=False
-                )
+            # Stream data
+            stats = self._collect_stats(file_path, suffix)
+            total_rows = stats.total_rows
 
-            # Get column info
-            columns_info = self._get_column_info_basic(df)
+            if total_rows == 0 or not stats.columns:
+                return _dumps({"error": "File is empty or contains no data"}, indent=False)
+
+            # Get column info, then drop the accumulated distinct values so
+            # they are freed before JSON encoding
+            columns_info = self._get_column_info_basic(stats)
+            del stats
 
             # If specific columns are specified, return only their info
             if return_feat:
-                columns_info = {
-                    k: v for k, v in columns_info.items() if k in return_feat
-                }
-                if not columns_info:
-                    return json.dumps(
+                columns_info = _select_columns(columns_info, return_feat)
+                if not columns_info["names"]:
+                    return _dumps(
                         {"error": f"No matching columns found for: {return_feat}"},
-                        ensure_ascii=False,
+                        indent=False,
                     )
 
             # Build result
             result = {
                 "file_path": file_path,
-                "total_rows": len(df),
-                "total_columns": len(columns_info),
-                "columns": columns_info,
+                "total_rows": total_rows,
+                "total_columns": len(columns_info["names"]),
+                "columns": (
+                    columns_info if format == "soa" else _column_records(columns_info)
+                ),
             }
 
-            return json.dumps(result, ensure_ascii=False, indent=2)
+            payload = _dumps(result)
+            self._cache_put(cache_key, payload)
+            return payload
 
         except Exception as e:
             logger.error(f"Error in get_tabular_columns: {str(e)}")
-            return json.dumps({"error": str(e)}, ensure_ascii=False)
+            return _dumps({"error": str(e)}, indent=False)
 
-    def get_column_info(self, file_path: str, **kwargs) -> str:
+    def get_column_info(
+        self,
+        file_path: str,
+        detailed_memory: bool = False,
+        metadata_only: bool = False,
+        **kwargs,
+    ) -> str:
         """
         Intelligently analyze and interpret column information.
 
@@ -157,6 +968,8 @@ class TabularSkillkit(Skillkit):
 
         Args:
             file_path (str): Path to the tabular data file.
+            detailed_memory (bool, optional): Measure the size of every string/object value for memory usage. Slow on text-heavy files; by default only buffer sizes are counted.
+            metadata_only (bool, optional): For Parquet files, read only the file footer (row/column counts, types, null counts, on-disk size) plus a few sample rows, which is instant regardless of file size. Unique counts and duplicate analysis are then reported as null. Other formats are always fully scanned.
             **kwargs: Additional properties passed to the tool.
 
         Returns:
@@ -164,101 +977,79 @@ class TabularSkillkit(Skillkit):
         """
         try:
             # Validate file path
-            self._validate_file_path(file_path)
+            _, st, suffix = self._validate_file_path(file_path)
 
-            # Read data
-            df = self._read_dataframe(file_path)
+            cache_key = self._cache_key(
+                file_path,
+                st,
+                "get_column_info",
+                detailed_memory=detailed_memory,
+                metadata_only=metadata_only,
+            )
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
 
-            if df.empty:
-                return json.dumps(
-                    {"error": "File is empty or contains no data"}, ensure_ascii=False
-                )
+            # Stream data
+            stats = self._collect_stats(
+                file_path,
+                suffix,
+                track_rows=True,
+                deep_memory=detailed_memory,
+                metadata_only=metadata_only,
+            )
+            total_rows = stats.total_rows
+            total_columns = len(stats.columns)
+
+            if total_rows == 0 or total_columns == 0:
+                return _dumps({"error": "File is empty or contains no data"}, indent=False)
 
             # Get basic column info
-            basic_info = self._get_column_info_basic(df)
+            basic_info = self._get_column_info_basic(stats)
+            non_null_counts = list(stats.non_null_counts.values())
+            data_completeness = (
+                f"{sum(non_null_counts) / (total_rows * total_columns) * 100:.1f}%"
+                if None not in non_null_counts
+                else None
+            )
+            duplicate_rows = stats.duplicate_rows
 
             # Intelligent analysis
             analysis = {
                 "file_info": {
                     "path": file_path,
-                    "format": Path(file_path).suffix.lower(),
-                    "total_rows": int(len(df)),  # Convert to Python int
-                    "total_columns": int(len(df.columns)),  # Convert to Python int
-                    "memory_usage": f"{float(df.memory_usage(deep=True).sum()) / 1024:.2f} KB",  # Convert to Python float
+                    "format": suffix,
+                    "total_rows": total_rows,
+                    "total_columns": total_columns,
+                    "memory_usage": f"{stats.memory_bytes / 1024:.2f} KB",
                 },
                 "structure_analysis": {
-                    "has_duplicates": bool(df.duplicated().any()),  # Convert to Python bool
-                    "duplicate_rows": int(df.duplicated().sum()),  # Convert to Python int
-                    "data_completeness": f"{float(df.count().sum()) / (len(df) * len(df.columns)) * 100:.1f}%",  # Convert to Python float
+                    "has_duplicates": (
+                        duplicate_rows > 0 if duplicate_rows is not None else None
+                    ),
+                    "duplicate_rows": duplicate_rows,
+                    "data_completeness": data_completeness,
                 },
                 "column_analysis": {},
             }
 
             # Analyze each column
-            for col in df.columns:
-                col_info = basic_info[col]
-                dtype = col_info["data_type"]
-
-                # Intelligently infer column meaning
-                column_insights = []
-
-                # Data type analysis
-                if dtype == "object":
-                    # Could be string, categorical or mixed type
-                    unique_ratio = (
-                        col_info["unique_count"] / col_info["non_null_count"]
-                        if col_info["non_null_count"] > 0
-                        else 0
-                    )
-                    if unique_ratio < 0.1:
-                        column_insights.append("Low cardinality - likely categorical")
-                    elif unique_ratio > 0.8:
-                        column_insights.append(
-                            "High cardinality - likely unique identifiers"
-                        )
-                    else:
-                        column_insights.append(
-                            "Mixed cardinality - potential text data"
-                        )
-                elif dtype in ["int64", "float64"]:
-                    # Numeric data analysis
-                    if dtype == "int64":
-                        column_insights.append(
-                            "Integer data - could be counts, IDs, or discrete values"
-                        )
-                    else:
-                        column_insights.append(
-                            "Float data - likely measurements or calculated values"
-                        )
-                elif "datetime" in dtype.lower():
-                    column_insights.append("Date/time data - temporal information")
-
-                # Null value analysis
-                if col_info["null_percentage"] > 50:
-                    column_insights.append(
-                        "High null percentage - may need data imputation"
-                    )
-                elif col_info["null_percentage"] > 10:
-                    column_insights.append(
-                        "Moderate null percentage - review data quality"
-                    )
-
-                # Unique value analysis
-                if col_info["unique_count"] == len(df):
-                    column_insights.append(
-                        "All values unique - likely a primary key or ID column"
-                    )
-
-                analysis["column_analysis"][col] = {
-                    **col_info,
-                    "insights": column_insights,
-                }
+            column_insights = self._column_insights(stats, basic_info)
+            # Free distinct values and row hashes before JSON encoding
+            del stats
+            for (col, info), insights in zip(
+                _column_records(basic_info).items(), column_insights
+            ):
+                info["insights"] = insights
+                analysis["column_analysis"][col] = info
 
-            return json.dumps(analysis, ensure_ascii=False, indent=2)
+            payload = _dumps(analysis)
+            self._cache_put(cache_key, payload)
+            return payload
 
         except Exception as e:
             logger.error(f"Error in get_column_info: {str(e)}")
-            return json.dumps({"error": str(e)}, ensure_ascii=False)
+            return _dumps({"error": str(e)}, indent=False)
 
     def getSkills(self) -> List[SkillFunction]:
         """Return all available skill functions"""
@@ -13,6 +13,7 @@ Notes:
 
 from __future__ import annotations
 
+import importlib
 import warnings
 from typing import Any
 
@@ -23,36 +24,39 @@ warnings.warn(
 )
 
 
+# Legacy name -> (module, attribute) it now lives at
+_LAZY_EXPORTS = {
+    "Context": ("dolphin.core", "Context"),
+    "Env": ("dolphin.sdk", "Env"),
+    "DolphinAgent": ("dolphin.sdk", "DolphinAgent"),
+    "flags": ("dolphin.core", "flags"),
+}
+
+
 def __getattr__(name: str) -> Any:
     """
     Lazily resolve legacy exports.
 
     This avoids importing a large graph at module import time while keeping
-    backward compatibility for common entry points.
+    backward compatibility for common entry points. Resolved names are cached
+    in the module globals so later lookups bypass this hook.
     """
-    if name == "Context":
-        from dolphin.core import Context as _Context
-
-        return _Context
-    if name == "Env":
-        from dolphin.sdk import Env as _Env
-
-        return _Env
-    if name == "DolphinAgent":
-        from dolphin.sdk import DolphinAgent as _DolphinAgent
-
-        return _DolphinAgent
-    if name == "flags":
-        from dolphin.core import flags as _flags
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module 'DolphinLanguageSDK' has no attribute '{name}'. "
+            "This compatibility layer only exposes a small subset of legacy APIs. "
+            "Please migrate to dolphin.core/dolphin.sdk."
+        ) from None
 
-        return _flags
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
 
-    raise AttributeError(
-        f"module 'DolphinLanguageSDK' has no attribute '{name}'. "
-        "This compatibility layer only exposes a small subset of legacy APIs. "
-        "Please migrate to dolphin.core/dolphin.sdk."
-    )
 
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-__all__ = ["Context", "Env", "DolphinAgent", "flags"]
 
+__all__ = list(_LAZY_EXPORTS)
@@ -1,82 +1,187 @@
 
-import asyncio
+import contextlib
+import os
 import threading
 import sys
 import select
-from typing import Optional
-
-async def _monitor_interrupt(token, stop_event: threading.Event):
-    """Monitor stdin for ESC key in a separate thread."""
-    loop = asyncio.get_running_loop()
-    try:
-        await loop.run_in_executor(None, _blocking_stdin_monitor, token, stop_event)
-    except:
-        pass
-
-def _blocking_stdin_monitor(token, stop_event: threading.Event):
-    """Blocking monitor for ESC key using select/termios."""
-    import tty
-    import termios
-    
-    if not sys.stdin.isatty():
-        return
-        
-    fd = sys.stdin.fileno()
-    try:
-        old_settings = termios.tcgetattr(fd)
-    except:
-        return
-
-    try:
-        # Set to cbreak mode to read keys without waiting for newline
-        tty.setcbreak(fd)
-        while not stop_event.is_set():
-            # Check if input is available (timeout 0.1s)
-            if select.select([sys.stdin], [], [], 0.1)[0]:
+from typing import Optional, TextIO
+
+
+class KeyboardMonitor:
+    """Long-lived stdin monitor for ESC interrupts during agent execution.
+
+    A single daemon thread is started once per conversation. It only puts the
+    terminal into cbreak mode and reads keys while armed, so each turn costs an
+    Event flip instead of a thread/task spawn. A self-pipe wakes the thread
+    immediately on disarm or close.
+
+    Usage:
+        monitor = KeyboardMonitor(interrupt_token)
+        monitor.start()
+        monitor.arm()      # before agent execution
+        monitor.disarm()   # after execution, before prompting again
+        monitor.close()    # when the conversation ends
+    """
+
+    # Upper bound for disarm() to wait for the terminal to be restored
+    RELEASE_TIMEOUT = 1.0
+
+    def __init__(self, token, stdin: Optional[TextIO] = None):
+        self._token = token
+        self._stdin = stdin if stdin is not None else sys.stdin
+        self._armed = threading.Event()
+        # Set while the terminal is in its original mode and stdin is not read
+        self._released = threading.Event()
+        self._released.set()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r: Optional[int] = None
+        self._wake_w: Optional[int] = None
+
+    def start(self) -> None:
+        """Start the monitor thread (no-op when stdin is not a terminal)."""
+        if self._thread is not None:
+            return
+        try:
+            if not self._stdin.isatty():
+                return
+        except Exception:
+            return
+
+        # Allow restarting after close()
+        self._closed = False
+        self._armed.clear()
+        self._released.set()
+        self._wake_r, self._wake_w = os.pipe()
+        self._thread = threading.Thread(
+            target=self._run, name="dolphin-keyboard-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def arm(self) -> None:
+        """Start watching for interrupt keys."""
+        if self._thread is None:
+            return
+        self._released.clear()
+        self._armed.set()
+
+    def disarm(self) -> None:
+        """Stop watching and wait until the terminal settings are restored."""
+        if self._thread is None:
+            return
+        self._armed.clear()
+        self._wake()
+        self._released.wait(self.RELEASE_TIMEOUT)
+
+    def close(self) -> None:
+        """Stop the monitor thread and release its resources."""
+        if self._thread is None:
+            return
+        with self._lock:
+            self._closed = True
+            self._armed.set()
+        self._wake()
+        self._thread.join(self.RELEASE_TIMEOUT)
+        self._thread = None
+        for fd in (self._wake_r, self._wake_w):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._wake_r = self._wake_w = None
+
+    def _wake(self) -> None:
+        try:
+            os.write(self._wake_w, b"\0")
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            self._armed.wait()
+            if self._closed:
+                break
+            try:
+                self._watch_keys()
+            finally:
+                with self._lock:
+                    # A triggered interrupt also disarms until the next turn
+                    if not self._closed:
+                        self._armed.clear()
+                    self._released.set()
+
+    def _watch_keys(self) -> None:
+        """Read keys in cbreak mode until disarmed, closed or interrupted."""
+        import tty
+        import termios
+
+        fd = self._stdin.fileno()
+        try:
+            old_settings = termios.tcgetattr(fd)
+        except termios.error:
+            return
+
+        try:
+            # Set to cbreak mode to read keys without waiting for newline
+            tty.setcbreak(fd)
+            while self._armed.is_set() and not self._closed:
+                readable = select.select([fd, self._wake_r], [], [])[0]
+                if self._wake_r in readable:
+                    # Drain wake-ups, then re-check the armed/closed state
+                    os.read(self._wake_r, 1024)
+                    continue
                 try:
-                    key = sys.stdin.read(1)
-                    if key == '\x1b': # ESC code
-                        token.trigger_interrupt()
-                        # Once triggered, we can stop
-                        break
-                    elif key == '\x03': # Ctrl-C
-                        # Also trigger interrupt on Ctrl-C
-                        token.trigger_interrupt()
-                        break
-                    elif key in ('\r', '\n'): # Enter
-                        # Treat Enter as an interrupt signal only if there is buffered text
-                        # This makes the UI feel like a real-time chat
-                        if token._realtime_input_buffer:
-                            token.trigger_interrupt()
-                            break
-                        # Otherwise ignore empty Enter
-                    else:
-                        # Append to buffer and ECHO to the fixed input line
-                        buffer = token.append_realtime_input(key)
-                        
-                        # Echoing with cursor preservation
-                        try:
-                            import shutil
-                            height = shutil.get_terminal_size().lines
-                            # Save cursor, move to bottom line, clear, draw prompt + buffer, restore
-                            # We use atomic write to minimize flickering
-                            echo_output = (
-                                f"\0337"                 # Save cursor
-                                f"\033[{height};1H"      # Move to bottom line
-                                f"\033[K> {buffer}█"     # Clear and draw with block cursor
-                                f"\0338"                 # Restore cursor
-                            )
-                            sys.stdout.write(echo_output)
-                            sys.stdout.flush()
-                        except:
-                            pass
-                except:
+                    key = self._stdin.read(1)
+                except (OSError, ValueError):
+                    # stdin closed or unreadable
+                    break
+                if _handle_key(self._token, key):
                     break
-    except:
-        pass
-    finally:
-        # ABSOLUTELY ESSENTIAL: Restore original terminal settings
+        except (OSError, ValueError, termios.error):
+            pass
+        finally:
+            # ABSOLUTELY ESSENTIAL: Restore original terminal settings
+            with contextlib.suppress(termios.error):
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+
+
+def _handle_key(token, key: str) -> bool:
+    """Apply one key press to the token; return True to stop watching."""
+    if not key: # EOF
+        return True
+    elif key == '\x1b': # ESC code
+        token.trigger_interrupt()
+        return True
+    elif key == '\x03': # Ctrl-C
+        # Also trigger interrupt on Ctrl-C
+        token.trigger_interrupt()
+        return True
+    elif key in ('\r', '\n'): # Enter
+        # Treat Enter as an interrupt signal only if there is buffered text
+        # This makes the UI feel like a real-time chat
+        if token._realtime_input_buffer:
+            token.trigger_interrupt()
+            return True
+        # Otherwise ignore empty Enter
+    else:
+        # Append to buffer and ECHO to the fixed input line
+        buffer = token.append_realtime_input(key)
+
+        # Echoing with cursor preservation
         try:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        except:
+            import shutil
+            height = shutil.get_terminal_size().lines
+            # Save cursor, move to bottom line, clear, draw prompt + buffer, restore
+            # We use atomic write to minimize flickering
+            echo_output = (
+                f"\0337"                 # Save cursor
+                f"\033[{height};1H"      # Move to bottom line
+                f"\033[K> {buffer}█"     # Clear and draw with block cursor
+                f"\0338"                 # Restore cursor
+            )
+            sys.stdout.write(echo_output)
+            sys.stdout.flush()
+        except (OSError, ValueError):
             pass
+    return False
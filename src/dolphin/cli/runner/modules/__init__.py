@@ -40,6 +40,7 @@ from dolphin.cli.runner.modules.debugger import (
 
 # Conversation loop
 from dolphin.cli.runner.modules.conversation import (
+    ConversationSession,
     runConversationLoop,
     _handle_user_interrupt,
     _promptUserInput,
@@ -62,6 +63,7 @@ __all__ = [
     '_recoverAgentFromError',
     '_get_skillkit_info',
     # Conversation
+    'ConversationSession',
     'runConversationLoop',
     '_handle_user_interrupt',
     '_promptUserInput',
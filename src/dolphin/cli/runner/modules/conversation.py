@@ -12,24 +12,165 @@ Key Features:
 - Status bar with spinner animation during processing
 
 Extracted Functions:
+- ConversationSession: Layout, interrupt and event plumbing reused across turns
 - _handle_user_interrupt: Handle user interrupts (ESC or Ctrl-C)
 - runConversationLoop: Main conversation loop orchestration
 - _promptUserInput: Prompt user for input with interrupt support
 """
 
 import asyncio
+import re
+import signal
 import sys
-from typing import Any, Dict, Optional, Tuple
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from dolphin.core import flags
 from dolphin.core.common.exceptions import DebuggerQuitException, UserInterrupt
-from dolphin.core.logging.logger import console
+from dolphin.core.logging.logger import console, console_plain
 
 from dolphin.cli.args.parser import Args
 from dolphin.cli.utils.helpers import outputVariablesToJson
 from dolphin.cli.interrupt.handler import InterruptToken
+from dolphin.cli.interrupt.keyboard import KeyboardMonitor
+from dolphin.cli.ui.components import StatusBar
+from dolphin.cli.ui.event_dispatcher import CLIEventDispatcher
 from dolphin.cli.ui.layout import LayoutManager
-from dolphin.cli.ui.console import console_session_start, console_display_session_info
+from dolphin.cli.ui.console import (
+    console_conversation_end,
+    console_display_session_info,
+    console_session_start,
+)
+from dolphin.cli.runner.modules.agent_lifecycle import _get_skillkit_info
+from dolphin.cli.runner.modules.debugger import _handleLiveDebugCommand
+from dolphin.cli.runner.modules.execution import _runFirstExecution, _runSubsequentExecution
+
+# Inputs that end the conversation (compared after strip().lower())
+_EXIT_WORDS = frozenset({"exit", "quit", "q", ""})
+
+# Live debug command prefixes -> default debug command
+# /debug enters REPL, others execute once and return to conversation
+_DEBUG_DISPATCH = {
+    "debug": None,      # /debug or /debug <cmd> -> enters REPL or executes single cmd
+    "trace": "trace",
+    "snapshot": "snapshot",
+    "vars": "vars",
+    "var": "var",
+    "progress": "progress",
+    "help": "help",
+}
+_DEBUG_PREFIX_RE = re.compile(
+    r"^/(debug|trace|snapshot|vars?|progress|help)\b(.*)$", re.IGNORECASE | re.DOTALL
+)
+
+
+@dataclass
+class ConversationSession:
+    """UI and interrupt plumbing shared by all turns of a conversation.
+
+    Built once per conversation by runConversationLoop, or created by an
+    embedding caller (REPL frameworks, tests) and passed in so the same
+    components are reused across calls.
+    """
+
+    layout: LayoutManager
+    interrupt_token: InterruptToken
+    event_dispatcher: CLIEventDispatcher
+    keyboard_monitor: KeyboardMonitor
+    interactive: bool = False
+
+    @classmethod
+    def from_args(cls, args: Args) -> "ConversationSession":
+        """Create a session configured from parsed CLI arguments."""
+        layout = LayoutManager(enabled=args.interactive)
+        interrupt_token = InterruptToken()
+        return cls(
+            layout=layout,
+            interrupt_token=interrupt_token,
+            # Event dispatcher for Plan UI
+            event_dispatcher=CLIEventDispatcher(layout=layout, verbose=args.saveHistory),
+            # One keyboard monitor thread for the whole conversation, armed per turn
+            keyboard_monitor=KeyboardMonitor(interrupt_token),
+            interactive=args.interactive,
+        )
+
+    @contextmanager
+    def running(self, agent, agent_name: str) -> Iterator["ConversationSession"]:
+        """Attach the session to an agent for one conversation.
+
+        Opens the layout and binds the interrupt token on entry; stops plan
+        UI, the keyboard monitor and the layout on exit so the session can
+        be entered again later.
+        """
+        if self.interactive:
+            # Setup scroll region FIRST, then print banner inside the scrollable area
+            self.layout.start_session("Interactive", agent_name)
+        restore_sigint = None
+        try:
+            # Bind interrupt token to agent and event loop
+            self.interrupt_token.bind(agent, asyncio.get_running_loop())
+            if self.interactive:
+                self.keyboard_monitor.start()
+                restore_sigint = self._install_sigint_handler()
+            yield self
+        finally:
+            StatusBar._debug_log("ConversationSession: closing")
+            if restore_sigint is not None:
+                restore_sigint()
+            # Cleanup event dispatcher
+            self.event_dispatcher.cleanup()
+            # Cleanup
+            self.keyboard_monitor.close()
+            self.interrupt_token.unbind()
+            if self.interactive:
+                self.layout.end_session()
+
+    def _install_sigint_handler(self):
+        """Route Ctrl-C to the interrupt token instead of task cancellation.
+
+        The first SIGINT of a turn interrupts the agent cooperatively, like
+        ESC. A second one while the interrupt is still pending cancels the
+        conversation task, in case the agent is not reaching an interrupt
+        check. A third restores the previous handler and raises
+        KeyboardInterrupt, which also gets through when a turn blocks the
+        event loop (sync skill, input(), C extension).
+
+        Returns:
+            Callable restoring the previous handler, or None when signal
+            handlers cannot be installed (not on the main thread)
+        """
+        loop = asyncio.get_running_loop()
+        task = asyncio.current_task()
+        token = self.interrupt_token
+        previous = signal.getsignal(signal.SIGINT)
+        presses = 0
+
+        def restore() -> None:
+            if signal.getsignal(signal.SIGINT) is on_sigint:
+                # getsignal() is None for handlers not installed from Python
+                signal.signal(
+                    signal.SIGINT, previous if previous is not None else signal.SIG_DFL
+                )
+
+        # A plain signal handler, not loop.add_signal_handler(): it runs even
+        # while the event loop is blocked
+        def on_sigint(signum, frame) -> None:
+            nonlocal presses
+            presses = presses + 1 if token.is_interrupted() else 1
+            if presses == 1:
+                token.trigger_interrupt()
+            elif presses == 2 and task is not None:
+                loop.call_soon_threadsafe(task.cancel)
+            else:
+                restore()
+                raise KeyboardInterrupt
+
+        try:
+            signal.signal(signal.SIGINT, on_sigint)
+        except ValueError:
+            return None
+        return restore
 
 
 async def _handle_user_interrupt(agent, layout, source: str) -> None:
@@ -43,8 +184,6 @@ async def _handle_user_interrupt(agent, layout, source: str) -> None:
         layout: The LayoutManager instance
         source: String identifying the interrupt source for logging ("UserInterrupt" or "CancelledError")
     """
-    from dolphin.cli.ui.components import StatusBar
-
     layout.hide_status()
 
     # Use the centralized state-machine API; avoid direct private field mutation.
@@ -52,188 +191,178 @@ async def _handle_user_interrupt(agent, layout, source: str) -> None:
         await agent.mark_user_interrupted(f"Agent paused due to {source}")
     except Exception as e:
         # Keep CLI responsive and leave final state handling to next execution cycle.
-        StatusBar._debug_log(f"_handle_user_interrupt: state transition skipped due to {e}")
+        StatusBar._debug_log("_handle_user_interrupt: state transition skipped due to %s", e)
 
     # Clear the interrupt event so future calls don't immediately re-interrupt
-    if hasattr(agent, "clear_interrupt"):
-        agent.clear_interrupt()
+    # (clear_interrupt is part of the BaseAgent interface)
+    agent.clear_interrupt()
 
-    StatusBar._debug_log(f"_handle_user_interrupt: handled {source}, agent state set to PAUSED/USER_INTERRUPT")
+    StatusBar._debug_log("_handle_user_interrupt: handled %s, agent state set to PAUSED/USER_INTERRUPT", source)
 
 
-async def runConversationLoop(agent, args: Args, initialVariables: Dict[str, Any]) -> bool:
+async def runConversationLoop(
+    agent,
+    args: Args,
+    initialVariables: Dict[str, Any],
+    session: Optional[ConversationSession] = None,
+) -> bool:
     """Run the main conversation loop with fixed layout and interrupt support.
 
     Args:
         agent: Agent instance
         args: Parsed CLI arguments
         initialVariables: Initial variables
+        session: Optional ConversationSession to reuse; built from args if omitted
 
     Returns:
         True if should enter post-mortem after interactive mode ends
     """
-    # Initialize layout manager and interrupt token
-    layout = LayoutManager(enabled=args.interactive)
-    interrupt_token = InterruptToken()
+    if session is None:
+        session = ConversationSession.from_args(args)
+    with session.running(agent, args.agent):
+        return await _conversationTurns(agent, args, initialVariables, session)
 
-    # Initialize event dispatcher for Plan UI
-    from dolphin.cli.ui.event_dispatcher import CLIEventDispatcher
-    event_dispatcher = CLIEventDispatcher(layout=layout, verbose=args.saveHistory)
 
+async def _conversationTurns(
+    agent,
+    args: Args,
+    initialVariables: Dict[str, Any],
+    session: ConversationSession,
+) -> bool:
+    """Print the session banner and run turns until the conversation ends."""
+    layout = session.layout
+    interrupt_token = session.interrupt_token
+    keyboard_monitor = session.keyboard_monitor
+    event_dispatcher = session.event_dispatcher
+
+    # Unpack arguments read on every turn once
+    interactive = args.interactive
+    saveHistory = args.saveHistory
+    outputVariables = args.outputVariables
+    agentName = args.agent
     currentQuery = args.query
+    # Flags are applied before the conversation starts and do not change during it
+    debugMode = flags.is_enabled(flags.DEBUG_MODE)
 
     if currentQuery:
         agent.add_bucket(bucket_name="_query", content=currentQuery)
 
-    if args.interactive:
+    if interactive:
         mode = "Interactive"
-        # Setup scroll region FIRST, then print banner inside the scrollable area
-        layout.start_session(mode, args.agent)
-        console_session_start(mode, args.agent)
+        console_session_start(mode, agentName)
 
         # Display available skillkits and command hints
-        from dolphin.cli.runner.modules.agent_lifecycle import _get_skillkit_info
         skillkit_info = _get_skillkit_info(agent)
         console_display_session_info(skillkit_info, show_commands=True)
 
-        if flags.is_enabled(flags.DEBUG_MODE):
-            console("💡 输入 /debug 进入实时调试，/trace /snapshot /vars 快速查看", verbose=args.saveHistory)
+        if debugMode:
+            console("💡 输入 /debug 进入实时调试，/trace /snapshot /vars 快速查看", verbose=saveHistory)
     else:
         mode = "Execution"
         # No layout for non-interactive mode, just print banner
-        console_session_start(mode, args.agent)
+        console_session_start(mode, agentName)
 
         # Display available skillkits (no command hints in non-interactive mode)
-        from dolphin.cli.runner.modules.agent_lifecycle import _get_skillkit_info
         skillkit_info = _get_skillkit_info(agent)
         console_display_session_info(skillkit_info, show_commands=False)
 
     isFirstExecution = True
     enterPostmortemAfterInteractive = False
 
-    # DEBUG: Import StatusBar for logging
-    from dolphin.cli.ui.components import StatusBar
-    StatusBar._debug_log(f"runConversationLoop: starting, interactive={args.interactive}, currentQuery={currentQuery!r}")
+    StatusBar._debug_log("runConversationLoop: starting, interactive=%s, currentQuery=%r", interactive, currentQuery)
 
-    try:
-        # Bind interrupt token to agent and event loop
-        interrupt_token.bind(agent, asyncio.get_running_loop())
+    while True:
+        StatusBar._debug_log("runConversationLoop: loop iteration, isFirstExecution=%s, currentQuery=%r", isFirstExecution, currentQuery)
 
-        while True:
-            StatusBar._debug_log(f"runConversationLoop: loop iteration, isFirstExecution={isFirstExecution}, currentQuery={currentQuery!r}")
+        # Prompt for input if not first execution and interactive mode
+        if not currentQuery and interactive and not isFirstExecution:
+            StatusBar._debug_log("runConversationLoop: calling _promptUserInput")
+            currentQuery, shouldBreak, debugCommand = await _promptUserInput(
+                args, interrupt_token, layout
+            )
 
-            # Prompt for input if not first execution and interactive mode
-            if not currentQuery and args.interactive and not isFirstExecution:
-                StatusBar._debug_log(f"runConversationLoop: calling _promptUserInput")
-                currentQuery, shouldBreak, debugCommand = await _promptUserInput(
-                    args, interrupt_token
-                )
+            # Handle live debug command
+            if debugCommand is not None:
+                await _handleLiveDebugCommand(agent, debugCommand)
+                currentQuery = None
+                continue
 
-                # Handle live debug command
-                if debugCommand is not None:
-                    from dolphin.cli.runner.modules.debugger import _handleLiveDebugCommand
-                    await _handleLiveDebugCommand(agent, debugCommand)
-                    currentQuery = None
-                    continue
+            if shouldBreak:
+                if debugMode and interactive:
+                    enterPostmortemAfterInteractive = True
+                break
+
+        try:
+            # Clear interrupt state before execution
+            interrupt_token.clear()
+
+            # Show inline status bar (simplified - no fixed positioning)
+            if interactive:
+                layout.show_status("Processing your request", "esc to interrupt")
 
-                if shouldBreak:
-                    if flags.is_enabled(flags.DEBUG_MODE) and args.interactive:
-                        enterPostmortemAfterInteractive = True
-                    break
+            # Watch for ESC interrupt while the agent runs
+            keyboard_monitor.arm()
 
             try:
-                # Clear interrupt state before execution
-                interrupt_token.clear()
-
-                # Show inline status bar (simplified - no fixed positioning)
-                if args.interactive:
-                    layout.show_status("Processing your request", "esc to interrupt")
-
-                # Start keyboard monitor for ESC interrupt
-                monitor_stop = None
-                monitor_task = None
-                if args.interactive:
-                    import threading
-                    from dolphin.cli.interrupt.keyboard import _monitor_interrupt
-                    monitor_stop = threading.Event()
-                    monitor_task = asyncio.create_task(_monitor_interrupt(interrupt_token, monitor_stop))
-
-                try:
-                    if isFirstExecution:
-                        StatusBar._debug_log(f"runConversationLoop: running first execution")
-                        from dolphin.cli.runner.modules.execution import _runFirstExecution
-                        await _runFirstExecution(agent, args, initialVariables, event_dispatcher)
-                        isFirstExecution = False
-                        StatusBar._debug_log(f"runConversationLoop: first execution done")
-                    else:
-                        from dolphin.cli.runner.modules.execution import _runSubsequentExecution
-                        await _runSubsequentExecution(agent, args, currentQuery, event_dispatcher)
-                finally:
-                    # Stop keyboard monitor
-                    if monitor_stop:
-                        monitor_stop.set()
-                    if monitor_task:
-                        try:
-                            await monitor_task
-                        except:
-                            pass
-
-                # Hide status bar after completion
-                if args.interactive:
-                    layout.hide_status()
-                    StatusBar._debug_log(f"runConversationLoop: status bar hidden")
-
-            except DebuggerQuitException:
-                layout.hide_status()
-                console("✅ 调试会话已结束。")
-                break
-            except UserInterrupt:
-                # UserInterrupt: user pressed ESC, interrupt() was called
-                StatusBar._debug_log(f"runConversationLoop: UserInterrupt caught, continuing loop")
-                if args.interactive:
-                    await _handle_user_interrupt(agent, layout, "UserInterrupt")
-                    isFirstExecution = False
-                else:
-                    raise
-            except asyncio.CancelledError:
-                # CancelledError: Ctrl-C SIGINT or asyncio task cancellation
-                StatusBar._debug_log(f"runConversationLoop: CancelledError caught, continuing loop")
-                if args.interactive:
-                    await _handle_user_interrupt(agent, layout, "CancelledError")
+                if isFirstExecution:
+                    StatusBar._debug_log("runConversationLoop: running first execution")
+                    await _runFirstExecution(agent, args, initialVariables, event_dispatcher)
                     isFirstExecution = False
+                    StatusBar._debug_log("runConversationLoop: first execution done")
                 else:
-                    raise
-            except Exception as e:
-                StatusBar._debug_log(f"runConversationLoop: Exception caught: {type(e).__name__}: {e}")
-                raise
+                    await _runSubsequentExecution(agent, args, currentQuery, event_dispatcher)
+            finally:
+                # Restore the terminal before prompting again
+                keyboard_monitor.disarm()
 
-            currentQuery = None
-            StatusBar._debug_log(f"runConversationLoop: after execution, about to check interactive={args.interactive}")
+            # Hide status bar after completion
+            if interactive:
+                layout.hide_status()
+                StatusBar._debug_log("runConversationLoop: status bar hidden")
+
+        except DebuggerQuitException:
+            layout.hide_status()
+            console("✅ 调试会话已结束。")
+            break
+        except UserInterrupt:
+            # UserInterrupt: user pressed ESC, interrupt() was called
+            StatusBar._debug_log("runConversationLoop: UserInterrupt caught, continuing loop")
+            if interactive:
+                await _handle_user_interrupt(agent, layout, "UserInterrupt")
+                isFirstExecution = False
+            else:
+                raise
+        except asyncio.CancelledError:
+            # CancelledError: repeated Ctrl-C or asyncio task cancellation
+            StatusBar._debug_log("runConversationLoop: CancelledError caught, continuing loop")
+            if interactive:
+                await _handle_user_interrupt(agent, layout, "CancelledError")
+                isFirstExecution = False
+            else:
+                raise
+        except Exception as e:
+            StatusBar._debug_log("runConversationLoop: Exception caught: %s: %s", type(e).__name__, e)
+            raise
 
+        currentQuery = None
+        StatusBar._debug_log("runConversationLoop: after execution, about to check interactive=%s", interactive)
 
-            if not args.interactive:
-                StatusBar._debug_log(f"runConversationLoop: not interactive, breaking")
-                break
 
-        # Final output for interactive mode
-        if args.interactive and args.outputVariables:
-            outputVariablesToJson(agent.get_context(), args.outputVariables)
+        if not interactive:
+            StatusBar._debug_log("runConversationLoop: not interactive, breaking")
+            break
 
-    finally:
-        StatusBar._debug_log(f"runConversationLoop: finally block executing")
-        # Cleanup event dispatcher
-        event_dispatcher.cleanup()
-        # Cleanup
-        interrupt_token.unbind()
-        if args.interactive:
-            layout.end_session()
+    # Final output for interactive mode
+    if interactive and outputVariables:
+        outputVariablesToJson(agent.get_context(), outputVariables)
 
     return enterPostmortemAfterInteractive
 
 
 async def _promptUserInput(
     args: Args,
-    interrupt_token: Optional[InterruptToken] = None
+    interrupt_token: Optional[InterruptToken] = None,
+    layout: Optional[LayoutManager] = None
 ) -> Tuple[Optional[Any], bool, Optional[str]]:
     """Prompt user for input in interactive mode with ESC interrupt support.
 
@@ -242,6 +371,7 @@ async def _promptUserInput(
     Args:
         args: Parsed CLI arguments
         interrupt_token: Optional InterruptToken for ESC handling
+        layout: Optional LayoutManager tracking cursor visibility
 
     Returns:
         Tuple of (query, shouldBreak, debugCommand)
@@ -250,17 +380,21 @@ async def _promptUserInput(
         - debugCommand: Debug command if user requested live debug, else None
     """
     try:
+        # Imported on first prompt: creating the prompt_toolkit session at
+        # import time warns when stdin is not a terminal (non-interactive runs)
         from dolphin.cli.ui.input import (
             prompt_conversation_with_multimodal,
             EscapeInterrupt
         )
-        from dolphin.cli.ui.components import StatusBar
 
-        StatusBar._debug_log(f"_promptUserInput: starting (simplified)")
+        StatusBar._debug_log("_promptUserInput: starting (simplified)")
 
         # Ensure cursor is visible before prompting
-        sys.stdout.write("\033[?25h")
-        sys.stdout.flush()
+        if layout is not None:
+            layout.set_cursor_visible(True)
+        else:
+            sys.stdout.write("\033[?25h")
+            sys.stdout.flush()
 
         try:
             # Get any real-time input buffered while the agent was running
@@ -268,7 +402,7 @@ async def _promptUserInput(
             if interrupt_token:
                 default_text = interrupt_token.get_realtime_input(consume=True)
                 if default_text:
-                    StatusBar._debug_log(f"_promptUserInput: found realtime buffer: {default_text!r}")
+                    StatusBar._debug_log("_promptUserInput: found realtime buffer: %r", default_text)
 
             # Use multimodal-aware prompt that processes @paste, @image:, @url: syntax
             # Returns: str for plain text, List[Dict] for multimodal content
@@ -277,15 +411,14 @@ async def _promptUserInput(
                 interrupt_token=interrupt_token,
                 verbose=True
             )
-            StatusBar._debug_log(f"_promptUserInput: got input: {currentQuery!r}")
+            StatusBar._debug_log("_promptUserInput: got input: %r", currentQuery)
 
         except EscapeInterrupt:
             # ESC pressed during input - treat as empty input
-            StatusBar._debug_log(f"_promptUserInput: EscapeInterrupt")
+            StatusBar._debug_log("_promptUserInput: EscapeInterrupt")
             return None, False, None
 
     except (EOFError, KeyboardInterrupt):
-        from dolphin.cli.ui.console import console_conversation_end
         console_conversation_end()
         return None, True, None
 
@@ -295,33 +428,22 @@ async def _promptUserInput(
         return currentQuery, False, None
 
     # For string input, check exit commands and debug prefixes
-    if not currentQuery or currentQuery.lower().strip() in ["exit", "quit", "q", ""]:
-        console("Conversation ended", verbose=args.saveHistory)
+    if not currentQuery or currentQuery.strip().lower() in _EXIT_WORDS:
+        console_plain("Conversation ended", verbose=args.saveHistory)
         return None, True, None
 
     # Check for debug command prefixes (live debug mode)
-    # /debug enters REPL, others execute once and return to conversation
-    debugPrefixes = {
-        "/debug": None,      # /debug or /debug <cmd> -> enters REPL or executes single cmd
-        "/trace": "trace",
-        "/snapshot": "snapshot",
-        "/vars": "vars",
-        "/var": "var",
-        "/progress": "progress",
-        "/help": "help",
-    }
-
-    queryLower = currentQuery.lower()
-    for prefix, defaultCmd in debugPrefixes.items():
-        if queryLower.startswith(prefix):
-            # Extract the debug command
-            remainder = currentQuery[len(prefix):].strip()
-            if defaultCmd:
-                # For /trace, /snapshot, etc., the command is the prefix itself
-                debugCmd = f"{defaultCmd} {remainder}".strip() if remainder else defaultCmd
-            else:
-                # For /debug, remainder is the full command (or 'help' if empty)
-                debugCmd = remainder if remainder else "help"
-            return None, False, debugCmd
+    match = _DEBUG_PREFIX_RE.match(currentQuery)
+    if match:
+        defaultCmd = _DEBUG_DISPATCH[match.group(1).lower()]
+        # Extract the debug command
+        remainder = match.group(2).strip()
+        if defaultCmd:
+            # For /trace, /snapshot, etc., the command is the prefix itself
+            debugCmd = f"{defaultCmd} {remainder}" if remainder else defaultCmd
+        else:
+            # For /debug, remainder is the full command (or 'help' if empty)
+            debugCmd = remainder if remainder else "help"
+        return None, False, debugCmd
 
     return currentQuery, False, None
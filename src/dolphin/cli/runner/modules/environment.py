@@ -8,7 +8,7 @@ including environment setup, configuration loading, and feature flag management.
 import logging
 
 from dolphin.core import flags
-from dolphin.core.logging.logger import console
+from dolphin.core.logging.logger import console_log
 from dolphin.sdk.runtime.env import Env
 from dolphin.core.config.global_config import GlobalConfig
 
@@ -17,18 +17,15 @@ from dolphin.cli.args.parser import Args
 
 def _print_flags_status():
     """Print current status of all feature flags."""
-    all_flags = flags.get_all()
-    for flag_name, flag_value in sorted(all_flags.items()):
-        state = "Enabled" if flag_value else "Disabled"
-        console(f"[Flag] {flag_name}: {state}")
+    for flag_name, flag_value in flags.iter_sorted():
+        console_log("[Flag] %s: %s", flag_name, "Enabled" if flag_value else "Disabled")
 
 
 def _should_print_flags_status(args: Args) -> bool:
     """Return whether feature flags should be printed to console."""
     if flags.is_enabled(flags.DEBUG_MODE):
         return True
-    log_level = str(getattr(args, "logLevel", "") or "").upper()
-    return log_level == "DEBUG"
+    return (args.logLevel or "").upper() == "DEBUG"
 
 
 async def initializeEnvironment(args: Args):
@@ -16,9 +16,18 @@ from typing import Optional
 
 from dolphin.core import flags
 from dolphin.core.common.exceptions import DolphinException, SkillException
-from dolphin.core.logging.logger import console
+from dolphin.core.logging.logger import console, console_log, console_plain
 from dolphin.cli.args.parser import Args
 
+# SkillException text embedded in another exception's message:
+# "Skill 'xxx' not found.\n\nAvailable skills..."
+_SKILL_ERROR_RE = re.compile(
+    r"(Skill '[^']+' not found\..*?Verify that the required skillkit module is loaded)",
+    re.DOTALL,
+)
+# End of the "Possible fixes" section ("... [skillkit ]module is loaded")
+_SKILL_ERROR_END = "module is loaded"
+
 
 def handle_execution_error(e: Exception, args: Args) -> None:
     """Handle execution errors with user-friendly output.
@@ -38,7 +47,7 @@ def handle_execution_error(e: Exception, args: Args) -> None:
 
     if isinstance(root_cause, SkillException):
         # SkillException has a detailed, user-friendly message
-        console(f"\n❌ Skill Error:\n{root_cause.message}")
+        console_log("\n❌ Skill Error:\n%s", root_cause.message)
         if show_full_traceback:
             console("\n--- Full Traceback (debug mode) ---")
             traceback.print_exc()
@@ -47,27 +56,29 @@ def handle_execution_error(e: Exception, args: Args) -> None:
         skill_error_msg = extract_skill_error_message(e)
         if skill_error_msg:
             # Display the extracted skill error message in a clean format
-            console(f"\n❌ Skill Error:\n{skill_error_msg}")
+            console_log("\n❌ Skill Error:\n%s", skill_error_msg)
         else:
             # Other DolphinException types - show concise error
-            console(f"\n❌ Error [{root_cause.code}]: {root_cause.message}")
+            console_log("\n❌ Error [%s]: %s", root_cause.code, root_cause.message)
         if show_full_traceback:
             console("\n--- Full Traceback (debug mode) ---")
             traceback.print_exc()
     else:
         # Unknown exception - show more details
-        console(f"\n❌ Error executing Dolphin agent: {e}")
+        console_log("\n❌ Error executing Dolphin agent: %s", e)
         if show_full_traceback or args.saveHistory:
             traceback.print_exc()
         else:
-            console("💡 Run with --vv or --debug for full traceback")
+            console_plain("💡 Run with --vv or --debug for full traceback")
 
 
 def extract_root_cause(e: Exception) -> Exception:
     """Extract the root cause from a chain of exceptions.
 
-    Traverses the exception chain (__cause__ and __context__) to find
-    the original DolphinException that triggered the error.
+    Follows the __cause__ chain (explicit "raise ... from ...") first, then
+    the __context__ branches (implicit chaining) met along the way, to find
+    the original DolphinException that triggered the error. Each exception
+    is visited once, tracked by identity, so cyclic chains terminate.
 
     Args:
         e: The top-level exception
@@ -75,23 +86,17 @@ def extract_root_cause(e: Exception) -> Exception:
     Returns:
         The root cause exception (a DolphinException if found, otherwise the original)
     """
-    # First, check if the current exception is already a DolphinException
-    if isinstance(e, DolphinException):
-        return e
-
-    # Traverse __cause__ chain (explicit "raise ... from ...")
-    current = e
-    while current.__cause__ is not None:
-        current = current.__cause__
-        if isinstance(current, DolphinException):
-            return current
-
-    # Traverse __context__ chain (implicit exception chaining)
-    current = e
-    while current.__context__ is not None:
-        current = current.__context__
-        if isinstance(current, DolphinException):
-            return current
+    seen = set()
+    # Start of each chain to walk; __context__ branches are queued as found
+    branches = [e]
+    for current in branches:
+        while current is not None and id(current) not in seen:
+            if isinstance(current, DolphinException):
+                return current
+            seen.add(id(current))
+            if current.__context__ is not None:
+                branches.append(current.__context__)
+            current = current.__cause__
 
     # No DolphinException found, return original
     return e
@@ -111,29 +116,21 @@ def extract_skill_error_message(e: Exception) -> Optional[str]:
     """
     error_str = str(e)
 
-    # Look for the SkillException pattern in the message
-    # Pattern: "Skill 'xxx' not found.\n\nAvailable skills..."
+    # Both formats below start at "Skill '"; skip the regex scan otherwise
+    start_idx = error_str.find("Skill '")
+    if start_idx == -1:
+        return None
 
     # Try to find the skill error block
-    skill_error_pattern = r"(Skill '[^']+' not found\..*?Verify that the required skillkit module is loaded)"
-    match = re.search(skill_error_pattern, error_str, re.DOTALL)
-
+    match = _SKILL_ERROR_RE.search(error_str, start_idx)
     if match:
         return match.group(1)
 
     # Alternative: look for SKILL_NOT_FOUND pattern
     if "SKILL_NOT_FOUND" in error_str and "Available skills" in error_str:
         # Extract from "Skill '" to the end of "Possible fixes" section
-        start_idx = error_str.find("Skill '")
-        if start_idx != -1:
-            # Find the end of the message (after "Possible fixes" section)
-            end_patterns = ["module is loaded", "skillkit module is loaded"]
-            end_idx = len(error_str)
-            for pattern in end_patterns:
-                idx = error_str.find(pattern, start_idx)
-                if idx != -1:
-                    end_idx = min(end_idx, idx + len(pattern))
-            if end_idx > start_idx:
-                return error_str[start_idx:end_idx]
+        idx = error_str.find(_SKILL_ERROR_END, start_idx)
+        end_idx = idx + len(_SKILL_ERROR_END) if idx != -1 else len(error_str)
+        return error_str[start_idx:end_idx]
 
     return None
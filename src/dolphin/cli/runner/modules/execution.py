@@ -9,13 +9,43 @@ Functions:
 - _runSubsequentExecution: Execute agent in chat mode or resume after interrupt
 """
 
+from contextlib import contextmanager
 from typing import Any, Dict
 
 from dolphin.core import flags
+from dolphin.core.logging.logger import set_console_flush_hook
 from dolphin.cli.args.parser import Args
+from dolphin.cli.ui.components import StatusBar
 from dolphin.cli.utils.helpers import outputVariablesToJson
 
 
+@contextmanager
+def _dispatch_output_events(agent, event_dispatcher):
+    """Push the agent's output events straight to the dispatcher during a run.
+
+    Events are delivered from Context.write_output() as they happen, so the
+    run loop does not poll drain_output_events() after every step. Rendering
+    is coalesced per frame, and flushed before any direct console write
+    (skill call boxes, etc.) and when the run ends.
+    """
+    context = agent.get_context()
+    if context is not None:
+        context.set_output_sink(event_dispatcher.dispatch_deferred)
+    set_console_flush_hook(event_dispatcher.flush)
+    try:
+        yield
+    finally:
+        set_console_flush_hook(None)
+        event_dispatcher.flush()
+        if context is not None:
+            context.set_output_sink(None)
+        else:
+            # Agent was initialized lazily during the run; flush its buffer
+            context = agent.get_context()
+            if context is not None:
+                event_dispatcher.dispatch_batch(context.drain_output_events())
+
+
 async def _runFirstExecution(
     agent,
     args: Args,
@@ -30,34 +60,30 @@ async def _runFirstExecution(
         initialVariables: Initial variables
         event_dispatcher: CLIEventDispatcher for Plan UI updates
     """
-    from dolphin.cli.ui.components import StatusBar
-    StatusBar._debug_log(f"_runFirstExecution: starting")
+    StatusBar._debug_log("_runFirstExecution: starting")
 
-    debugKwargs = {"debug_mode": flags.is_enabled(flags.DEBUG_MODE)}
-    if flags.is_enabled(flags.DEBUG_MODE):
+    debugMode = flags.is_enabled(flags.DEBUG_MODE)
+    debugKwargs = {"debug_mode": debugMode}
+    if debugMode:
         if args.breakOnStart:
             debugKwargs["break_on_start"] = True
         if args.breakAt:
             debugKwargs["break_at"] = args.breakAt
 
     try:
-        async for result in agent.arun(**debugKwargs, **initialVariables):
-            # Consume and dispatch events from context
-            context = agent.get_context()
-            if context:
-                events = context.drain_output_events()
-                if events:
-                    event_dispatcher.dispatch_batch(events)
+        with _dispatch_output_events(agent, event_dispatcher):
+            async for _ in agent.arun(**debugKwargs, **initialVariables):
+                pass
 
-        StatusBar._debug_log(f"_runFirstExecution: arun completed")
+        StatusBar._debug_log("_runFirstExecution: arun completed")
     except Exception as e:
-        StatusBar._debug_log(f"_runFirstExecution: exception during arun: {e}")
+        StatusBar._debug_log("_runFirstExecution: exception during arun: %s", e)
         raise
 
     if args.outputVariables and not args.interactive:
         outputVariablesToJson(agent.get_context(), args.outputVariables)
 
-    StatusBar._debug_log(f"_runFirstExecution: done")
+    StatusBar._debug_log("_runFirstExecution: done")
 
 
 async def _runSubsequentExecution(agent, args, query, event_dispatcher) -> None:
@@ -69,13 +95,9 @@ async def _runSubsequentExecution(agent, args, query, event_dispatcher) -> None:
         query: User input - can be str for text or List[Dict] for multimodal content
         event_dispatcher: CLIEventDispatcher for Plan UI updates
     """
-    async for result in agent.continue_chat(message=query):
-        # Consume and dispatch events from context
-        context = agent.get_context()
-        if context:
-            events = context.drain_output_events()
-            if events:
-                event_dispatcher.dispatch_batch(events)
+    with _dispatch_output_events(agent, event_dispatcher):
+        async for _ in agent.continue_chat(message=query):
+            pass
 
     if args.outputVariables:
         outputVariablesToJson(agent.get_context(), args.outputVariables)
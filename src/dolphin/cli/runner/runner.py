@@ -20,9 +20,7 @@ import random
 import sys
 import traceback
 import uuid
-from typing import Any, Dict, Optional
-
-from rich.console import Console as RichConsole
+from typing import Any, Dict, Optional, Tuple
 
 from dolphin.core import flags
 from dolphin.core.common.exceptions import DebuggerQuitException, UserInterrupt
@@ -68,6 +66,17 @@ from dolphin.core.utils.rich_status import safe_rich_status
 # - errors.py: handle_execution_error
 # - environment.py: initializeEnvironment
 
+def _resolveSessionIds(args: Args) -> Tuple[str, str]:
+    """Return (userId, sessionId), generating ids that were not given
+
+    Args:
+        args: Parsed CLI arguments
+    """
+    userId = args.userId or str(uuid.uuid4())
+    sessionId = args.sessionId or str(uuid.uuid4())
+    return userId, sessionId
+
+
 async def runDolphinAgent(args: Args) -> None:
     """Run Dolphin Language agent
     
@@ -84,53 +93,7 @@ async def runDolphinAgent(args: Args) -> None:
     from dolphin.cli.utils.helpers import validateArgs
     
     validateArgs(args)
-    
-    richConsole = RichConsole()
-    initialVariables = buildVariables(args)
-    
-    userId = args.userId if args.userId else str(uuid.uuid4())
-    sessionId = args.sessionId if args.sessionId else str(uuid.uuid4())
-    
-    env = None
-    try:
-        with safe_rich_status(
-            "[bold green]Initializing Dolphin Environment...",
-            console=richConsole,
-        ) as status:
-            status.update("[bold blue]Loading configuration...[/]")
-            env, _ = await initializeEnvironment(args)
-            
-            status.update(f"[bold blue]Loading agents from:[/][white] {args.folder}[/]")
-            if args.skillFolder:
-                status.update(
-                    f"[bold blue]Loading agents from:[/][white] {args.folder}[/] "
-                    f"[dim](& skills from {args.skillFolder})[/]"
-                )
-            
-            status.update(f"[bold blue]Initializing agent:[/][white] {args.agent}[/]")
-            agent = await loadAndPrepareAgent(env, args, initialVariables)
-            
-            agent.set_user_id(userId)
-            agent.set_session_id(sessionId)
-            
-            status.update("[bold green]Ready![/]")
-        
-        # Run conversation
-        enterPostmortem = await runConversationLoop(agent, args, initialVariables)
-        
-        # Save artifacts
-        await saveExecutionArtifacts(agent, args)
-        
-        # Post-mortem
-        await enterPostmortemIfNeeded(agent, args, enterPostmortem)
-        
-        await env.ashutdown()
-
-    except Exception as e:
-        handle_execution_error(e, args)
-        if env is not None and hasattr(env, "ashutdown"):
-            await env.ashutdown()
-        sys.exit(1)
+    await _runDolphinAgentWithEnv(None, args)
 
 
 async def runDolphin(args: Args) -> None:
@@ -192,9 +155,7 @@ async def runBuiltinExploreAgent(args: Args) -> None:
     # Register EnvSkillkit for local bash/python execution
     env_skillkit = EnvSkillkit()
     env_skillkit.setGlobalConfig(globalConfig)
-    for skill in env_skillkit.getSkills():
-        env.globalSkills.installedSkillset.addSkill(skill)
-    env.globalSkills._syncAllSkills()
+    env.globalSkills.installSkillkit(env_skillkit)
     
     console(f"[bold green]👋 Hi! I'm Dolphin, your AI Pair Programmer.[/]")
     console(f"   I can help you write code, debug issues, and explore this project.")
@@ -205,26 +166,32 @@ async def runBuiltinExploreAgent(args: Args) -> None:
 
 
 async def _runDolphinAgentWithEnv(env, args: Args) -> None:
-    """Run Dolphin agent with a pre-configured environment
+    """Run Dolphin agent, initializing the environment unless one is given
     
     Args:
-        env: Pre-configured Dolphin environment
+        env: Pre-configured Dolphin environment, or None to initialize it from args
         args: Parsed CLI arguments
     """
-    from dolphin.cli.utils.helpers import validateArgs, buildVariables, outputVariablesToJson
-    
-    richConsole = RichConsole()
     initialVariables = buildVariables(args)
-    
-    userId = args.userId if args.userId else str(uuid.uuid4())
-    sessionId = args.sessionId if args.sessionId else str(uuid.uuid4())
+    userId, sessionId = _resolveSessionIds(args)
     
     try:
         with safe_rich_status(
-            "[bold green]Initializing agent...[/]",
-            console=richConsole,
+            "[bold green]Initializing Dolphin Environment..."
+            if env is None else "[bold green]Initializing agent...[/]",
         ) as status:
-            status.update(f"[bold blue]Loading agent:[/][white] {args.agent}[/]")
+            if env is None:
+                status.update("[bold blue]Loading configuration...[/]")
+                env, _ = await initializeEnvironment(args)
+                
+                status.update(f"[bold blue]Loading agents from:[/][white] {args.folder}[/]")
+                if args.skillFolder:
+                    status.update(
+                        f"[bold blue]Loading agents from:[/][white] {args.folder}[/] "
+                        f"[dim](& skills from {args.skillFolder})[/]"
+                    )
+            
+            status.update(f"[bold blue]Initializing agent:[/][white] {args.agent}[/]")
             agent = await loadAndPrepareAgent(env, args, initialVariables)
             
             agent.set_user_id(userId)
@@ -245,6 +212,6 @@ async def _runDolphinAgentWithEnv(env, args: Args) -> None:
 
     except Exception as e:
         handle_execution_error(e, args)
-        if env is not None and hasattr(env, "ashutdown"):
+        if env is not None:
             await env.ashutdown()
         sys.exit(1)
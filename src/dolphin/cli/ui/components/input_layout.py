@@ -4,13 +4,22 @@ Fixed Input Layout Component for Dolphin CLI
 Provides a terminal layout with fixed bottom input area and scrollable top content.
 """
 
+import os
+import signal
 import sys
-import threading
 from typing import Optional
 
 from dolphin.cli.ui.theme import Theme
 from dolphin.cli.ui.components.status_bar import StatusBar
-from dolphin.cli.ui.state import safe_write, safe_print
+from dolphin.cli.ui.state import _stdout_lock, safe_write, safe_print
+
+
+def _stdout_fileno() -> Optional[int]:
+    """Return the stdout file descriptor, or None if stdout has none."""
+    try:
+        return sys.stdout.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
 
 
 class FixedInputLayout:
@@ -51,76 +60,125 @@ class FixedInputLayout:
         self._terminal_height = 24
         self._terminal_width = 80
         self._active = False
-        self._lock = threading.Lock()
+        # Colored separator line, rebuilt only when the width changes
+        self._separator = ""
+        self._separator_width = 0
+        self._stdout_fd = _stdout_fileno()
+        # Set by the SIGWINCH handler; the size is re-read on the next redraw
+        self._resize_pending = False
+        # Set while _handle_resize is installed; the previous handler may be
+        # SIG_DFL (0), so its value cannot tell whether one was installed
+        self._sigwinch_installed = False
+        self._original_sigwinch_handler = None
 
     def _get_terminal_size(self) -> tuple:
-        """Get terminal dimensions."""
-        try:
-            import shutil
-            size = shutil.get_terminal_size()
-            return size.lines, size.columns
-        except Exception:
-            return 24, 80
-
-    def _setup_scroll_region(self):
-        """Setup ANSI scroll region (top portion of screen)."""
+        """Get terminal dimensions.
+
+        Queries the stdout descriptor directly instead of going through
+        shutil.get_terminal_size() and its environment-variable fallbacks.
+        """
+        if self._stdout_fd is not None:
+            try:
+                size = os.get_terminal_size(self._stdout_fd)
+                if size.lines and size.columns:
+                    return size.lines, size.columns
+            except OSError:
+                pass
+        return 24, 80
+
+    def _scroll_region_sequence(self) -> str:
+        """Return the sequence setting the ANSI scroll region (top portion of screen)."""
         self._terminal_height, self._terminal_width = self._get_terminal_size()
         scroll_bottom = self._terminal_height - self.BOTTOM_RESERVE
 
         # Set scroll region: ESC[<top>;<bottom>r
         # This makes only lines 1 to scroll_bottom scrollable
-        safe_write(f"\033[1;{scroll_bottom}r")
+        return f"\033[1;{scroll_bottom}r"
 
-        # Move cursor to top of scroll region
-        safe_write("\033[1;1H")
-        safe_write("", flush=True)
+    def _handle_resize(self, signum, frame):
+        """Handle terminal resize event.
 
-    def _draw_fixed_bottom(self):
-        """Draw the fixed bottom area (status bar, info, input prompt)."""
-        height, width = self._terminal_height, self._terminal_width
-        bottom_start = height - self.BOTTOM_RESERVE + 1
+        Runs in signal handler context, so it only marks the size as stale;
+        the next redraw re-reads it.
+        """
+        self._resize_pending = True
+
+    def _pending_resize_sequence(self) -> str:
+        """Re-read the terminal size after a resize; return the scroll region update."""
+        if not self._resize_pending:
+            return ""
+        self._resize_pending = False
+
+        # Setting the scroll region homes the cursor, so keep it in place
+        return f"\0337{self._scroll_region_sequence()}\0338"
+
+    def _get_separator(self, width: int) -> str:
+        """Return the colored separator line for the given terminal width."""
+        if width != self._separator_width:
+            self._separator = f"{Theme.BORDER}{'─' * (width - 1)}{Theme.RESET}"
+            self._separator_width = width
+        return self._separator
 
-        # Save cursor position
-        safe_write("\0337")
+    def _draw_fixed_bottom(self):
+        """Draw the fixed bottom area (status bar, info, input prompt).
 
-        # Move to bottom area (outside scroll region)
-        safe_write(f"\033[{bottom_start};1H")
+        The whole redraw is written with a single write/flush, so other
+        writers never see a half-drawn bottom area.
+        """
+        safe_write(self._pending_resize_sequence() + self._fixed_bottom_sequence(), flush=True)
 
-        # Clear the bottom lines
-        for i in range(self.BOTTOM_RESERVE):
-            safe_write(f"\033[{bottom_start + i};1H\033[K")
+    def _fixed_bottom_sequence(self) -> str:
+        """Return the sequence drawing the fixed bottom area."""
+        height, width = self._terminal_height, self._terminal_width
+        bottom_start = height - self.BOTTOM_RESERVE + 1
 
-        # Draw separator line
-        safe_write(f"\033[{bottom_start};1H")
-        separator = f"{Theme.BORDER}{'─' * (width - 1)}{Theme.RESET}"
-        safe_write(separator)
+        parts = [
+            # Save cursor position
+            "\0337",
+            # Clear the bottom lines (outside scroll region)
+            "".join(
+                f"\033[{bottom_start + i};1H\033[K" for i in range(self.BOTTOM_RESERVE)
+            ),
+            # Draw separator line
+            f"\033[{bottom_start};1H",
+            self._get_separator(width),
+        ]
 
         # Draw info line (if any)
         if self.info_line:
-            safe_write(f"\033[{bottom_start + 1};1H")
-            safe_write(f"{Theme.MUTED}{self.info_line}{Theme.RESET}")
+            parts.append(f"\033[{bottom_start + 1};1H")
+            parts.append(f"{Theme.MUTED}{self.info_line}{Theme.RESET}")
 
         # Status bar will be drawn by StatusBar class at bottom_start + 2
 
         # Input prompt position: bottom_start + 3
-        safe_write(f"\033[{bottom_start + 3};1H")
-        safe_write(f"{Theme.PRIMARY}>{Theme.RESET} ")
+        parts.append(f"\033[{bottom_start + 3};1H")
+        parts.append(f"{Theme.PRIMARY}>{Theme.RESET} ")
 
         # Restore cursor to scroll region
-        safe_write("\0338")
-        safe_write("", flush=True)
+        parts.append("\0338")
+        return "".join(parts)
 
     def start(self):
         """Initialize the fixed layout."""
         self._active = True
-        self._setup_scroll_region()
-
-        # Clear screen in scroll region
-        safe_write("\033[2J\033[1;1H")
-        safe_write("", flush=True)
-
-        # Draw fixed bottom
-        self._draw_fixed_bottom()
+        self._resize_pending = False
+        if hasattr(signal, 'SIGWINCH') and not self._sigwinch_installed:
+            try:
+                self._original_sigwinch_handler = signal.signal(signal.SIGWINCH, self._handle_resize)
+                self._sigwinch_installed = True
+            except ValueError:
+                # Not on the main thread: resizes are picked up on the next start
+                pass
+
+        # Set up the scroll region, clear the screen, home the cursor and draw
+        # the fixed bottom in one write
+        safe_write(
+            self._scroll_region_sequence()
+            + "\033[2J\033[1;1H"
+            + self._fixed_bottom_sequence(),
+            flush=True,
+        )
 
         # Start status bar animation (positioned in fixed bottom area)
         self._status_bar = StatusBar(
@@ -135,24 +193,25 @@ class FixedInputLayout:
             print(text)
             return
 
-        with self._lock:
+        # The shared stdout lock keeps save/print/restore atomic with respect
+        # to every other writer, including the status bar render threads
+        with _stdout_lock:
             # Save cursor, move to scroll region, print, restore
-            safe_write("\0337")
+            safe_write("\0337", flush=False)
             # Text will print in scroll region and scroll naturally
             print(text)
-            safe_write("\0338")
-            safe_write("", flush=True)
+            safe_write("\0338", flush=True)
 
     def update_status(self, message: str):
         """Update the status bar message."""
-        with self._lock:
-            self.status_message = message
-            if self._status_bar:
-                self._status_bar.update_message(message)
+        # StatusBar.update_message is thread-safe on its own
+        self.status_message = message
+        if self._status_bar:
+            self._status_bar.update_message(message)
 
     def update_info(self, info: str):
         """Update the info line."""
-        with self._lock:
+        with _stdout_lock:
             self.info_line = info
             self._draw_fixed_bottom()
 
@@ -160,12 +219,25 @@ class FixedInputLayout:
         """Restore normal terminal mode."""
         self._active = False
 
+        # Restore original signal handler
+        if self._sigwinch_installed:
+            self._sigwinch_installed = False
+            previous = self._original_sigwinch_handler
+            self._original_sigwinch_handler = None
+            try:
+                # Leave it alone if someone else has taken over SIGWINCH since
+                if signal.getsignal(signal.SIGWINCH) == self._handle_resize:
+                    # None: the previous handler was not installed from Python
+                    signal.signal(
+                        signal.SIGWINCH,
+                        previous if previous is not None else signal.SIG_DFL,
+                    )
+            except ValueError:
+                pass
+
         if self._status_bar:
             self._status_bar.stop(clear=False)
             self._status_bar = None
 
-        # Reset scroll region to full screen
-        safe_write("\033[r")
-        # Move cursor to bottom
-        safe_write(f"\033[{self._terminal_height};1H")
-        safe_write("", flush=True)
+        # Reset scroll region to full screen and move cursor to bottom
+        safe_write(f"\033[r\033[{self._terminal_height};1H", flush=True)
@@ -5,14 +5,98 @@ This component provides a visually appealing terminal UI for displaying
 plan task progress with animated spinners and real-time updates.
 """
 
+import re
+import shutil
+import signal
 import sys
 import threading
 import time
 import unicodedata
-from typing import Any, Dict, Optional, List
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, Tuple
 
 from dolphin.cli.ui.theme import Theme
-from dolphin.cli.ui.state import _stdout_lock, set_active_plan_card, safe_write
+from dolphin.cli.ui.state import _stdout_lock, _ui_ticker, set_active_plan_card, safe_write
+
+
+# ANSI CSI sequences (colors, cursor movement) take no terminal cells
+_ANSI_CSI_RE = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+# East Asian width classes rendered as two cells (ambiguous included)
+_WIDE_EAW = frozenset(("W", "F", "A"))
+
+
+@dataclass(frozen=True, eq=False)
+class _PlanState:
+    """Immutable snapshot of the data a LivePlanCard renders.
+
+    Compared by identity: every update() creates a new snapshot, which is
+    what invalidates the cached card body.
+    """
+
+    tasks: Tuple[Dict[str, Any], ...] = ()
+    current_task_id: Optional[int] = None
+    current_action: Optional[str] = None
+    current_task_content: Optional[str] = None
+
+
+# Placeholder for the spinner glyph in cached card lines; like every spinner
+# frame it measures as one cell
+_SPINNER_SLOT = "\0"
+
+
+@lru_cache(maxsize=4096)
+def _visual_width(text: str) -> int:
+    """Visual width of text in terminal cells, ignoring ANSI codes.
+
+    Cached because every animation frame re-measures the same task lines.
+    """
+    if text.isascii() and "\x1b" not in text:
+        # Plain ASCII: nothing to strip and every character is one cell
+        return len(text)
+    clean_text = _ANSI_CSI_RE.sub("", text)
+    if clean_text.isascii():
+        # No ASCII character is wide, so the width is the length
+        return len(clean_text)
+
+    eaw = unicodedata.east_asian_width
+    width = 0
+    for char in clean_text:
+        width += 2 if eaw(char) in _WIDE_EAW else 1
+    return width
+
+
+def _truncate_to_width(text: str, budget: int, ellipsis: str = "...") -> Tuple[str, int]:
+    """Fit text into budget cells, ending in ellipsis when it has to be cut.
+
+    Returns the text and its visual width. The text is walked once, stopping
+    as soon as the budget is used up, so long content is never measured in
+    full twice.
+    """
+    width = _visual_width(text)
+    if width <= budget:
+        return text, width
+
+    room = max(0, budget - len(ellipsis))
+    if text.isascii() and "\x1b" not in text:
+        return text[:room] + ellipsis, room + len(ellipsis)
+
+    eaw = unicodedata.east_asian_width
+    used = 0
+    i = 0
+    while i < len(text):
+        if text[i] == "\x1b":
+            match = _ANSI_CSI_RE.match(text, i)
+            if match:
+                # Escape sequences take no cells
+                i = match.end()
+                continue
+        cell = 2 if eaw(text[i]) in _WIDE_EAW else 1
+        if used + cell > room:
+            break
+        used += cell
+        i += 1
+    return text[:i] + ellipsis, used + len(ellipsis)
 
 
 class LivePlanCard:
@@ -34,57 +118,181 @@ class LivePlanCard:
 
     SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
 
+    # Fixed mode only repaints changed rows; every Nth frame repaints them all
+    # in case other output (e.g. a layout reset) wiped the reserved area.
+    FULL_REDRAW_FRAMES = 8
+
+    # Seconds between frames while a spinner is shown; without one only the
+    # timer changes, so the card redraws less often
+    FRAME_INTERVAL = 0.12
+    IDLE_FRAME_INTERVAL = 0.25
+
     def __init__(self, fixed_row_start: Optional[int] = None):
         self.running = False
         self.paused = False
         self.fixed_row_start = fixed_row_start
-        self.thread: Optional[threading.Thread] = None
         self.frame_index = 0
-        self.tasks: List[Dict[str, Any]] = []
-        self.current_task_id: Optional[int] = None
-        self.current_action: Optional[str] = None
-        self.current_task_content: Optional[str] = None
+        # Replaced wholesale by start()/update(); readers take one reference
+        self._state = _PlanState()
+        self._state_lock = threading.Lock()
         self.start_time: float = 0
         self._lines_printed = 0
-        self._lock = threading.RLock()
+        # Guards rendering against pause()/resume()/stop(); never re-entered
+        # (taken before _stdout_lock, and nothing under it calls back here)
+        self._lock = threading.Lock()
+        # Cached card body (see _build_card_lines) and the state it was built from
+        self._body: List[Any] = []
+        self._body_key: Optional[tuple] = None
+        self._body_all_done = False
+        self._body_spinning = False
+        # Cached bottom border and the (width, elapsed, all_done) it shows
+        self._footer = ""
+        self._footer_key: Optional[tuple] = None
+        # Rows last drawn in fixed mode, used to skip unchanged rows
+        self._last_lines: List[str] = []
+        # Terminal width cached between SIGWINCH signals (only while the
+        # resize handler is installed; otherwise queried every frame)
+        self._term_width: Optional[int] = None
+        self._resize_tracking = False
+        self._previous_sigwinch_handler = None
+
+    @property
+    def tasks(self) -> Tuple[Dict[str, Any], ...]:
+        return self._state.tasks
+
+    @property
+    def current_task_id(self) -> Optional[int]:
+        return self._state.current_task_id
+
+    @property
+    def current_action(self) -> Optional[str]:
+        return self._state.current_action
+
+    @property
+    def current_task_content(self) -> Optional[str]:
+        return self._state.current_task_content
 
     def _get_visual_width(self, text: str) -> int:
         """Calculate visual width handling CJK and ANSI codes."""
-        clean_text = ""
-        skip = False
-        for char in text:
-            if char == "\033":
-                skip = True
-            if not skip:
-                clean_text += char
-            if skip and char == "m":
-                skip = False
-
-        width = 0
-        for char in clean_text:
-            if unicodedata.east_asian_width(char) in ("W", "F", "A"):
-                width += 2
-            else:
-                width += 1
-        return width
+        return _visual_width(text)
 
     def _get_terminal_width(self) -> int:
+        width = self._term_width
+        if width is None:
+            try:
+                width = shutil.get_terminal_size().columns
+            except Exception:
+                width = 80
+            if self._resize_tracking:
+                self._term_width = width
+        return width
+
+    def _install_resize_handler(self) -> None:
+        """Invalidate the cached terminal width on SIGWINCH.
+
+        The previous handler (e.g. LayoutManager's) is chained, not replaced.
+        """
+        self._term_width = None
+        self._last_lines = []
+        if not hasattr(signal, "SIGWINCH"):
+            return
+        try:
+            previous = signal.getsignal(signal.SIGWINCH)
+            signal.signal(signal.SIGWINCH, self._handle_resize)
+        except ValueError:
+            # Not on the main thread: keep querying the width every frame
+            return
+        self._previous_sigwinch_handler = previous
+        self._resize_tracking = True
+
+    def _restore_resize_handler(self) -> None:
+        """Reinstate the handler that was active before _install_resize_handler."""
+        if not self._resize_tracking:
+            return
+        self._resize_tracking = False
+        self._term_width = None
         try:
-            import shutil
-            return shutil.get_terminal_size().columns
-        except Exception:
-            return 80
+            # Leave it alone if someone else has taken over SIGWINCH since
+            if signal.getsignal(signal.SIGWINCH) == self._handle_resize:
+                previous = self._previous_sigwinch_handler
+                # getsignal() is None for handlers not installed from Python
+                signal.signal(
+                    signal.SIGWINCH, previous if previous is not None else signal.SIG_DFL
+                )
+        except ValueError:
+            pass
+        self._previous_sigwinch_handler = None
+
+    def _handle_resize(self, signum, frame):
+        """SIGWINCH handler: drop the cached width and row state, then chain."""
+        self._term_width = None
+        self._last_lines = []
+        previous = self._previous_sigwinch_handler
+        if callable(previous):
+            previous(signum, frame)
 
     def _build_card_lines(self) -> List[str]:
-        """Build all lines of the plan card for rendering."""
-        lines = []
+        """Build all lines of the plan card for rendering.
 
+        Only the spinner glyph and the timer change between animation frames,
+        so the rest of the card is cached until update() swaps in a new
+        snapshot or the width changes.
+        """
         width = min(80, self._get_terminal_width() - 8)
         if width < 40:
             width = 40
 
-        total = len(self.tasks)
-        completed = sum(1 for t in self.tasks if t.get("status") in ("completed", "done", "success"))
+        # One snapshot per frame; update() may swap in a new one meanwhile
+        state = self._state
+        key = (width, state)
+        if key != self._body_key:
+            self._body = self._build_card_body(width, state)
+            self._body_key = key
+
+        # Task list with animated spinner
+        current_frame = self.SPINNER_FRAMES[self.frame_index % len(self.SPINNER_FRAMES)]
+        lines = [part if isinstance(part, str) else current_frame.join(part) for part in self._body]
+
+        # Bottom border with timer and dynamic status; it only changes once a
+        # second, so it is reused across the frames in between
+        elapsed = int(time.time() - self.start_time)
+        footer_key = (width, elapsed, self._body_all_done)
+        if footer_key != self._footer_key:
+            self._footer = self._build_card_footer(width, elapsed)
+            self._footer_key = footer_key
+        lines.append(self._footer)
+
+        return lines
+
+    def _build_card_footer(self, width: int, elapsed: int) -> str:
+        """Build the bottom border showing the elapsed time and status."""
+        if self._body_all_done:
+            status_text = "completed"
+            status_color = Theme.SUCCESS
+        else:
+            status_text = "running"
+            status_color = Theme.MUTED
+
+        timer_text = f" {elapsed}s • {status_text} "
+        # Build timer text with color
+        colored_timer = f"{Theme.MUTED}{elapsed}s • {status_color}{status_text}{Theme.MUTED} {Theme.RESET}"
+        v_timer_w = self._get_visual_width(timer_text)  # Use plain text for width calculation
+        left_len = (width - v_timer_w) // 2
+        right_len = width - v_timer_w - left_len
+        return f"{self.PLAN_PRIMARY}{Theme.BOX_BOTTOM_LEFT}{Theme.BOX_HORIZONTAL * left_len}{Theme.RESET}{colored_timer}{self.PLAN_PRIMARY}{Theme.BOX_HORIZONTAL * right_len}{Theme.BOX_BOTTOM_RIGHT}{Theme.RESET}"
+
+    def _build_card_body(self, width: int, state: _PlanState) -> List[Any]:
+        """Build the card lines above the bottom border.
+
+        Lines showing the spinner are returned as (head, tail) pairs to be
+        joined with the current frame; all other lines are plain strings.
+        """
+        lines: List[Any] = []
+        spinning = False
+
+        total = len(state.tasks)
+        completed = sum(1 for t in state.tasks if t.get("status") in ("completed", "done", "success"))
+        self._body_all_done = completed == total and total > 0
 
         # Header
         title = "Plan Update"
@@ -98,28 +306,23 @@ class LivePlanCard:
         lines.append(f"{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}{Theme.BOLD}{header_text}{Theme.RESET}{' ' * max(0, header_padding)}{self.PLAN_ACCENT}{progress}{Theme.RESET}  {self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}")
         lines.append(f"{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.BOX_HORIZONTAL * width}{Theme.BOX_VERTICAL}{Theme.RESET}")
 
-        # Task list with animated spinner
-        current_frame = self.SPINNER_FRAMES[self.frame_index % len(self.SPINNER_FRAMES)]
-
-        for i, task in enumerate(self.tasks):
+        for i, task in enumerate(state.tasks):
             content = task.get("content", task.get("name", f"Task {i+1}"))
             status = task.get("status", "pending").lower()
 
             # Truncate content
-            max_v_content = width - 10
-            v_content = self._get_visual_width(content)
-            if v_content > max_v_content:
-                content = content[:int(max_v_content / 1.5)] + "..."
+            content, _ = _truncate_to_width(content, width - 10)
 
-            # Determine icon and color
-            is_current = (self.current_task_id is not None and i + 1 == self.current_task_id)
+            # Determine icon and color; _SPINNER_SLOT marks where the
+            # animated frame goes (it measures one cell, like every frame)
+            is_current = (state.current_task_id is not None and i + 1 == state.current_task_id)
 
             if is_current and status in ("pending", "running", "in_progress"):
-                icon, color = current_frame, self.PLAN_PRIMARY
+                icon, color = _SPINNER_SLOT, self.PLAN_PRIMARY
             elif status in ("completed", "done", "success"):
                 icon, color = "●", Theme.SUCCESS
             elif status in ("running", "in_progress"):
-                icon, color = current_frame, self.PLAN_PRIMARY
+                icon, color = _SPINNER_SLOT, self.PLAN_PRIMARY
             else:
                 icon, color = "○", Theme.MUTED
 
@@ -134,90 +337,97 @@ class LivePlanCard:
             v_indicator_w = self._get_visual_width(indicator)
             padding = width - v_line_w - v_indicator_w - 1
 
-            lines.append(f"{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}{task_line}{indicator}{' ' * max(0, padding)}{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}")
+            line = f"{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}{task_line}{indicator}{' ' * max(0, padding)}{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}"
+            if icon is _SPINNER_SLOT:
+                # The slot precedes the task content, so the first match is it
+                lines.append(tuple(line.split(_SPINNER_SLOT, 1)))
+                spinning = True
+            else:
+                lines.append(line)
 
-        # Footer with action and elapsed time
-        if self.current_action and self.current_task_id:
+        # Footer with action
+        if state.current_action and state.current_task_id:
             action_icons = {"create": "📝", "start": "▶", "done": "✓", "pause": "⏸", "skip": "⏭"}
-            action_icon = action_icons.get(self.current_action, "•")
+            action_icon = action_icons.get(state.current_action, "•")
 
             lines.append(f"{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.BOX_HORIZONTAL * width}{Theme.BOX_VERTICAL}{Theme.RESET}")
 
-            if self.current_task_content:
-                action_text = f"  {action_icon} Task {self.current_task_id}: {self.current_task_content}"
+            if state.current_task_content:
+                action_text = f"  {action_icon} Task {state.current_task_id}: {state.current_task_content}"
             else:
-                action_text = f"  {action_icon} Task {self.current_task_id}"
+                action_text = f"  {action_icon} Task {state.current_task_id}"
 
-            v_action_w = self._get_visual_width(action_text)
-            if v_action_w > width - 4:
-                action_text = action_text[:int((width - 6) / 1.5)] + "..."
-                v_action_w = self._get_visual_width(action_text)
+            action_text, v_action_w = _truncate_to_width(action_text, width - 4)
 
             padding = width - v_action_w - 1
             lines.append(f"{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}{self.PLAN_ACCENT}{action_text}{Theme.RESET}{' ' * max(0, padding)}{self.PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}")
 
-        # Bottom border with timer and dynamic status
-        elapsed = int(time.time() - self.start_time)
-
-        # Determine status based on task completion
-        total = len(self.tasks)
-        completed = sum(1 for t in self.tasks if t.get("status") in ("completed", "done", "success"))
+        self._body_spinning = spinning
+        return lines
 
-        if completed == total and total > 0:
-            status_text = "completed"
-            status_color = Theme.SUCCESS
-        else:
-            status_text = "running"
-            status_color = Theme.MUTED
+    def _fixed_rows_sequence(self, lines: List[str], previous: List[str]) -> str:
+        """Build the escape sequence redrawing the rows that differ from previous.
 
-        timer_text = f" {elapsed}s • {status_text} "
-        # Build timer text with color
-        colored_timer = f"{Theme.MUTED}{elapsed}s • {status_color}{status_text}{Theme.MUTED} {Theme.RESET}"
-        v_timer_w = self._get_visual_width(timer_text)  # Use plain text for width calculation
-        left_len = (width - v_timer_w) // 2
-        right_len = width - v_timer_w - left_len
-        lines.append(f"{self.PLAN_PRIMARY}{Theme.BOX_BOTTOM_LEFT}{Theme.BOX_HORIZONTAL * left_len}{Theme.RESET}{colored_timer}{self.PLAN_PRIMARY}{Theme.BOX_HORIZONTAL * right_len}{Theme.BOX_BOTTOM_RIGHT}{Theme.RESET}")
+        Rows left over from a taller previous frame are cleared. Returns an
+        empty string when nothing changed.
+        """
+        row = self.fixed_row_start
+        output_parts = []
+        for i, line in enumerate(lines):
+            if i < len(previous) and previous[i] == line:
+                continue
+            # Move to exact row, column 1
+            output_parts.append(f"\033[{row + i};1H\033[K{line}")
+        for i in range(len(lines), len(previous)):
+            output_parts.append(f"\033[{row + i};1H\033[K")
+        if not output_parts:
+            return ""
+        # Save / restore the cursor around the update
+        return "\0337" + "".join(output_parts) + "\0338"
+
+    def _clear_inline_sequence(self) -> str:
+        """Build the escape sequence blanking the inline card and returning above it."""
+        count = self._lines_printed
+        return f"\033[{count}A" + "\033[K\n" * count + f"\033[{count}A"
+
+    def tick(self) -> float:
+        """Draw one animation frame; returns the seconds until the next one.
+
+        Called from the shared UI ticker thread while the card is running.
+        """
+        with self._lock:
+            if self.running and not self.paused:
+                lines = self._build_card_lines()
 
-        return lines
+                with _stdout_lock:
+                    # Stop can be called while we're waiting on _stdout_lock. Re-check here to
+                    # avoid rendering a "late" frame after stop() has requested shutdown.
+                    if not self.running:
+                        return 0.0
+                    # Each frame goes out as a single write + flush
+                    if self.fixed_row_start:
+                        # ABSOLUTE POSITIONING: Gamma-tier stability
+                        if self.frame_index % self.FULL_REDRAW_FRAMES == 0:
+                            self._last_lines = []
+                        output = self._fixed_rows_sequence(lines, self._last_lines)
+                        self._last_lines = lines
+                        if output:
+                            safe_write(output, flush=True)
+                    else:
+                        # Fallback to relative (fragile, used if no LayoutManager)
+                        output_parts = []
+                        if self._lines_printed > 0:
+                            max_lines = max(self._lines_printed, len(lines))
+                            output_parts.append(f"\033[{self._lines_printed}A")
+                            output_parts.append("\033[K\n" * max_lines)
+                            output_parts.append(f"\033[{max_lines}A")
+                        output_parts.append("\n".join(lines) + "\n")
+                        safe_write("".join(output_parts), flush=True)
 
-    def _animate(self):
-        """Background thread animation loop."""
-        while self.running:
-            with self._lock:
-                if not self.paused:
-                    lines = self._build_card_lines()
+                self._lines_printed = len(lines)
 
-                    with _stdout_lock:
-                        # Stop can be called while we're waiting on _stdout_lock. Re-check here to
-                        # avoid rendering a "late" frame after stop() has requested shutdown.
-                        if not self.running:
-                            break
-                        if self.fixed_row_start:
-                            # ABSOLUTE POSITIONING: Gamma-tier stability
-                            output_parts = ["\0337"]  # Save cursor
-                            for i, line in enumerate(lines):
-                                # Move to exact row, column 1
-                                output_parts.append(f"\033[{self.fixed_row_start + i};1H\033[K{line}")
-                            output_parts.append("\0338")  # Restore cursor
-                            safe_write("".join(output_parts))
-                        else:
-                            # Fallback to relative (fragile, used if no LayoutManager)
-                            if self._lines_printed > 0:
-                                safe_write(f"\033[{self._lines_printed}A")
-                                max_lines = max(self._lines_printed, len(lines))
-                                for _ in range(max_lines):
-                                    safe_write("\033[K\n")
-                                safe_write(f"\033[{max_lines}A")
-
-                            output = "".join(f"{line}\n" for line in lines)
-                            safe_write(output)
-
-                        safe_write("", flush=True)
-
-                    self._lines_printed = len(lines)
-
-            self.frame_index += 1
-            time.sleep(0.12)
+        self.frame_index += 1
+        return self.FRAME_INTERVAL if self._body_spinning else self.IDLE_FRAME_INTERVAL
 
     def start(
         self,
@@ -231,10 +441,9 @@ class LivePlanCard:
         if self.running:
             self.stop()
 
-        self.tasks = tasks
-        self.current_task_id = current_task_id
-        self.current_action = current_action
-        self.current_task_content = current_task_content
+        self._state = _PlanState(
+            tuple(tasks), current_task_id, current_action, current_task_content
+        )
         self.fixed_row_start = fixed_row_start
         if self.fixed_row_start is not None and self.fixed_row_start < 1:
             self.fixed_row_start = 1
@@ -242,30 +451,22 @@ class LivePlanCard:
         self.frame_index = 0
         self._lines_printed = 0
         self.paused = False
+        self._install_resize_handler()
 
         set_active_plan_card(self)
 
         with _stdout_lock:
-            if self.fixed_row_start is None:
-                safe_write("\n")
-
             lines = self._build_card_lines()
 
             if self.fixed_row_start is not None:
-                output_parts = ["\0337"]
-                for i, line in enumerate(lines):
-                    output_parts.append(f"\033[{self.fixed_row_start + i};1H\033[K{line}")
-                output_parts.append("\0338")
-                safe_write("".join(output_parts))
+                safe_write(self._fixed_rows_sequence(lines, []))
+                self._last_lines = lines
             else:
-                for line in lines:
-                    safe_write(f"{line}\n")
-            safe_write("", flush=True)
+                safe_write("\n" + "\n".join(lines) + "\n")
 
         self._lines_printed = len(lines)
         self.running = True
-        self.thread = threading.Thread(target=self._animate, daemon=True)
-        self.thread.start()
+        _ui_ticker.register(self)
 
     def pause(self) -> None:
         """Pause the animation.
@@ -280,11 +481,7 @@ class LivePlanCard:
                     # Only clear if we are inline and potentially in the way
                     with _stdout_lock:
                         if self._lines_printed > 0:
-                            safe_write(f"\033[{self._lines_printed}A")
-                            for _ in range(self._lines_printed):
-                                safe_write("\033[K\n")
-                            safe_write(f"\033[{self._lines_printed}A")
-                        safe_write("", flush=True)
+                            safe_write(self._clear_inline_sequence())
                         self._lines_printed = 0
 
     def resume(self) -> None:
@@ -298,9 +495,7 @@ class LivePlanCard:
                 # Re-print card if inline
                 with _stdout_lock:
                     lines = self._build_card_lines()
-                    for line in lines:
-                        safe_write(f"{line}\n")
-                    safe_write("", flush=True)
+                    safe_write("\n".join(lines) + "\n")
                 self._lines_printed = len(lines)
 
     def update(
@@ -310,24 +505,36 @@ class LivePlanCard:
         current_action: Optional[str] = None,
         current_task_content: Optional[str] = None
     ):
-        """Update the card data (thread-safe)."""
-        with self._lock:
-            if tasks is not None:
-                self.tasks = tasks
-            if current_task_id is not None:
-                self.current_task_id = current_task_id
-            if current_action is not None:
-                self.current_action = current_action
-            if current_task_content is not None:
-                self.current_task_content = current_task_content
+        """Update the card data (thread-safe).
+
+        Swaps in a new snapshot rather than taking the animation lock, so
+        updates never wait for a frame to be rendered, then asks the UI
+        ticker to draw it immediately.
+        """
+        changes: Dict[str, Any] = {}
+        if tasks is not None:
+            changes["tasks"] = tuple(tasks)
+        if current_task_id is not None:
+            changes["current_task_id"] = current_task_id
+        if current_action is not None:
+            changes["current_action"] = current_action
+        if current_task_content is not None:
+            changes["current_task_content"] = current_task_content
+        if changes:
+            # Serializes concurrent updaters only; the ticker thread just
+            # reads self._state
+            with self._state_lock:
+                self._state = replace(self._state, **changes)
+            _ui_ticker.wake(self)
 
     def stop(self):
         """Stop the animation and clear the card."""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=0.5)
+        # A frame already being drawn finishes before the lock below is free
+        _ui_ticker.unregister(self)
 
         set_active_plan_card(None)
+        self._restore_resize_handler()
 
         with self._lock:
             with _stdout_lock:
@@ -335,15 +542,13 @@ class LivePlanCard:
                 if self.fixed_row_start is not None:
                     # Fixed row mode: move to fixed row and clear
                     start_row = max(1, self.fixed_row_start)
-                    for row in range(start_row, start_row + self._lines_printed):
-                        safe_write(f"\033[{row};1H\033[K")  # Move to row and clear
-                    safe_write("", flush=True)
+                    rows = range(start_row, start_row + self._lines_printed)
+                    if rows:
+                        # Move to each row and clear
+                        safe_write("".join(f"\033[{row};1H\033[K" for row in rows))
                 elif self._lines_printed > 0:
                     # Relative mode: existing logic
-                    safe_write(f"\033[{self._lines_printed}A")
-                    for _ in range(self._lines_printed):
-                        safe_write("\033[K\n")
-                    safe_write(f"\033[{self._lines_printed}A")
-                    safe_write("", flush=True)
+                    safe_write(self._clear_inline_sequence())
 
                 self._lines_printed = 0
+                self._last_lines = []
@@ -4,6 +4,7 @@ Spinner Component for Dolphin CLI
 Provides animated spinner for indicating long-running operations.
 """
 
+import itertools
 import sys
 import threading
 import time
@@ -31,13 +32,12 @@ class Spinner:
         self.message = message
         self.running = False
         self.thread: Optional[threading.Thread] = None
-        self.frame_index = 0
         self.position_updates = position_updates or []
 
     def _animate(self):
-        frames = Theme.BOX_SPINNER_FRAMES
+        frames = itertools.cycle(Theme.BOX_SPINNER_FRAMES)
         while self.running:
-            frame = frames[self.frame_index % len(frames)]
+            frame = next(frames)
 
             # Use global lock to prevent conflicts with main thread output
             with _stdout_lock:
@@ -66,15 +66,12 @@ class Spinner:
 
                 # Single atomic write
                 safe_write("".join(output_parts))
-                safe_write("", flush=True)
 
-            self.frame_index += 1
             time.sleep(0.08)
 
         # Clear the bottom line when done (also protected by lock)
         with _stdout_lock:
             safe_write("\r" + " " * (len(self.message) + 10) + "\r")
-            safe_write("", flush=True)
 
     def start(self):
         self.running = True
@@ -93,12 +90,12 @@ class Spinner:
             completion_icon = "●" if success else "✗"
             completion_color = Theme.SUCCESS if success else Theme.ERROR
 
-            safe_write("\0337")  # Save cursor
+            output_parts = ["\0337"]  # Save cursor
             for pos in self.position_updates:
                 lines_up = pos.get('up', 0)
                 column = pos.get('col', 0)
                 if lines_up > 0:
-                    safe_write(f"\033[{lines_up}A\033[{column}G")
-                    safe_write(f"{completion_color}{completion_icon}{Theme.RESET}")
-            safe_write("\0338")  # Restore cursor
-            safe_write("", flush=True)
+                    output_parts.append(f"\033[{lines_up}A\033[{column}G")
+                    output_parts.append(f"{completion_color}{completion_icon}{Theme.RESET}")
+            output_parts.append("\0338")  # Restore cursor
+            safe_write("".join(output_parts))
@@ -4,14 +4,16 @@ StatusBar Component for Dolphin CLI
 Provides an animated status bar with spinner, message, and elapsed time.
 """
 
+import itertools
 import os
 import sys
 import threading
 import time
-from typing import Optional
+from datetime import datetime
+from typing import BinaryIO, Optional
 
 from dolphin.cli.ui.theme import Theme
-from dolphin.cli.ui.state import _stdout_lock, safe_write, safe_print
+from dolphin.cli.ui.state import _stdout_lock, _ui_ticker, safe_write, safe_print
 
 
 class StatusBar:
@@ -29,6 +31,8 @@ class StatusBar:
 
     # Spinner frames
     SPINNER_FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    # Seconds between animation frames
+    FRAME_INTERVAL = 0.1
 
     # Status bar colors
     STATUS_COLOR = "\033[38;5;214m"  # Orange/gold
@@ -38,18 +42,27 @@ class StatusBar:
     # Debug logging
     _DEBUG_LOG_FILE = "/tmp/statusbar_debug.log"
     _DEBUG_ENABLED = os.getenv("DOLPHIN_DEBUG_UI", "").lower() in ("1", "true", "yes")
+    # Opened on first use and kept open; unbuffered append, one write per message
+    _debug_file: Optional[BinaryIO] = None
 
     @classmethod
-    def _debug_log(cls, msg: str) -> None:
-        """Write debug message to log file."""
-        if cls._DEBUG_ENABLED:
-            try:
-                with open(cls._DEBUG_LOG_FILE, "a") as f:
-                    import datetime
-                    ts = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                    f.write(f"[{ts}] {msg}\n")
-            except Exception:
-                pass
+    def _debug_log(cls, msg: str, *args) -> None:
+        """Write debug message to log file.
+
+        Like logging, ``msg % args`` is only formatted when debug logging is
+        enabled, so disabled call sites cost no string formatting or repr().
+        """
+        if not cls._DEBUG_ENABLED:
+            return
+        try:
+            if args:
+                msg = msg % args
+            if cls._debug_file is None:
+                cls._debug_file = open(cls._DEBUG_LOG_FILE, "ab", buffering=0)
+            ts = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            cls._debug_file.write(f"[{ts}] {msg}\n".encode("utf-8", "replace"))
+        except Exception:
+            pass
 
     def __init__(self, message: str = "Processing", hint: str = "esc to cancel", fixed_row: Optional[int] = None):
         """Initialize the status bar.
@@ -65,13 +78,13 @@ class StatusBar:
         self.fixed_row = fixed_row  # Fixed screen row (1-indexed), or None for inline
         self.running = False
         self.paused = False  # When True, animation continues but no output
-        self.thread: Optional[threading.Thread] = None
-        self.frame_index = 0
+        self._tick_count = 0
+        self._frames = itertools.cycle(self.SPINNER_FRAMES)
         self.start_time = 0.0
         self._lock = threading.Lock()
 
         # Log initialization
-        self._debug_log(f"StatusBar.__init__: message={message!r}, hint={hint!r}, fixed_row={fixed_row}")
+        self._debug_log("StatusBar.__init__: message=%r, hint=%r, fixed_row=%s", message, hint, fixed_row)
 
     def _format_elapsed(self, seconds: int) -> str:
         """Format seconds as Xm Ys or Xs."""
@@ -83,7 +96,7 @@ class StatusBar:
 
     def _build_line(self) -> str:
         """Build the status bar line."""
-        frame = self.SPINNER_FRAMES[self.frame_index % len(self.SPINNER_FRAMES)]
+        frame = next(self._frames)
         elapsed = int(time.time() - self.start_time)
         elapsed_str = self._format_elapsed(elapsed)
 
@@ -95,69 +108,53 @@ class StatusBar:
         )
         return line
 
-    def _animate(self):
-        """Background thread animation loop.
+    def tick(self) -> float:
+        """Draw one animation frame; returns the seconds until the next one.
 
-        Uses both the instance lock (self._lock) and global stdout lock (_stdout_lock)
-        to coordinate with other threads.
+        Called from the shared UI ticker thread. Uses both the instance lock
+        (self._lock) and global stdout lock (_stdout_lock) to coordinate with
+        other threads.
         """
-        self._debug_log(f"_animate: THREAD STARTED, fixed_row={self.fixed_row}")
-        loop_count = 0
-        while self.running:
-            loop_count += 1
-            with self._lock:
-                # Only write output if not paused
-                if not self.paused:
-                    line = self._build_line()
-
-                    # Ensure line doesn't exceed terminal width to prevent wrapping
-                    try:
-                        import shutil
-                        width = shutil.get_terminal_size().columns
-                        # Simplified truncation for extremely long strings
-                        if len(line) > width * 3:
-                             pass
-                    except:
-                        pass
-
-                    # Use global stdout lock to prevent conflicts with other output
-                    with _stdout_lock:
-                        if self.fixed_row is not None:
-                            # Fixed position mode: save, move, clear+draw, restore
-                            # Combine into SINGLE write to minimize threading conflict
-                            output = (
-                                f"\0337"                     # Save cursor
-                                f"\033[{self.fixed_row};1H"  # Move to fixed row
-                                f"\033[K"                    # Clear line
-                                f"{line}"                    # Draw content
-                                f"\0338"                     # Restore cursor
-                            )
-                            safe_write(output)
-                            if loop_count <= 3:  # Log first few loops
-                                self._debug_log(f"_animate: loop={loop_count}, mode=FIXED, row={self.fixed_row}, output_repr={output!r}")
-                        else:
-                            # Inline mode
-                            safe_write(f"\r\033[K{line}")
-                            if loop_count <= 3:  # Log first few loops
-                                self._debug_log(f"_animate: loop={loop_count}, mode=INLINE, line_len={len(line)}")
-
-                        safe_write("", flush=True)
-
-            self.frame_index += 1
-            time.sleep(0.1)
-
-        self._debug_log(f"_animate: THREAD STOPPED after {loop_count} loops")
+        self._tick_count += 1
+        loop_count = self._tick_count
+        with self._lock:
+            # Only write output if not paused
+            if self.running and not self.paused:
+                line = self._build_line()
+
+                # Use global stdout lock to prevent conflicts with other output
+                with _stdout_lock:
+                    if self.fixed_row is not None:
+                        # Fixed position mode: save, move, clear+draw, restore
+                        # Combine into SINGLE write to minimize threading conflict
+                        output = (
+                            f"\0337"                     # Save cursor
+                            f"\033[{self.fixed_row};1H"  # Move to fixed row
+                            f"\033[K"                    # Clear line
+                            f"{line}"                    # Draw content
+                            f"\0338"                     # Restore cursor
+                        )
+                        safe_write(output)
+                        if loop_count <= 3:  # Log first few loops
+                            self._debug_log("tick: loop=%s, mode=FIXED, row=%s, output_repr=%r", loop_count, self.fixed_row, output)
+                    else:
+                        # Inline mode
+                        safe_write(f"\r\033[K{line}")
+                        if loop_count <= 3:  # Log first few loops
+                            self._debug_log("tick: loop=%s, mode=INLINE, line_len=%s", loop_count, len(line))
+
+        return self.FRAME_INTERVAL
 
     def start(self):
         """Start the status bar animation."""
-        self._debug_log(f"start: called, fixed_row={self.fixed_row}")
+        self._debug_log("start: called, fixed_row=%s", self.fixed_row)
         self.start_time = time.time()
-        self.frame_index = 0
+        self._frames = itertools.cycle(self.SPINNER_FRAMES)
+        self._tick_count = 0
         self.running = True
         self.paused = False
-        self.thread = threading.Thread(target=self._animate, daemon=True)
-        self.thread.start()
-        self._debug_log(f"start: thread started")
+        _ui_ticker.register(self)
+        self._debug_log("start: registered with UI ticker")
 
     def pause(self):
         """Pause the status bar output (thread-safe).
@@ -183,7 +180,6 @@ class StatusBar:
                         # Inline mode: clear current line and move to next line
                         # This ensures subsequent output doesn't mix with status bar
                         safe_write("\r\033[K\n")
-                    safe_write("", flush=True)
 
     def resume(self):
         """Resume the status bar output (thread-safe).
@@ -207,7 +203,6 @@ class StatusBar:
                 else:
                     # Inline mode: redraw on current line
                     safe_write(f"\r\033[K{line}")
-                safe_write("", flush=True)
 
     def update_message(self, message: str):
         """Update the status message (thread-safe)."""
@@ -217,15 +212,16 @@ class StatusBar:
     def stop(self, clear: bool = True):
         """Stop the status bar animation."""
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=0.5)
+        _ui_ticker.unregister(self)
+        self._debug_log("stop: unregistered after %s ticks", self._tick_count)
 
-        if clear:
-            with _stdout_lock:
-                # Handle fixed row mode (absolute positioning)
-                if self.fixed_row is not None:
-                    safe_write(f"\033[{self.fixed_row};0H\033[K")
-                else:
-                    # Inline mode: clear current line
-                    safe_write("\r\033[K")
-                safe_write("", flush=True)
+        # Taking the lock waits out a frame that was already being drawn
+        with self._lock:
+            if clear:
+                with _stdout_lock:
+                    # Handle fixed row mode (absolute positioning)
+                    if self.fixed_row is not None:
+                        safe_write(f"\033[{self.fixed_row};0H\033[K")
+                    else:
+                        # Inline mode: clear current line
+                        safe_write("\r\033[K")
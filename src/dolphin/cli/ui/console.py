@@ -16,13 +16,18 @@ Features:
 
 import ast
 import json
+import os
+import re
+import shutil
 import sys
 import threading
 import time
 import unicodedata
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Optional, List
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Optional, List, Tuple
 
 
 # Import migrated components
@@ -36,8 +41,157 @@ from dolphin.cli.ui.state import (
     safe_write,
 )
 from dolphin.cli.ui.components import Spinner, StatusBar, LivePlanCard, FixedInputLayout
+from dolphin.cli.ui.components.plan_card import _truncate_to_width, _visual_width
+
+
+# SGR color/style sequences removed by ConsoleUI._strip_ansi
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
+# Inline markdown highlighted by ConsoleUI._highlight_inline_markdown
+_MD_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_MD_CODE_RE = re.compile(r'`([^`]+)`')
+# Bold is closed with "unbold" rather than a full reset to keep outer colors
+_MD_BOLD_SUB = "\033[1m\\1\033[22m"
+_MD_CODE_SUB = "\033[36m\\1\033[0m"
+
+_SGR_PARAM_CHARS = frozenset("0123456789;")
+
+# Line prefixes used by ConsoleUI._format_multiline_text
+_TRACEBACK_STARTS = ('Traceback', '错误:')
+_SECTION_STARTS = ('Output:', '输出:', 'Return value:', '返回值:', 'Session ', '[Session')
+_OUTPUT_STARTS = ('输出:', 'Output:')
+_RETURN_STARTS = ('Return value:', '返回值:')
+_SESSION_STARTS = ('[Session', 'Session ')
+# Markdown headers, list items and tables start with one of these (or with
+# whitespace), so other lines skip the markdown checks entirely
+_MARKDOWN_FIRST_CHARS = frozenset("#-*|")
+
+# Indentation strings for ConsoleUI._highlight_json, indexed by depth
+_INDENT_CACHE = tuple("  " * i for i in range(16))
+
+# Highlighted JSON constants and the longest string leaf worth memoizing
+_NULL_STR = f"{Theme.NULL_VALUE}null{Theme.RESET}"
+_TRUE_STR = f"{Theme.BOOLEAN_VALUE}true{Theme.RESET}"
+_FALSE_STR = f"{Theme.BOOLEAN_VALUE}false{Theme.RESET}"
+_MUTED_DOTS = f"{Theme.MUTED}...{Theme.RESET}"
+_PK_OPEN = f'{Theme.PARAM_KEY}"'
+_PK_CLOSE = f'"{Theme.RESET}'
+_SCALAR_CACHE_MAX_STR = 32
+
+# Constant leading segments of box lines
+_BOX_LINE_PREFIX = f"{Theme.BORDER}{Theme.BOX_VERTICAL}{Theme.RESET} "
+_BOX_TOP_PREFIX = f"{Theme.BORDER_ACCENT}{Theme.BOX_TOP_LEFT}{Theme.BOX_HORIZONTAL}{Theme.RESET}"
+
+# Constant pieces of ConsoleUI._format_params_clean lines
+_EMPTY_PARAMS = f"{Theme.MUTED}(no parameters){Theme.RESET}"
+_PARAM_LINE_OPEN = f"  {Theme.PARAM_KEY}"
+_PARAM_LINE_CLOSE = f"{Theme.RESET}:"
+_CODE_LINE_PREFIX = f"    {Theme.MUTED}│{Theme.RESET} {Theme.STRING_VALUE}"
+_TASK_LINE_PREFIX = f"    {Theme.MUTED}•{Theme.RESET} [{Theme.SUCCESS}"
+
+
+@lru_cache(maxsize=512)
+def _colorize_scalar(kind: type, value: Any) -> str:
+    """Highlighted JSON for an int or str leaf.
+
+    ``kind`` is part of the cache key so equal values of different types
+    never share an entry.
+    """
+    if kind is str:
+        # Strings reaching here are short enough to never be truncated
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'{Theme.STRING_VALUE}"{escaped}"{Theme.RESET}'
+    return f"{Theme.NUMBER_VALUE}{value}{Theme.RESET}"
+
+
+@lru_cache(maxsize=4096)
+def _cell_width(ch: str) -> int:
+    """Terminal cells taken by one character.
+
+    Ambiguous-width characters count as one cell, like the box-drawing
+    characters the borders are made of.
+    """
+    if unicodedata.east_asian_width(ch) in ("W", "F"):
+        return 2
+    if unicodedata.category(ch) in ("Mn", "Me", "Cf"):
+        # Combining marks and format characters such as ZWJ
+        return 0
+    return 1
+
+
+def _display_width(text: str) -> int:
+    """Width of text in terminal cells, ignoring SGR color codes."""
+    if text.isascii() and "\x1b" not in text:
+        return len(text)
+    return sum(map(_cell_width, _ANSI_RE.sub("", text)))
+
+
+@lru_cache(maxsize=64)
+def _hline(width: int) -> str:
+    """Horizontal box rule of the given width (one string per width)."""
+    return Theme.BOX_HORIZONTAL * max(0, width)
+
+
+def _is_visually_blank(line: str) -> bool:
+    """True if line shows nothing: only whitespace and SGR color codes.
+
+    Same result as ``not _ANSI_RE.sub('', line).strip()`` without building
+    the stripped copy.
+    """
+    if not line or line.isspace():
+        return True
+    if "\x1b" not in line:
+        return False
+
+    i, n = 0, len(line)
+    while i < n:
+        char = line[i]
+        if char == "\x1b" and i + 1 < n and line[i + 1] == "[":
+            # Skip an SGR sequence: ESC [ params m
+            j = i + 2
+            while j < n and line[j] in _SGR_PARAM_CHARS:
+                j += 1
+            if j < n and line[j] == "m":
+                i = j + 1
+                continue
+            return False
+        if not char.isspace():
+            return False
+        i += 1
+    return True
+
+
+# DEC private mode 2026 (synchronized output): the terminal buffers everything
+# between these and paints it as one frame
+_BSU = "\x1b[?2026h"
+_ESU = "\x1b[?2026l"
+
+# Terminals known to implement mode 2026
+_SYNC_OUTPUT_TERM_PROGRAMS = ("WezTerm", "iTerm.app", "vscode", "ghostty")
+_SYNC_OUTPUT_TERMS = ("xterm-kitty", "foot", "wezterm", "xterm-ghostty", "alacritty")
 
 
+@lru_cache(maxsize=1)
+def _sync_output_enabled() -> bool:
+    """Whether box renders are wrapped in synchronized-output sequences.
+
+    DOLPHIN_SYNC_OUTPUT=1/0 forces it on or off; otherwise it is enabled for
+    terminals known to support mode 2026 when stdout is a TTY.
+    """
+    override = os.environ.get("DOLPHIN_SYNC_OUTPUT", "").lower()
+    if override in ("1", "true", "yes"):
+        return True
+    if override in ("0", "false", "no"):
+        return False
+
+    try:
+        if not sys.stdout.isatty():
+            return False
+    except (AttributeError, ValueError):
+        return False
+
+    if os.environ.get("TERM_PROGRAM") in _SYNC_OUTPUT_TERM_PROGRAMS:
+        return True
+    return os.environ.get("TERM", "").startswith(_SYNC_OUTPUT_TERMS)
 
 
 class ConsoleUI:
@@ -50,6 +204,8 @@ class ConsoleUI:
         self._active_skill_spinner: Optional[Spinner] = None  # For skill call animations
         self._paused_status_bar_for_skill: Optional['StatusBar'] = None # Track paused status bar for skill calls
         self._status_bar: Optional[StatusBar] = None  # For status bar animation
+        # (monotonic timestamp, columns) of the last terminal size query
+        self._term_width_cache: Optional[Tuple[float, int]] = None
     
     def show_status_bar(
         self,
@@ -79,13 +235,22 @@ class ConsoleUI:
             self._status_bar.stop()
             self._status_bar = None
         
+    # Seconds a queried terminal width is reused, so one render (box top,
+    # lines, separators, bottom) costs a single size query
+    TERMINAL_WIDTH_TTL = 0.25
+
     def _get_terminal_width(self) -> int:
         """Get terminal width, with fallback"""
+        now = time.monotonic()
+        cached = self._term_width_cache
+        if cached is not None and now - cached[0] < self.TERMINAL_WIDTH_TTL:
+            return cached[1]
         try:
-            import shutil
-            return shutil.get_terminal_size().columns
+            width = shutil.get_terminal_size().columns
         except Exception:
-            return 80
+            width = 80
+        self._term_width_cache = (now, width)
+        return width
     
     def _truncate(self, text: str, max_len: int) -> str:
         """Truncate text with ellipsis"""
@@ -96,12 +261,15 @@ class ConsoleUI:
     def _highlight_json(self, data: Any, indent: int = 0, max_depth: int = 3) -> str:
         """Syntax highlight JSON data with colors"""
         if indent > max_depth:
-            return f"{Theme.MUTED}...{Theme.RESET}"
-            
-        spaces = "  " * indent
-        
+            return _MUTED_DOTS
+
+        kind = type(data)
         if data is None:
-            return f"{Theme.NULL_VALUE}null{Theme.RESET}"
+            return _NULL_STR
+        elif kind is bool:
+            return _TRUE_STR if data else _FALSE_STR
+        elif kind is int or (kind is str and len(data) <= _SCALAR_CACHE_MAX_STR):
+            return _colorize_scalar(kind, data)
         elif isinstance(data, bool):
             return f"{Theme.BOOLEAN_VALUE}{str(data).lower()}{Theme.RESET}"
         elif isinstance(data, (int, float)):
@@ -117,6 +285,7 @@ class ConsoleUI:
                 return "[]"
             if len(data) == 1 and not isinstance(data[0], (dict, list)):
                 return f"[{self._highlight_json(data[0], indent)}]"
+            spaces = _INDENT_CACHE[indent] if indent < 16 else "  " * indent
             items = [self._highlight_json(item, indent + 1, max_depth) for item in data[:5]]
             if len(data) > 5:
                 items.append(f"{Theme.MUTED}...+{len(data) - 5} more{Theme.RESET}")
@@ -125,14 +294,14 @@ class ConsoleUI:
         elif isinstance(data, dict):
             if not data:
                 return "{}"
-            items = []
-            for i, (k, v) in enumerate(list(data.items())[:10]):
-                key_str = f'{Theme.PARAM_KEY}"{k}"{Theme.RESET}'
-                val_str = self._highlight_json(v, indent + 1, max_depth)
-                items.append(f"{key_str}: {val_str}")
-                if i >= 9 and len(data) > 10:
-                    items.append(f"{Theme.MUTED}...+{len(data) - 10} more{Theme.RESET}")
-                    break
+            spaces = _INDENT_CACHE[indent] if indent < 16 else "  " * indent
+            # Only the first 10 entries are shown, so only those are visited
+            items = [
+                f"{_PK_OPEN}{k}{_PK_CLOSE}: {self._highlight_json(v, indent + 1, max_depth)}"
+                for k, v in islice(data.items(), 10)
+            ]
+            if len(data) > 10:
+                items.append(f"{Theme.MUTED}...+{len(data) - 10} more{Theme.RESET}")
             inner = f",\n{spaces}  ".join(items)
             return f"{{\n{spaces}  {inner}\n{spaces}}}"
         else:
@@ -166,18 +335,17 @@ class ConsoleUI:
         if title:
             # Tool name in ITALIC
             title_section = f" {status_color}{status_char}{Theme.RESET} {Theme.BOLD}{Theme.ITALIC}{icon}{Theme.TOOL_NAME}{title}{Theme.RESET} "
-            title_len = len(f" {status_char} {icon}{title} ")
+            title_len = _display_width(f" {status_char} {icon}{title} ")
         else:
             title_section = ""
             title_len = 0
         
         # Calculate remaining width for border
         remaining = width - title_len - 2  # 2 for corners
-        left_border = Theme.BOX_HORIZONTAL * 1
-        right_border = Theme.BOX_HORIZONTAL * max(0, remaining - 1)
+        right_border = _hline(remaining - 1)
         
         return (
-            f"{Theme.BORDER_ACCENT}{Theme.BOX_TOP_LEFT}{left_border}{Theme.RESET}"
+            f"{_BOX_TOP_PREFIX}"
             f"{title_section}"
             f"{Theme.BORDER}{right_border}{Theme.BOX_TOP_RIGHT}{Theme.RESET}"
         )
@@ -188,14 +356,14 @@ class ConsoleUI:
         
         if status_text:
             status_section = f" {Theme.MUTED}{status_text}{Theme.RESET} "
-            status_len = len(f" {status_text} ")
+            status_len = _display_width(f" {status_text} ")
         else:
             status_section = ""
             status_len = 0
         
         remaining = width - status_len - 2
-        left_border = Theme.BOX_HORIZONTAL * max(0, remaining // 2)
-        right_border = Theme.BOX_HORIZONTAL * max(0, remaining - len(left_border))
+        left_border = _hline(remaining // 2)
+        right_border = _hline(remaining - len(left_border))
         
         return (
             f"{Theme.BORDER}{Theme.BOX_BOTTOM_LEFT}{left_border}{Theme.RESET}"
@@ -203,11 +371,21 @@ class ConsoleUI:
             f"{Theme.BORDER}{right_border}{Theme.BOX_BOTTOM_RIGHT}{Theme.RESET}"
         )
     
+    def _emit_block(self, lines: List[str]) -> None:
+        """Print the lines of one box/card with a single write.
+
+        On terminals with synchronized output the box is painted as one frame.
+        """
+        block = "\n".join(lines) + "\n"
+        if _sync_output_enabled():
+            block = f"{_BSU}{block}{_ESU}"
+        safe_write(block)
+
     def _draw_box_line(self, content: str, prefix: str = "") -> str:
         """Draw a line of content inside a box"""
         if prefix:
-            return f"{Theme.BORDER}{Theme.BOX_VERTICAL}{Theme.RESET} {prefix}{content}"
-        return f"{Theme.BORDER}{Theme.BOX_VERTICAL}{Theme.RESET} {content}"
+            return f"{_BOX_LINE_PREFIX}{prefix}{content}"
+        return f"{_BOX_LINE_PREFIX}{content}"
     
     # ─────────────────────────────────────────────────────────────
     # Collapsible Output Configuration
@@ -222,8 +400,7 @@ class ConsoleUI:
     @staticmethod
     def _strip_ansi(text: str) -> str:
         """Remove ANSI escape codes from text."""
-        import re
-        return re.sub(r'\x1b\[[0-9;]*m', '', text)
+        return _ANSI_RE.sub('', text)
 
     def _format_hidden_lines_hint(self, count: int, prefix: str = "") -> str:
         """Format the 'hidden lines' indicator consistently.
@@ -261,6 +438,10 @@ class ConsoleUI:
         Returns:
             Tuple of (formatted_content, is_collapsed, total_lines)
         """
+        # A single line has no blank runs to squeeze and never collapses
+        if '\n' not in content:
+            return content, False, 1
+
         threshold = threshold or self.COLLAPSE_THRESHOLD_LINES
         head_lines = head_lines or self.COLLAPSE_HEAD_LINES
         tail_lines = tail_lines or self.COLLAPSE_TAIL_LINES
@@ -271,8 +452,7 @@ class ConsoleUI:
         filtered_lines = []
         prev_was_blank = False
         for line in lines:
-            is_blank = not self._strip_ansi(line).strip()
-            if is_blank:
+            if _is_visually_blank(line):
                 if not prev_was_blank:
                     filtered_lines.append(line)
                 prev_was_blank = True
@@ -286,51 +466,40 @@ class ConsoleUI:
         if total_lines <= threshold:
             return '\n'.join(lines), False, total_lines
 
-        # Filter out Session meta-info lines for head display
-        # These lines are not meaningful to users
-        meta_patterns = ('Session restored:', '[Session ', 'Session ')
-        
-        def is_meta_line(line: str) -> bool:
-            """Check if a line is meta-info that should be skipped."""
-            stripped = line.strip()
-            if not stripped:  # Empty lines are not meta
-                return False
-            return any(p in stripped for p in meta_patterns)
-        
-        # Find first meaningful line (skip meta-info at the beginning)
+        # Find first meaningful line, skipping Session meta-info lines
+        # ("Session restored:", "[Session ...") that are not meaningful to
+        # users. Both contain "Session ", so one substring test covers them.
         meaningful_start = 0
         for i, line in enumerate(lines):
-            if not is_meta_line(line):
+            if 'Session ' not in line.strip():
                 meaningful_start = i
                 break
         
         # Collapse: show head + indicator + tail
-        collapsed_lines = []
-        
         # Head lines: prefer meaningful content over meta-info
         head_source = lines[meaningful_start:meaningful_start + head_lines]
         if len(head_source) < head_lines:
             # Not enough meaningful lines, fall back to original
             head_source = lines[:head_lines]
-        
-        for line in head_source:
-            # Truncate very long lines
-            if len(line) > 78:
-                line = line[:75] + "..."
-            collapsed_lines.append(f"{Theme.MUTED}{collapse_indicator}{Theme.RESET} {line}")
-        
+
+        # Preview lines carry the collapse indicator; very long ones are truncated
+        marker = f"{Theme.MUTED}{collapse_indicator}{Theme.RESET} "
+        collapsed_lines = [
+            f"{marker}{line if len(line) <= 78 else line[:75] + '...'}"
+            for line in head_source
+        ]
+
         # Collapse indicator showing hidden lines count
         hidden_count = total_lines - head_lines - tail_lines
         collapsed_lines.append(
             self._format_hidden_lines_hint(hidden_count, prefix=f"{collapse_indicator} ")
         )
-        
-        # Tail lines with collapse indicator
-        for line in lines[-tail_lines:]:
-            if len(line) > 78:
-                line = line[:75] + "..."
-            collapsed_lines.append(f"{Theme.MUTED}{collapse_indicator}{Theme.RESET} {line}")
-        
+
+        collapsed_lines.extend(
+            f"{marker}{line if len(line) <= 78 else line[:75] + '...'}"
+            for line in lines[-tail_lines:]
+        )
+
         return '\n'.join(collapsed_lines), True, total_lines
 
     def _draw_separator(self, style: str = "light") -> str:
@@ -341,7 +510,7 @@ class ConsoleUI:
         elif style == "dashed":
             return f"{Theme.BORDER}{'╌' * (width - 2)}{Theme.RESET}"
         else:
-            return f"{Theme.BORDER}{Theme.BOX_HORIZONTAL * (width - 2)}{Theme.RESET}"
+            return f"{Theme.BORDER}{_hline(width - 2)}{Theme.RESET}"
 
     def _format_params_clean(self, params: Dict[str, Any], max_val_len: int = 500) -> str:
         """
@@ -354,29 +523,22 @@ class ConsoleUI:
         are displayed as properly formatted code blocks.
         """
         if not params:
-            return f"{Theme.MUTED}(no parameters){Theme.RESET}"
+            return _EMPTY_PARAMS
         
         # Keys that should be treated as code blocks
         CODE_KEYS = {'cmd', 'code', 'script', 'python_code', 'shell_code', 'command'}
         
         lines = []
-        # Calculate alignment
-        keys = list(params.keys())
-        max_key_len = max(len(str(k)) for k in keys) if keys else 0
-        max_key_len = min(max_key_len, 25)  # Cap alignment padding to avoid huge gaps
-        
-        # Check if we should truncate the number of items
-        items = list(params.items())
-        total_items = len(items)
-        truncated_items = False
+        # Calculate alignment (each key is converted to str once)
+        key_strs = [str(k) for k in params]
+        # Cap alignment padding to avoid huge gaps
+        max_key_len = min(max(map(len, key_strs), default=0), 25)
         
         # If parameters are huge, limit the number of items displayed
-        if total_items > 15:
-             items = items[:15]
-             truncated_items = True
-             
-        for k, v in items:
-            key_str = str(k)
+        total_items = len(key_strs)
+        truncated_items = total_items > 15
+        
+        for key_str, v in zip(key_strs[:15], params.values()):
             key_lower = key_str.lower()
             
             # Alignment padding
@@ -390,14 +552,13 @@ class ConsoleUI:
             # Check if this is a code-like parameter
             if key_lower in CODE_KEYS and isinstance(v, str) and '\n' in v:
                 # Format as code block
-                lines.append(f"  {Theme.PARAM_KEY}{display_key}{Theme.RESET}:{padding}")
+                lines.append(f"{_PARAM_LINE_OPEN}{display_key}{_PARAM_LINE_CLOSE}{padding}")
                 code_lines = v.split('\n')
-                # Limit to 10 lines max for display
-                for i, code_line in enumerate(code_lines[:10]):
-                    # Truncate very long lines
-                    if len(code_line) > 80:
-                        code_line = code_line[:77] + "..."
-                    lines.append(f"    {Theme.MUTED}│{Theme.RESET} {Theme.STRING_VALUE}{code_line}{Theme.RESET}")
+                # Limit to 10 lines max for display, truncating very long lines
+                lines.extend(
+                    f"{_CODE_LINE_PREFIX}{code_line if len(code_line) <= 80 else code_line[:77] + '...'}{Theme.RESET}"
+                    for code_line in code_lines[:10]
+                )
                 if len(code_lines) > 10:
                     lines.append(f"    {self._format_hidden_lines_hint(len(code_lines) - 10, prefix='│ ')}")
             elif isinstance(v, str):
@@ -406,29 +567,30 @@ class ConsoleUI:
                 if len(val_str) > max_val_len:
                     val_str = val_str[:max_val_len-3] + "..."
                 val_display = f"{Theme.STRING_VALUE}{val_str}{Theme.RESET}"
-                lines.append(f"  {Theme.PARAM_KEY}{display_key}{Theme.RESET}:{padding} {val_display}")
+                lines.append(f"{_PARAM_LINE_OPEN}{display_key}{_PARAM_LINE_CLOSE}{padding} {val_display}")
             elif isinstance(v, (int, float)):
                 val_display = f"{Theme.NUMBER_VALUE}{v}{Theme.RESET}"
-                lines.append(f"  {Theme.PARAM_KEY}{display_key}{Theme.RESET}:{padding} {val_display}")
+                lines.append(f"{_PARAM_LINE_OPEN}{display_key}{_PARAM_LINE_CLOSE}{padding} {val_display}")
             elif isinstance(v, bool):
                 val_display = f"{Theme.BOOLEAN_VALUE}{str(v).lower()}{Theme.RESET}"
-                lines.append(f"  {Theme.PARAM_KEY}{display_key}{Theme.RESET}:{padding} {val_display}")
+                lines.append(f"{_PARAM_LINE_OPEN}{display_key}{_PARAM_LINE_CLOSE}{padding} {val_display}")
             elif v is None:
-                val_display = f"{Theme.NULL_VALUE}null{Theme.RESET}"
-                lines.append(f"  {Theme.PARAM_KEY}{display_key}{Theme.RESET}:{padding} {val_display}")
+                val_display = _NULL_STR
+                lines.append(f"{_PARAM_LINE_OPEN}{display_key}{_PARAM_LINE_CLOSE}{padding} {val_display}")
             # Special case for tasks list in PlanSkillkit
             elif key_lower == "tasks" and isinstance(v, list) and v and isinstance(v[0], dict):
-                lines.append(f"  {Theme.PARAM_KEY}{display_key}{Theme.RESET}:{padding}")
-                for i, task in enumerate(v[:10]):
-                    task_id = task.get("id", f"task_{i+1}")
-                    task_name = task.get("name", "Unnamed Task")
-                    lines.append(f"    {Theme.MUTED}•{Theme.RESET} [{Theme.SUCCESS}{task_id}{Theme.RESET}] {Theme.PARAM_VALUE}{task_name}{Theme.RESET}")
+                lines.append(f"{_PARAM_LINE_OPEN}{display_key}{_PARAM_LINE_CLOSE}{padding}")
+                lines.extend(
+                    f"{_TASK_LINE_PREFIX}{task.get('id', f'task_{i+1}')}{Theme.RESET}] "
+                    f"{Theme.PARAM_VALUE}{task.get('name', 'Unnamed Task')}{Theme.RESET}"
+                    for i, task in enumerate(v[:10])
+                )
                 if len(v) > 10:
                     lines.append(f"    {self._format_hidden_lines_hint(len(v) - 10, prefix=' ')}")
             else:
                 # Complex types: use existing json highlighter
                 val_display = self._highlight_json(v, indent=0, max_depth=1)
-                lines.append(f"  {Theme.PARAM_KEY}{display_key}{Theme.RESET}:{padding} {val_display}")
+                lines.append(f"{_PARAM_LINE_OPEN}{display_key}{_PARAM_LINE_CLOSE}{padding} {val_display}")
             
         if truncated_items:
             lines.append(f"{Theme.MUTED}  ...+{total_items - 15} more parameters{Theme.RESET}")
@@ -471,7 +633,7 @@ class ConsoleUI:
         if params:
             formatted_params = self._format_params_clean(params, max_val_len=max_param_length)
         else:
-            formatted_params = f"{Theme.MUTED}(no parameters){Theme.RESET}"
+            formatted_params = _EMPTY_PARAMS
         
         # Build the output
         output_lines = [
@@ -485,8 +647,7 @@ class ConsoleUI:
             output_lines.append(self._draw_box_line(f"  {line}"))
         
         # Print all lines
-        for line in output_lines:
-            safe_print(line)
+        self._emit_block(output_lines)
         
         # Start the spinner animation for skill execution
         # Also animate the icon in the Box Header (top-left)
@@ -567,16 +728,12 @@ class ConsoleUI:
         Returns:
             Text with ANSI color codes for formatting
         """
-        import re
-        BOLD = "\033[1m"
-        UNBOLD = "\033[22m"  # Reset bold/faint without resetting color
-        CYAN = "\033[36m"
-        RESET = "\033[0m"
-
         # Replace **text** with bold (use unbold instead of full reset to preserve outer colors)
-        text = re.sub(r'\*\*(.+?)\*\*', f'{BOLD}\\1{UNBOLD}', text)
+        if "**" in text:
+            text = _MD_BOLD_RE.sub(_MD_BOLD_SUB, text)
         # Replace `code` with cyan
-        text = re.sub(r'`([^`]+)`', f'{CYAN}\\1{RESET}', text)
+        if "`" in text:
+            text = _MD_CODE_RE.sub(_MD_CODE_SUB, text)
         return text
 
     def _format_multiline_text(self, text: str, max_length: int = 300) -> str:
@@ -587,29 +744,26 @@ class ConsoleUI:
         - Python execution output (Session info, errors, tracebacks)
         - General structured text
         """
-        lines = text.split('\n')
-
-        # Filter out consecutive empty lines
-        filtered_lines = []
+        # One pass: squeeze runs of empty lines and drop meta-info lines that
+        # are not useful for display. A meta line still ends a blank run, as
+        # if the squeeze had run before the meta lines were removed.
+        lines = []
         prev_was_blank = False
-        for line in lines:
-            is_blank = not line.strip()
-            if is_blank:
+        for line in text.split('\n'):
+            if not line or line.isspace():
                 if not prev_was_blank:
-                    filtered_lines.append(line)
+                    lines.append(line)
                 prev_was_blank = True
-            else:
-                filtered_lines.append(line)
-                prev_was_blank = False
-        lines = filtered_lines
-
-        # Filter out meta-info lines that are not useful for display
-        meta_patterns = (
-            '<class ',           # e.g., <class 'pandas.core.frame.DataFrame'>
-            'Session restored:', # Session restore info
-            '[Session ',         # Session execution info
-        )
-        lines = [line for line in lines if not any(p in line for p in meta_patterns)]
+                continue
+            prev_was_blank = False
+            # Chained `in` tests beat any() over a tuple or a regex alternation
+            if (
+                '<class ' in line               # e.g., <class 'pandas.core.frame.DataFrame'>
+                or 'Session restored:' in line  # Session restore info
+                or '[Session ' in line          # Session execution info
+            ):
+                continue
+            lines.append(line)
 
         result_lines = []
         in_traceback = False
@@ -620,16 +774,14 @@ class ConsoleUI:
             display_line = line[:77] + "..." if len(line) > 80 else line
             
             # Handle Traceback state
-            if line.startswith('Traceback') or line.startswith('错误:'):
+            if line.startswith(_TRACEBACK_STARTS):
                 in_traceback = True
                 result_lines.append(f"{Theme.ERROR}{Theme.BOLD}{display_line}{Theme.RESET}")
                 continue
             
             if in_traceback:
                 # Check for exit conditions (new section headers)
-                if line.startswith('Output:') or line.startswith('输出:') or \
-                   line.startswith('Return value:') or line.startswith('返回值:') or \
-                   line.startswith('Session ') or line.startswith('[Session'):
+                if line.startswith(_SECTION_STARTS):
                     in_traceback = False
                 else:
                     # In traceback processing
@@ -646,13 +798,16 @@ class ConsoleUI:
             # Standard processing (non-traceback)
             if line.startswith('Error ') or 'Error:' in line or 'error:' in line.lower():
                 result_lines.append(f"{Theme.ERROR}{display_line}{Theme.RESET}")
-            elif line.startswith('输出:') or line.startswith('Output:'):
+            elif line.startswith(_OUTPUT_STARTS):
                 result_lines.append(f"{Theme.SUCCESS}{display_line}{Theme.RESET}")
-            elif line.startswith('Return value:') or line.startswith('返回值:'):
+            elif line.startswith(_RETURN_STARTS):
                 result_lines.append(f"{Theme.PRIMARY}{Theme.BOLD}{display_line}{Theme.RESET}")
-            elif line.startswith('[Session') or line.startswith('Session '):
+            elif line.startswith(_SESSION_STARTS):
                 result_lines.append(f"{Theme.MUTED}{display_line}{Theme.RESET}")
-            
+            elif not line or (line[0] not in _MARKDOWN_FIRST_CHARS and not line[0].isspace()):
+                # Plain text: apply inline markdown only
+                result_lines.append(self._highlight_inline_markdown(display_line))
+
             # Markdown patterns
             elif line.startswith('# '):
                 # Apply inline markdown to header content
@@ -664,10 +819,10 @@ class ConsoleUI:
             elif line.startswith('### '):
                 header_text = self._highlight_inline_markdown(display_line[4:])
                 result_lines.append(f"{Theme.ACCENT}{header_text}{Theme.RESET}")
-            elif line.startswith('- ') or line.startswith('* '):
+            elif line.startswith(('- ', '* ')):
                 list_text = self._highlight_inline_markdown(display_line[2:])
                 result_lines.append(f"{Theme.SUCCESS}•{Theme.RESET} {list_text}")
-            elif line.startswith('  - ') or line.startswith('  * '):
+            elif line.startswith(('  - ', '  * ')):
                 list_text = self._highlight_inline_markdown(display_line[4:])
                 result_lines.append(f"  {Theme.SUCCESS}◦{Theme.RESET} {list_text}")
             elif line.strip().startswith('|'):
@@ -762,8 +917,7 @@ class ConsoleUI:
         output_lines.append(self._draw_box_bottom(status_text))
         # No blank line after - let following content manage spacing
         
-        for line in output_lines:
-            safe_print(line)
+        self._emit_block(output_lines)
     
     def skill_call_compact(
         self,
@@ -933,7 +1087,7 @@ class ConsoleUI:
             color = Theme.PRIMARY
             
         # Top border
-        safe_print(f"\n{color}{Theme.BOX_TOP_LEFT}{Theme.BOX_HORIZONTAL * width}{Theme.BOX_TOP_RIGHT}{Theme.RESET}")
+        top = f"\n{color}{Theme.BOX_TOP_LEFT}{Theme.BOX_HORIZONTAL * width}{Theme.BOX_TOP_RIGHT}{Theme.RESET}"
         
         # Content string
         # Ensure text is not too long
@@ -943,10 +1097,12 @@ class ConsoleUI:
         padding_left = (width - len(text)) // 2
         padding_right = width - len(text) - padding_left
         
-        safe_print(f"{color}{Theme.BOX_VERTICAL}{Theme.RESET}{' ' * padding_left}{Theme.BOLD}{text}{Theme.RESET}{' ' * padding_right}{color}{Theme.BOX_VERTICAL}{Theme.RESET}")
-        
-        # Bottom border
-        safe_print(f"{color}{Theme.BOX_BOTTOM_LEFT}{Theme.BOX_HORIZONTAL * width}{Theme.BOX_BOTTOM_RIGHT}{Theme.RESET}\n")
+        self._emit_block([
+            top,
+            f"{color}{Theme.BOX_VERTICAL}{Theme.RESET}{' ' * padding_left}{Theme.BOLD}{text}{Theme.RESET}{' ' * padding_right}{color}{Theme.BOX_VERTICAL}{Theme.RESET}",
+            # Bottom border
+            f"{color}{Theme.BOX_BOTTOM_LEFT}{Theme.BOX_HORIZONTAL * width}{Theme.BOX_BOTTOM_RIGHT}{Theme.RESET}\n",
+        ])
 
     # ─────────────────────────────────────────────────────────────
     # Session/Conversation Display
@@ -1360,24 +1516,7 @@ class ConsoleUI:
     
     def _get_visual_width(self, text: str) -> int:
         """Calculate the visual width of a string in terminal (handling double-width CJK)."""
-        # Remove ANSI escape codes before calculating width
-        clean_text = ""
-        skip = False
-        for i, char in enumerate(text):
-            if char == "\033":
-                skip = True
-            if not skip:
-                clean_text += char
-            if skip and char == "m":
-                skip = False
-        
-        width = 0
-        for char in clean_text:
-            if unicodedata.east_asian_width(char) in ("W", "F", "A"):
-                width += 2
-            else:
-                width += 1
-        return width
+        return _visual_width(text)
 
     # ─────────────────────────────────────────────────────────────
     # Plan Renderer (Codex-style)
@@ -1481,12 +1620,7 @@ class ConsoleUI:
             status = task.get("status", "pending").lower()
             
             # Truncate long content based on visual width
-            max_v_content = width - 10
-            v_content = self._get_visual_width(content)
-            if v_content > max_v_content:
-                # Simple truncation that's safe for multi-byte
-                content = content[:int(max_v_content/1.5)] + "..."
-                v_content = self._get_visual_width(content)
+            content, _ = _truncate_to_width(content, width - 10)
 
             icon, color = status_icons.get(status, ("○", Theme.MUTED))
             
@@ -1529,10 +1663,7 @@ class ConsoleUI:
             else:
                 action_text = f"  {action_icon} Task {current_task_id}"
             
-            v_action_w = self._get_visual_width(action_text)
-            if v_action_w > width - 4:
-                action_text = action_text[:int((width-6)/1.5)] + "..."
-                v_action_w = self._get_visual_width(action_text)
+            action_text, v_action_w = _truncate_to_width(action_text, width - 4)
             
             padding = width - v_action_w - 1
             safe_print(f"{PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}{PLAN_ACCENT}{action_text}{Theme.RESET}{' ' * max(0, padding)}{PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}")
@@ -1540,10 +1671,7 @@ class ConsoleUI:
             # Conclusions if present
             if conclusions:
                 conclusion_text = f"    {conclusions}"
-                v_conclusion_w = self._get_visual_width(conclusion_text)
-                if v_conclusion_w > width - 4:
-                    conclusion_text = conclusion_text[:int((width-6)/1.5)] + "..."
-                    v_conclusion_w = self._get_visual_width(conclusion_text)
+                conclusion_text, v_conclusion_w = _truncate_to_width(conclusion_text, width - 4)
                 
                 padding = width - v_conclusion_w - 1
                 safe_print(f"{PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}{PLAN_MUTED}{conclusion_text}{Theme.RESET}{' ' * max(0, padding)}{PLAN_PRIMARY}{Theme.BOX_VERTICAL}{Theme.RESET}")
@@ -1636,23 +1764,24 @@ class ConsoleUI:
         if verbose is False or (verbose is None and not self.verbose):
             return
         
-        safe_print(f"\n{self._draw_box_top(plan_name, '📋 ', StatusType.SUCCESS)}")
+        output_lines = [f"\n{self._draw_box_top(plan_name, '📋 ', StatusType.SUCCESS)}"]
         
         # Tasks section
-        safe_print(self._draw_box_line(f"{Theme.LABEL}Tasks ({len(tasks)}):{Theme.RESET}"))
+        output_lines.append(self._draw_box_line(f"{Theme.LABEL}Tasks ({len(tasks)}):{Theme.RESET}"))
         for i, task in enumerate(tasks[:7], 1):  # Show max 7 tasks
             task_preview = self._truncate(task, 50)
-            safe_print(self._draw_box_line(f"  {Theme.MUTED}{i}.{Theme.RESET} {task_preview}"))
+            output_lines.append(self._draw_box_line(f"  {Theme.MUTED}{i}.{Theme.RESET} {task_preview}"))
         
         if len(tasks) > 7:
-            safe_print(self._draw_box_line(f"  {Theme.MUTED}...+{len(tasks) - 7} more{Theme.RESET}"))
+            output_lines.append(self._draw_box_line(f"  {Theme.MUTED}...+{len(tasks) - 7} more{Theme.RESET}"))
         
         # Next step section
         if next_step:
-            safe_print(self._draw_separator("light"))
-            safe_print(self._draw_box_line(f"{Theme.LABEL}Next:{Theme.RESET} {Theme.PRIMARY}{next_step}{Theme.RESET}"))
+            output_lines.append(self._draw_separator("light"))
+            output_lines.append(self._draw_box_line(f"{Theme.LABEL}Next:{Theme.RESET} {Theme.PRIMARY}{next_step}{Theme.RESET}"))
         
-        safe_print(self._draw_box_bottom())
+        output_lines.append(self._draw_box_bottom())
+        self._emit_block(output_lines)
     
     def result_card(
         self,
@@ -1680,7 +1809,7 @@ class ConsoleUI:
         }
         status_type, icon = status_map.get(status, (StatusType.SUCCESS, "✓"))
         
-        safe_print(f"\n{self._draw_box_top(title, f'{icon} ', status_type)}")
+        output_lines = [f"\n{self._draw_box_top(title, f'{icon} ', status_type)}"]
         
         # Format content
         if isinstance(content, dict):
@@ -1691,12 +1820,13 @@ class ConsoleUI:
             formatted = str(content)
         
         for line in formatted.split("\n")[:15]:  # Limit to 15 lines
-            safe_print(self._draw_box_line(f"  {line}"))
+            output_lines.append(self._draw_box_line(f"  {line}"))
         
         if formatted.count("\n") > 15:
-            safe_print(self._draw_box_line(f"  {Theme.MUTED}...{Theme.RESET}"))
+            output_lines.append(self._draw_box_line(f"  {Theme.MUTED}...{Theme.RESET}"))
         
-        safe_print(self._draw_box_bottom())
+        output_lines.append(self._draw_box_bottom())
+        self._emit_block(output_lines)
 
 
 # ─────────────────────────────────────────────────────────────
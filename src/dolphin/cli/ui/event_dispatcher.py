@@ -7,17 +7,19 @@ to CLI UI components like LivePlanCard and StatusBar.
 Architecture:
     Core Layer (context.write_output)
          ↓
-    Event Buffer (context._output_events)
+    Output sink (context.set_output_sink) [bound in execution.py]
          ↓
-    drain_output_events() [called in runner.py]
+    CLIEventDispatcher.dispatch_deferred() [this module, coalesced per frame]
          ↓
-    CLIEventDispatcher.dispatch() [this module]
+    CLIEventDispatcher.dispatch()
          ↓
     UI Components (LivePlanCard, StatusBar, etc.)
 """
 
+import asyncio
 import logging
 import threading
+import time
 from typing import Any, Dict, List, Optional
 
 from dolphin.cli.ui.components import LivePlanCard
@@ -27,13 +29,45 @@ from dolphin.cli.config import SILENT_TOOLS
 
 logger = logging.getLogger(__name__)
 
+# Deferred events are flushed at most once per terminal frame (~60 fps)
+FRAME_INTERVAL = 0.016
+# A flush that takes longer than this yields back to the event loop
+FRAME_BUDGET = 0.008
+
+
+def _coalesce_llm_stream(events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Merge runs of llm_stream events from the same task into one event.
+
+    Chunk texts are concatenated and the last event's full_text/is_final are
+    kept, so the renderer redraws once per run instead of once per chunk.
+    A final event always ends its run.
+    """
+    merged: List[Dict[str, Any]] = []
+    chunks: List[str] = []
+    for event in events:
+        data = event.get('data') or {}
+        if event.get('event_type') == 'llm_stream' and merged:
+            prev = merged[-1]
+            prev_data = prev.get('data') or {}
+            if (
+                prev.get('event_type') == 'llm_stream'
+                and not prev_data.get('is_final')
+                and prev_data.get('task_id') == data.get('task_id')
+            ):
+                chunks.append(data.get('chunk_text', ''))
+                merged[-1] = {**event, 'data': {**data, 'chunk_text': ''.join(chunks)}}
+                continue
+        chunks = [data.get('chunk_text', '')]
+        merged.append(event)
+    return merged
+
 
 class CLIEventDispatcher:
     """
     Event dispatcher that routes Core output events to appropriate UI components.
 
     Responsibilities:
-    - Consume events from context.drain_output_events()
+    - Receive events pushed from context.write_output() via the output sink
     - Maintain Plan state (task list, current task, status)
     - Route events to LivePlanCard for real-time updates
     - Coordinate with LayoutManager for status bar control
@@ -67,6 +101,14 @@ class CLIEventDispatcher:
         # Streaming renderer for non-plan LLM output
         self._stream_renderer = None
 
+        # Events waiting for the next frame flush (see dispatch_deferred).
+        # Only the loop that first deferred an event (_loop) queues them; the
+        # lock guards against flush() being called from other threads.
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_lock = threading.RLock()
+
         # Event handlers registry
         self._handlers = {
             'plan_created': self._handle_plan_created,
@@ -110,6 +152,76 @@ class CLIEventDispatcher:
         for event in events:
             self.dispatch(event)
 
+    def dispatch_deferred(self, event: Dict[str, Any]) -> None:
+        """Queue an event and render it with the next frame flush.
+
+        Bursts of events (e.g. token-by-token LLM streaming) are coalesced and
+        rendered once per FRAME_INTERVAL instead of repainting per event.
+        Events from any thread other than the one running the dispatcher's
+        event loop are dispatched immediately.
+
+        Args:
+            event: Event dict with keys: event_type, data, timestamp_ms
+        """
+        if not self.verbose:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.dispatch(event)
+            return
+
+        with self._pending_lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = loop
+            if loop is not self._loop:
+                self.dispatch(event)
+                return
+            self._pending.append(event)
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(FRAME_INTERVAL, self._flush_frame)
+
+    def flush(self) -> None:
+        """Render all deferred events now.
+
+        Called when a run ends and before any direct console write (see
+        dolphin.core.logging.logger.set_console_flush_hook), so held back
+        output never prints after output that follows it. Safe to call from
+        any thread.
+        """
+        with self._pending_lock:
+            if self._flush_handle is not None and self._on_owner_loop():
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            # Off the loop thread the timer stays armed and finds nothing
+            pending, self._pending = self._pending, []
+            self.dispatch_batch(_coalesce_llm_stream(pending))
+
+    def _on_owner_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _flush_frame(self) -> None:
+        """Timer callback: render deferred events within the frame budget."""
+        with self._pending_lock:
+            self._flush_handle = None
+            pending, self._pending = _coalesce_llm_stream(self._pending), []
+
+            frame_start = time.perf_counter()
+            for index, event in enumerate(pending):
+                self.dispatch(event)
+                if time.perf_counter() - frame_start > FRAME_BUDGET:
+                    # Over budget: let the agent run, finish on the next loop pass
+                    rest = pending[index + 1:]
+                    if rest:
+                        self._pending[:0] = rest
+                        if self._flush_handle is None:
+                            self._flush_handle = self._loop.call_soon(self._flush_frame)
+                    return
+
     def _handle_plan_created(self, data: Dict[str, Any]) -> None:
         """Handle plan_created event - initialize LivePlanCard.
 
@@ -400,6 +512,13 @@ class CLIEventDispatcher:
 
     def cleanup(self) -> None:
         """Cleanup resources (stop animations, clear state)."""
+        with self._pending_lock:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            self._pending = []
+            self._loop = None
+
         if self.plan_card:
             try:
                 self.plan_card.stop()
@@ -146,6 +146,10 @@ class LayoutManager:
         self._resize_pending = False
         self._pending_height = 0
         self._pending_width = 0
+
+        # Last cursor visibility written by this manager. None means unknown:
+        # the status bar and live renderers may have changed it since.
+        self._cursor_visible: Optional[bool] = None
         
         # Note: _stdout_lock is imported from state.py for consistency with
         # StatusBar and LivePlanCard components. This prevents race conditions
@@ -263,6 +267,21 @@ class LayoutManager:
             safe_write("", flush=True)
         self._scroll_region_active = True
 
+    def set_cursor_visible(self, visible: bool) -> None:
+        """Show or hide the terminal cursor.
+
+        The escape sequence is only written when the visibility differs from
+        the last state written, so prompting repeatedly costs no stdout I/O.
+
+        Args:
+            visible: Whether the cursor should be visible
+        """
+        if self._cursor_visible is visible:
+            return
+        with _stdout_lock:
+            safe_write("\033[?25h" if visible else "\033[?25l", flush=True)
+            self._cursor_visible = visible
+
     def _reset_scroll_region(self) -> None:
         """Reset scroll region to full screen.
         
@@ -294,6 +313,7 @@ class LayoutManager:
             
             safe_write("".join(output_parts))
             safe_write("", flush=True)
+            self._cursor_visible = True
             
         self._scroll_region_active = False
         self._current_bottom_reserve = self.BOTTOM_RESERVE
@@ -460,7 +480,10 @@ class LayoutManager:
             height, _ = self._get_terminal_size()
             fixed_row = height - 1  # Status bar at height-1 (bottom)
         
-        StatusBar._debug_log(f"LayoutManager.show_status: enabled={self.enabled}, scroll_active={self._scroll_region_active}, fixed_row={fixed_row}")
+        # The spinner and live output own the terminal until the next prompt
+        self._cursor_visible = None
+
+        StatusBar._debug_log("LayoutManager.show_status: enabled=%s, scroll_active=%s, fixed_row=%s", self.enabled, self._scroll_region_active, fixed_row)
         
         self._status_bar = StatusBar(message=message, hint=hint, fixed_row=fixed_row)
         self._status_bar.start()
@@ -579,8 +602,7 @@ class LayoutManager:
             self._status_bar.stop(clear=True)
 
         # Ensure cursor is visible for input
-        safe_write("\033[?25h")
-        safe_write("", flush=True)
+        self.set_cursor_visible(True)
 
         try:
             return await prompt_conversation(prompt)
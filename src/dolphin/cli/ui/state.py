@@ -3,13 +3,15 @@ Global State Management for UI Components
 
 This module manages global state for UI components including:
 - Thread synchronization lock for stdout
+- The shared animation thread (UiTicker)
 - Active component tracking (StatusBar, LivePlanCard)
 - Component pause/resume coordination
 """
 
 import threading
+import time
 from contextlib import contextmanager
-from typing import Any, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from dolphin.cli.ui.components.status_bar import StatusBar
@@ -50,6 +52,80 @@ def safe_print(*args, **kwargs) -> None:
         print(*args, **kwargs)
 
 
+# ─────────────────────────────────────────────────────────────
+# Shared animation thread
+# All live components are drawn from one thread, so they tick in the same
+# frames instead of each waking on its own schedule
+# ─────────────────────────────────────────────────────────────
+class UiTicker:
+    """Single daemon thread that animates every registered live component.
+
+    A component implements ``tick() -> float``: it draws one frame and
+    returns the seconds until it wants the next one. The thread exits when
+    the last component unregisters and is started again on demand.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        # Component -> monotonic time of its next frame
+        self._due: Dict[Any, float] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def register(self, component: Any) -> None:
+        """Start ticking component, beginning with an immediate frame."""
+        with self._cond:
+            self._due[component] = time.monotonic()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="dolphin-ui-ticker", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def unregister(self, component: Any) -> None:
+        """Stop ticking component (a frame already in progress still finishes)."""
+        with self._cond:
+            self._due.pop(component, None)
+            self._cond.notify()
+
+    def wake(self, component: Any) -> None:
+        """Tick component as soon as possible instead of at its next frame."""
+        with self._cond:
+            if component in self._due:
+                self._due[component] = 0.0
+                self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._due:
+                        self._thread = None
+                        return
+                    now = time.monotonic()
+                    ready = [c for c, due in self._due.items() if due <= now]
+                    if ready:
+                        break
+                    self._cond.wait(min(self._due.values()) - now)
+                # Parked until the tick returns; wake() during the tick resets it
+                for component in ready:
+                    self._due[component] = float("inf")
+
+            for component in ready:
+                try:
+                    delay = component.tick()
+                except Exception:
+                    # A broken component must not stop the others
+                    self.unregister(component)
+                    continue
+                with self._cond:
+                    if self._due.get(component) == float("inf"):
+                        self._due[component] = time.monotonic() + delay
+
+
+_ui_ticker = UiTicker()
+
+
 # ─────────────────────────────────────────────────────────────
 # Global StatusBar Coordination
 # Prevents concurrent animations from conflicting with each other
@@ -126,7 +202,7 @@ def _resume_components(components: List[Any]) -> None:
             comp.resume()
             # Debug log - import locally to avoid circular dependency
             from dolphin.cli.ui.components.status_bar import StatusBar
-            StatusBar._debug_log(f"Resumed {type(comp).__name__}")
+            StatusBar._debug_log("Resumed %s", type(comp).__name__)
 
 
 def _pause_active_status_bar() -> Optional['StatusBar']:
@@ -141,12 +217,13 @@ def _pause_active_status_bar() -> Optional['StatusBar']:
     # Debug log - import locally to avoid circular dependency
     from dolphin.cli.ui.components.status_bar import StatusBar
     StatusBar._debug_log(
-        f"_pause_active_status_bar: called, _active_status_bar={status_bar is not None}, "
-        f"running={status_bar.running if status_bar else 'N/A'}"
+        "_pause_active_status_bar: called, _active_status_bar=%s, running=%s",
+        status_bar is not None,
+        status_bar.running if status_bar else 'N/A',
     )
     if status_bar and status_bar.running:
         status_bar.pause()
-        StatusBar._debug_log(f"_pause_active_status_bar: paused StatusBar")
+        StatusBar._debug_log("_pause_active_status_bar: paused StatusBar")
         return status_bar
     return None
 
@@ -159,10 +236,10 @@ def _resume_status_bar(status_bar: Optional['StatusBar']) -> None:
     """
     # Debug log - import locally to avoid circular dependency
     from dolphin.cli.ui.components.status_bar import StatusBar
-    StatusBar._debug_log(f"_resume_status_bar: called, status_bar={status_bar is not None}, running={status_bar.running if status_bar else 'N/A'}")
+    StatusBar._debug_log("_resume_status_bar: called, status_bar=%s, running=%s", status_bar is not None, status_bar.running if status_bar else 'N/A')
     if status_bar and status_bar.running:
         status_bar.resume()
-        StatusBar._debug_log(f"_resume_status_bar: resumed StatusBar")
+        StatusBar._debug_log("_resume_status_bar: resumed StatusBar")
 
 
 def set_active_status_bar(status_bar: Optional['StatusBar']) -> None:
@@ -204,6 +281,8 @@ def pause_status_bar_context():
 # Export the lock for use by components
 __all__ = [
     '_stdout_lock',
+    '_ui_ticker',
+    'UiTicker',
     '_active_status_bar',
     '_active_plan_card',
     'get_active_status_bar',
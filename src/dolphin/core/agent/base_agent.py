@@ -746,6 +746,33 @@ class BaseAgent(ABC):
             self._pause_type = previous_pause_type
             raise
 
+    async def reset_for_resume(self, reason: str = "Agent resumed") -> None:
+        """Leave a non-tool pause and continue as a new turn via the state machine.
+
+        Counterpart of mark_user_interrupted(): clears a pending user interrupt,
+        the resume handle, pause type and pending input in one transition
+        instead of field-by-field resets in outer layers.
+
+        Args:
+            reason: State transition message for diagnostics.
+
+        Raises:
+            AgentLifecycleException: If the agent is not PAUSED.
+        """
+        if self.state != AgentState.PAUSED:
+            raise AgentLifecycleException(
+                "INVALID_STATE",
+                f"Cannot reset for resume from state {self.state.value}",
+            )
+
+        if self._pause_type == PauseType.USER_INTERRUPT:
+            # Avoid immediately re-triggering the interrupt guard next cycle
+            self.clear_interrupt()
+        self._pending_user_input = None
+        self._resume_handle = None
+        self._pause_type = None
+        await self._change_state(AgentState.RUNNING, reason)
+
     async def resume_with_input(self, user_input: Optional[str] = None) -> bool:
         """Resume execution after user interrupt, optionally with new input.
 
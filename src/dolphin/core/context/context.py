@@ -4,7 +4,7 @@ import json
 import time
 from collections import deque
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
+from typing import Callable, Dict, List, Optional, Any, Union, TYPE_CHECKING
 
 from dolphin.core.common.enums import MessageRole, SkillInfo, Messages, SkillType
 from dolphin.core.config.global_config import GlobalConfig
@@ -142,6 +142,8 @@ class Context:
         # Output event buffer (for UI/SDK consumption)
         # Use bounded deque to prevent unbounded memory growth in long-running sessions
         self._output_events: deque = deque(maxlen=MAX_OUTPUT_EVENTS)
+        # Optional push consumer; when set, events bypass the buffer
+        self._output_sink: Optional[Callable[[Dict[str, Any]], None]] = None
 
         # Trace listener for observability (injected by host application)
         self.trace_listener: Optional["ITraceListener"] = None
@@ -1699,7 +1701,8 @@ class Context:
 
         Notes:
             - This is an in-memory buffer only (process-local).
-            - Consumers can call drain_output_events() to fetch and clear.
+            - Consumers can call drain_output_events() to fetch and clear,
+              or register a push consumer with set_output_sink().
             - Prefer using OutputEventType enum for type safety.
         """
         from dolphin.core.task_registry import OutputEventType
@@ -1712,10 +1715,33 @@ class Context:
             "data": data,
             "timestamp_ms": int(time.time() * 1000),
         }
-        self._output_events.append(event)
+        if self._output_sink is not None:
+            self._output_sink(event)
+        else:
+            self._output_events.append(event)
+
+    def set_output_sink(
+        self, sink: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> None:
+        """Deliver output events to ``sink`` as they are written.
+
+        While a sink is set, events are not buffered and drain_output_events()
+        returns nothing. Events buffered before the sink was set are flushed to
+        it immediately. Pass None to go back to buffering.
+
+        Args:
+            sink: Callable receiving each event dict, or None
+        """
+        self._output_sink = sink
+        if sink is not None:
+            for event in self.drain_output_events():
+                sink(event)
 
     def drain_output_events(self) -> List[Dict[str, Any]]:
         """Drain and clear buffered output events."""
+        if not self._output_events:
+            # Idle polls: skip copying and clearing the empty buffer
+            return []
         events = list(self._output_events)
         self._output_events.clear()
         return events
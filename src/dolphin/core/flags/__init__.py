@@ -5,6 +5,7 @@ from .manager import (
     override,
     reset,
     get_all,
+    iter_sorted,
     set_flag,
 )  # Functional API
 from .definitions import (
@@ -19,6 +20,7 @@ __all__ = [
     "override",
     "reset",
     "get_all",
+    "iter_sorted",
     "set_flag",
     "EXPLORE_BLOCK_V2",
     "DEBUG_MODE",
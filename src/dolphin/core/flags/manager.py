@@ -6,7 +6,7 @@ Features:
 - Scope Overriding Based on ContextVar, Thread/Coroutine Safe
 """
 
-from typing import Dict, Mapping
+from typing import Dict, Iterator, Mapping, Tuple
 from contextlib import contextmanager
 from contextvars import ContextVar
 import logging
@@ -19,6 +19,7 @@ logger = logging.getLogger(__name__)
 
 # Known flags set
 _KNOWN_FLAGS = frozenset(_DEFAULTS.keys())
+_SORTED_FLAGS = tuple(sorted(_KNOWN_FLAGS))
 
 # Concurrency context isolation: Maintain independent overrides for each thread/coroutine
 _OVERRIDES: ContextVar[Dict[str, bool]] = ContextVar("DL_FLAGS_OVERRIDES", default={})
@@ -55,7 +56,7 @@ class _FlagsManager:
         """Check whether the flag is enabled (string literals are prohibited and must be passed as constant values)."""
         if not _ensure_known(name):
             return False
-        overrides = _get_overrides()
+        overrides = _OVERRIDES.get()  # Read-only access, no copy needed
         if name in overrides:
             return overrides[name]
         return _DEFAULTS.get(name, False)
@@ -102,6 +103,12 @@ class _FlagsManager:
             name: cur.get(name, _DEFAULTS.get(name, False)) for name in _KNOWN_FLAGS
         }
 
+    def iter_sorted(self) -> Iterator[Tuple[str, bool]]:
+        """Yield (name, value) for all known flags in name order, without building a dict."""
+        cur = _OVERRIDES.get()  # Read-only access, no copy needed
+        for name in _SORTED_FLAGS:
+            yield name, cur.get(name, _DEFAULTS.get(name, False))
+
 
 _manager = _FlagsManager()
 
@@ -110,4 +117,5 @@ is_enabled = _manager.is_enabled
 override = _manager.override
 reset = _manager.reset
 get_all = _manager.get_all
+iter_sorted = _manager.iter_sorted
 set_flag = _manager.set
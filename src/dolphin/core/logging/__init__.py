@@ -4,8 +4,11 @@
 from dolphin.core.logging.logger import (
     get_logger,
     console,
+    console_log,
+    console_plain,
     setup_logger,
     set_log_level,
+    set_console_flush_hook,
     Colors,
     colorize,
 )
@@ -13,8 +16,11 @@ from dolphin.core.logging.logger import (
 __all__ = [
     "get_logger",
     "console",
+    "console_log",
+    "console_plain",
     "setup_logger",
     "set_log_level",
+    "set_console_flush_hook",
     "Colors",
     "colorize",
 ]
@@ -3,7 +3,8 @@ import os
 import json
 import contextvars
 import re
-from typing import Optional, List
+import sys
+from typing import Callable, Optional, List
 from contextlib import contextmanager
 
 """_dolphin_logger is the global logger for Dolphin SDK.
@@ -26,6 +27,10 @@ SDK_LOGGER_NAME = "dolphin_language"
 # Pre-compiled ANSI escape sequences for removing console color codes
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 
+# Called before the console helpers write, so output that a UI layer holds
+# back (e.g. CLI stream events coalesced per frame) is rendered first
+_console_flush_hook: Optional[Callable[[], None]] = None
+
 
 # ANSI color codes
 class Colors:
@@ -281,8 +286,28 @@ def _format_json_compact(data, max_width=80):
     return str(data)
 
 
+def set_console_flush_hook(hook: Optional[Callable[[], None]]):
+    """Set the callable run before every console write (None to clear)
+
+        Args:
+            hook: Callable that renders any output held back by the UI layer
+    """
+    global _console_flush_hook
+    _console_flush_hook = hook
+
+
+def _flush_pending_console():
+    hook = _console_flush_hook
+    if hook is not None:
+        try:
+            hook()
+        except Exception:
+            pass
+
+
 def _stdout(value: str, info: bool = False, **kwargs):
     if info or ("verbose" in kwargs and kwargs["verbose"]):
+        _flush_pending_console()
         # Console Output
         print(value, **{k: v for k, v in kwargs.items() if k in ["end", "flush"]})
         # Synchronously write additional logs (if context is set)
@@ -313,6 +338,8 @@ def console_skill_call(skill_name, params, max_length=200, verbose=None, skill=N
     if verbose is False:
         return
 
+    _flush_pending_console()
+
     # Check if skill has custom UI rendering
     if skill and hasattr(skill, 'owner_skillkit') and skill.owner_skillkit:
         skillkit = skill.owner_skillkit
@@ -376,6 +403,8 @@ def console_skill_response(skill_name, response, max_length=200, verbose=None, s
     if verbose is False:
         return
 
+    _flush_pending_console()
+
     # Check if skill has custom UI rendering
     if skill and hasattr(skill, 'owner_skillkit') and skill.owner_skillkit:
         skillkit = skill.owner_skillkit
@@ -439,6 +468,8 @@ def console_agent_skill_exit(skill_name: str, message: str = None, verbose=None,
     if verbose is False:
         return
 
+    _flush_pending_console()
+
     effective_verbose = True if verbose is None else bool(verbose)
 
     if _should_use_cli_ui(verbose, is_cli=is_cli):
@@ -467,6 +498,8 @@ def console_agent_skill_enter(skill_name: str, message: str = None, verbose=None
     if verbose is False:
         return
 
+    _flush_pending_console()
+
     effective_verbose = True if verbose is None else bool(verbose)
 
     if _should_use_cli_ui(verbose, is_cli=is_cli):
@@ -502,6 +535,8 @@ def console_block_start(
     if verbose is False:
         return
 
+    _flush_pending_console()
+
     effective_verbose = True if verbose is None else bool(verbose)
 
     if _should_use_cli_ui(verbose, is_cli=is_cli):
@@ -599,3 +634,43 @@ def console(info, verbose=None, **kwargs):
             _stdout(str(info), info=True, flush=True, end=kwargs["end"])
         else:
             _stdout(str(info), info=True, flush=True)
+
+
+def console_log(template, *args, verbose=None, **kwargs):
+    """Console output with lazy %-style formatting, like the logging module
+
+        The template is only formatted when the message is actually displayed,
+        so suppressed messages (verbose=False) cost no string building.
+
+        Args:
+            template: Message template, formatted as ``template % args``
+            *args: Values for the template placeholders
+            verbose: Whether to display the message (None displays it)
+            **kwargs: Other parameters, such as end
+    """
+    if verbose is False:
+        return
+    console(template % args if args else template, verbose=verbose, **kwargs)
+
+
+def console_plain(msg: str, verbose=None):
+    """Write a plain, already formatted line to the console
+
+        Same output as console(msg, verbose=verbose) without the str()
+        conversion and print() keyword handling, for trivial messages on
+        frequently hit paths.
+
+        Args:
+            msg: Line to output (without trailing newline)
+            verbose: Whether to display the message (None displays it)
+    """
+    if verbose is False:
+        return
+
+    from dolphin.cli.ui.state import safe_write
+
+    _flush_pending_console()
+    line = msg + "\n"
+    # Under the shared stdout lock, so status bar / plan card frames can't tear it
+    safe_write(line)
+    _write_to_extra_log(line, ensure_newline=False)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from dolphin.core.skill.skill_function import SkillFunction
 from dolphin.core.skill.skill_matcher import SkillMatcher
@@ -33,13 +33,17 @@ class Skillset(Skillkit):
         binds owner_skillkit in the base Skillkit class. This binding is
         used by ExploreStrategy to collect metadata prompts dynamically.
         """
-        for skill in skillkit.getSkills():
-            self.addSkill(skill)
+        self.addSkills(skillkit.getSkills())
 
     def addSkill(self, skill: SkillFunction):
         if skill.get_function_name() not in self.getSkillNames():
             self.skills[skill.get_function_name()] = skill
 
+    def addSkills(self, skills: Iterable[SkillFunction]):
+        """Add several skills at once; like addSkill, existing names are kept."""
+        for skill in skills:
+            self.skills.setdefault(skill.get_function_name(), skill)
+
     def getSkillNames(self):
         return self.skills.keys()
 
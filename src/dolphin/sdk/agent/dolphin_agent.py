@@ -249,16 +249,9 @@ class DolphinAgent(BaseAgent):
                 kwargs.setdefault("preserve_context", True)
                 if message is None and self._pending_user_input:
                     message = self._pending_user_input
-                # Clear the interrupt event so the next execution cycle does
-                # not immediately re-trigger the interrupt guard.
-                if hasattr(self, "clear_interrupt"):
-                    self.clear_interrupt()
 
             # continue_chat serves as resume action for non-tool pause.
-            self._pending_user_input = None
-            self._resume_handle = None
-            self._pause_type = None
-            await self._change_state(AgentState.RUNNING, "Agent resumed via continue_chat()")
+            await self.reset_for_resume("Agent resumed via continue_chat()")
         elif self.state in (AgentState.COMPLETED, AgentState.INITIALIZED):
             # After arun() completes the agent is COMPLETED; after init it is
             # INITIALIZED.  Transition through INITIALIZED→RUNNING so that
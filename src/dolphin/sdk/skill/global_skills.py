@@ -6,6 +6,7 @@ from typing import Dict, Optional
 
 from dolphin.core.config.global_config import GlobalConfig
 from dolphin.core.logging.logger import get_logger
+from dolphin.core.skill.skillkit import Skillkit
 from dolphin.core.skill.skillset import Skillset
 from dolphin.lib.skillkits.agent_skillkit import AgentSkillKit
 from dolphin.lib.skillkits.system_skillkit import (
@@ -568,6 +569,16 @@ class GlobalSkills:
             # Restore original sys.path
             sys.path = originalSysPath
 
+    def installSkillkit(self, skillkit: Skillkit):
+        """
+        Install all skills of a skillkit and refresh the combined skillset
+
+        Args:
+            skillkit (Skillkit): Skillkit instance whose skills are installed
+        """
+        self.installedSkillset.addSkillkit(skillkit)
+        self._syncAllSkills()
+
     def registerAgentSkill(self, agentName: str, agent: BaseAgent):
         """
         Register an agent as a skill
@@ -583,8 +594,7 @@ class GlobalSkills:
         agentSkillKit = AgentSkillKit(agent, agentName)
 
         # Add agent skills to the agent skillset
-        for skill in agentSkillKit.getSkills():
-            self.agentSkillset.addSkill(skill)
+        self.agentSkillset.addSkillkit(agentSkillKit)
 
         self._syncAllSkills()
 
@@ -654,12 +664,10 @@ class GlobalSkills:
         self.allSkills = Skillset()
 
         # Add installed skills (owner_skillkit is already bound)
-        for skill in self.installedSkillset.getSkills():
-            self.allSkills.addSkill(skill)
+        self.allSkills.addSkills(self.installedSkillset.getSkills())
 
         # Add agent skills
-        for skill in self.agentSkillset.getSkills():
-            self.allSkills.addSkill(skill)
+        self.allSkills.addSkills(self.agentSkillset.getSkills())
 
     def getAllSkills(self) -> Skillset:
         """
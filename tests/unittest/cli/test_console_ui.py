@@ -0,0 +1,251 @@
+import os
+
+import pytest
+
+from dolphin.cli.ui import console
+from dolphin.cli.ui.console import ConsoleUI
+
+
+def test_terminal_width_queried_once_per_render(monkeypatch):
+    calls = []
+
+    def fake_size():
+        calls.append(1)
+        return os.terminal_size((100 + len(calls), 40))
+
+    now = [10.0]
+    monkeypatch.setattr(console.shutil, "get_terminal_size", fake_size)
+    monkeypatch.setattr(console.time, "monotonic", lambda: now[0])
+    ui = ConsoleUI()
+
+    ui._draw_box_top("tool")
+    ui._draw_separator()
+    ui._draw_box_bottom("done")
+    assert ui._get_terminal_width() == 101
+    assert len(calls) == 1
+
+    now[0] += ConsoleUI.TERMINAL_WIDTH_TTL
+    assert ui._get_terminal_width() == 102
+
+
+def test_skill_call_start_writes_box_once(monkeypatch):
+    writes = []
+    monkeypatch.setattr(console, "safe_write", lambda text, flush=True: writes.append(text))
+    monkeypatch.setattr(console, "safe_print", lambda *a, **k: writes.append(("print", a)))
+    monkeypatch.setattr(console.Spinner, "start", lambda self: None)
+    ui = ConsoleUI()
+
+    ui.skill_call_start("search", {"query": "dolphin", "limit": 3})
+
+    assert len(writes) == 1
+    block = writes[0]
+    assert block.endswith("\n")
+    assert "search" in block and "dolphin" in block
+    assert len(block.splitlines()) == 4
+
+
+def test_result_card_writes_card_once(monkeypatch):
+    writes = []
+    monkeypatch.setattr(console, "safe_write", lambda text, flush=True: writes.append(text))
+    monkeypatch.setattr(console, "safe_print", lambda *a, **k: writes.append(("print", a)))
+    ui = ConsoleUI()
+
+    ui.result_card("Done", "line one\nline two")
+
+    assert len(writes) == 1
+    assert "line one" in writes[0] and "line two" in writes[0]
+
+
+@pytest.fixture
+def sync_output(monkeypatch):
+    console._sync_output_enabled.cache_clear()
+    yield monkeypatch
+    console._sync_output_enabled.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "env, tty, expected",
+    [
+        ({"DOLPHIN_SYNC_OUTPUT": "1"}, False, True),
+        ({"DOLPHIN_SYNC_OUTPUT": "0", "TERM_PROGRAM": "WezTerm"}, True, False),
+        ({"TERM_PROGRAM": "WezTerm"}, True, True),
+        ({"TERM": "xterm-kitty"}, True, True),
+        ({"TERM": "xterm-kitty"}, False, False),
+        ({"TERM": "xterm-256color"}, True, False),
+    ],
+)
+def test_sync_output_detection(sync_output, env, tty, expected):
+    for name in ("DOLPHIN_SYNC_OUTPUT", "TERM_PROGRAM", "TERM"):
+        sync_output.delenv(name, raising=False)
+    for name, value in env.items():
+        sync_output.setenv(name, value)
+    sync_output.setattr(console.sys.stdout, "isatty", lambda: tty, raising=False)
+
+    assert console._sync_output_enabled() is expected
+
+
+def test_emit_block_wraps_in_synchronized_output(sync_output):
+    sync_output.setenv("DOLPHIN_SYNC_OUTPUT", "1")
+    writes = []
+    sync_output.setattr(console, "safe_write", lambda text, flush=True: writes.append(text))
+
+    ConsoleUI()._emit_block(["top", "bottom"])
+
+    assert writes == ["\x1b[?2026htop\nbottom\n\x1b[?2026l"]
+
+
+def test_highlight_inline_markdown():
+    ui = ConsoleUI()
+
+    assert ui._highlight_inline_markdown("plain text") == "plain text"
+    assert ui._highlight_inline_markdown("a **b** `c`") == "a \033[1mb\033[22m \033[36mc\033[0m"
+    assert ui._strip_ansi(ui._highlight_inline_markdown("a **b** `c`")) == "a b c"
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("", ("", False, 1)),
+        ("one line", ("one line", False, 1)),
+        ("a\n\n \n\033[0m\nb", ("a\n\nb", False, 3)),
+        ("\n\nb", ("\nb", False, 2)),
+    ],
+)
+def test_format_collapsed_content_short(content, expected):
+    assert ConsoleUI()._format_collapsed_content(content) == expected
+
+
+def test_format_collapsed_content_collapses_long_output():
+    content = "\n".join(f"line {i}" for i in range(30))
+
+    formatted, collapsed, total = ConsoleUI()._format_collapsed_content(content)
+
+    assert collapsed and total == 30
+    assert "line 0" in formatted and "line 29" in formatted
+    assert "(20 more lines)" in formatted
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("", True),
+        ("  \t", True),
+        ("\033[0m", True),
+        (" \033[36m \033[0m ", True),
+        ("text", False),
+        ("\033[36mtext\033[0m", False),
+        ("\033[2K", False),
+        ("\033", False),
+    ],
+)
+def test_is_visually_blank(line, expected):
+    assert console._is_visually_blank(line) is expected
+    assert console._is_visually_blank(line) == (not ConsoleUI._strip_ansi(line).strip())
+
+
+def test_format_multiline_text_squeezes_blanks_and_drops_meta_lines():
+    text = "a\n\n \n<class 'int'>\n\nb\n[Session 1] ok\nc"
+
+    formatted = ConsoleUI()._format_multiline_text(text)
+
+    # The meta line ends the first blank run, so two blank lines remain
+    assert ConsoleUI._strip_ansi(formatted).split("\n") == ["a", "", "", "b", "c"]
+
+
+def test_hline_clamps_and_reuses_rules():
+    assert console._hline(-3) == ""
+    assert console._hline(4) == console.Theme.BOX_HORIZONTAL * 4
+    assert console._hline(40) is console._hline(40)
+
+
+def test_highlight_json_indents_nested_values():
+    data = {"a": [1, 2], "b": {"c": None}}
+
+    plain = ConsoleUI._strip_ansi(ConsoleUI()._highlight_json(data, max_depth=20))
+
+    assert plain == '{\n  "a": [\n    1,\n    2\n  ],\n  "b": {\n    "c": null\n  }\n}'
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, "null"),
+        (True, "true"),
+        (False, "false"),
+        (1, "1"),
+        (1.0, "1.0"),
+        (-0.0, "-0.0"),
+        ('a"b\n', '"a\\"b\\n"'),
+        ("x" * 70, '"' + "x" * 57 + '..."'),
+    ],
+)
+def test_highlight_json_scalars(value, expected):
+    ui = ConsoleUI()
+    # Rendered twice so memoized leaves are checked too
+    for _ in range(2):
+        assert ConsoleUI._strip_ansi(ui._highlight_json(value)) == expected
+
+
+@pytest.mark.parametrize("text", ["tool", "搜索工具", "🔎 search"])
+def test_box_borders_fill_width_with_wide_titles(monkeypatch, text):
+    monkeypatch.setattr(console.shutil, "get_terminal_size", lambda: os.terminal_size((200, 40)))
+    ui = ConsoleUI()
+    width = min(ui.style.width, 196)
+
+    assert console._display_width(ui._draw_box_top(text)) == width
+    assert console._display_width(ui._draw_box_bottom(text)) == width
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("abc", 3), ("\033[1mabc\033[0m", 3), ("搜索", 4), ("─✓○", 3), ("e\u0301", 1), ("👩\u200d💻", 4)],
+)
+def test_display_width(text, expected):
+    assert console._display_width(text) == expected
+
+
+def test_format_params_clean_aligns_and_limits_keys():
+    params = {f"k{i}": i for i in range(20)}
+    params[3] = "int key"
+
+    lines = ConsoleUI._strip_ansi(ConsoleUI()._format_params_clean(params)).split("\n")
+
+    assert lines[0] == "  k0:  0"
+    assert len(lines) == 16
+    assert lines[-1] == "  ...+6 more parameters"
+
+
+def test_highlight_json_shows_first_ten_dict_entries():
+    data = {f"k{i}": i for i in range(25)}
+
+    plain = ConsoleUI._strip_ansi(ConsoleUI()._highlight_json(data))
+
+    assert '"k9": 9' in plain and '"k10"' not in plain
+    assert plain.endswith("...+15 more\n}")
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("# Title", "Title"),
+        ("- item", "• item"),
+        ("  * sub", "  ◦ sub"),
+        ("#tag", "#tag"),
+        ("plain **bold**", "plain bold"),
+    ],
+)
+def test_format_multiline_text_markdown_lines(line, expected):
+    formatted = ConsoleUI()._format_multiline_text(f"intro\n{line}")
+
+    assert ConsoleUI._strip_ansi(formatted).split("\n")[1] == expected
+
+
+def test_format_collapsed_content_skips_leading_session_lines():
+    content = "\n".join(
+        ["Session restored: s1", "[Session 2] running"] + [f"line {i}" for i in range(20)]
+    )
+
+    formatted, collapsed, _ = ConsoleUI()._format_collapsed_content(content)
+
+    first = ConsoleUI._strip_ansi(formatted).split("\n")[0]
+    assert collapsed and first.endswith("line 0")
@@ -0,0 +1,42 @@
+from types import SimpleNamespace
+
+import pytest
+
+import dolphin.cli.ui.input as ui_input
+from dolphin.cli.runner.modules.conversation import _promptUserInput
+
+
+async def _prompt_with(monkeypatch, text):
+    async def fake_prompt(**kwargs):
+        return text
+
+    monkeypatch.setattr(ui_input, "prompt_conversation_with_multimodal", fake_prompt)
+    return await _promptUserInput(SimpleNamespace(saveHistory=False))
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("/debug", "help"),
+        ("/DEBUG step", "step"),
+        ("/trace", "trace"),
+        ("/trace  10 ", "trace 10"),
+        ("/vars", "vars"),
+        ("/var x", "var x"),
+        ("/Snapshot", "snapshot"),
+        ("/progress", "progress"),
+        ("/help", "help"),
+    ],
+)
+async def test_debug_prefixes_map_to_commands(monkeypatch, text, expected):
+    assert await _prompt_with(monkeypatch, text) == (None, False, expected)
+
+
+@pytest.mark.parametrize("text", ["exit", " Quit ", "Q", "   "])
+async def test_exit_words_end_conversation(monkeypatch, text):
+    assert await _prompt_with(monkeypatch, text) == (None, True, None)
+
+
+@pytest.mark.parametrize("text", ["hello", "/tracer logs", "explain /debug"])
+async def test_plain_queries_pass_through(monkeypatch, text):
+    assert await _prompt_with(monkeypatch, text) == (text, False, None)
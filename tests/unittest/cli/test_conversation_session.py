@@ -0,0 +1,85 @@
+import asyncio
+import os
+import signal
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from dolphin.cli.runner.modules.conversation import ConversationSession
+
+
+def _args(interactive=False):
+    return SimpleNamespace(interactive=interactive, saveHistory=False)
+
+
+class _DummyAgent:
+    pass
+
+
+async def test_session_binds_token_only_while_running():
+    session = ConversationSession.from_args(_args())
+    agent = _DummyAgent()
+
+    for _ in range(2):
+        with session.running(agent, "demo"):
+            assert session.interrupt_token._agent is agent
+        assert session.interrupt_token._agent is None
+
+
+async def test_session_cleans_up_dispatcher_on_error():
+    session = ConversationSession.from_args(_args())
+    session.event_dispatcher.plan_id = "plan-1"
+
+    try:
+        with session.running(_DummyAgent(), "demo"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert session.event_dispatcher.plan_id is None
+    assert session.interrupt_token._agent is None
+
+
+async def test_interactive_session_routes_sigint_to_interrupt_token():
+    session = ConversationSession.from_args(_args(interactive=True))
+    session.layout.enabled = False
+    previous = signal.getsignal(signal.SIGINT)
+
+    with session.running(_DummyAgent(), "demo"):
+        os.kill(os.getpid(), signal.SIGINT)
+        for _ in range(100):
+            if session.interrupt_token.is_interrupted():
+                break
+            await asyncio.sleep(0.01)
+        assert session.interrupt_token.is_interrupted()
+
+    assert signal.getsignal(signal.SIGINT) is previous
+
+
+async def test_repeated_sigint_escalates_to_keyboard_interrupt():
+    session = ConversationSession.from_args(_args(interactive=True))
+    session.layout.enabled = False
+    previous = signal.getsignal(signal.SIGINT)
+    escalated = []
+
+    async def turn():
+        with session.running(_DummyAgent(), "demo"):
+            os.kill(os.getpid(), signal.SIGINT)
+            assert session.interrupt_token.is_interrupted()
+            # Second press cancels the task once the loop runs again
+            os.kill(os.getpid(), signal.SIGINT)
+            # Third press must get through a turn that blocks the loop
+            threading.Timer(0.05, os.kill, (os.getpid(), signal.SIGINT)).start()
+            try:
+                time.sleep(5)
+            except KeyboardInterrupt:
+                escalated.append(signal.getsignal(signal.SIGINT))
+            await asyncio.sleep(5)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.create_task(turn())
+
+    assert escalated == [previous]
+    assert signal.getsignal(signal.SIGINT) is previous
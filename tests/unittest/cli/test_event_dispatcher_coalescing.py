@@ -0,0 +1,112 @@
+import asyncio
+
+from dolphin.cli.ui import event_dispatcher as dispatcher_module
+from dolphin.cli.ui.event_dispatcher import CLIEventDispatcher, _coalesce_llm_stream
+
+
+def _stream(chunk, full, is_final=False, task_id=None):
+    data = {"chunk_text": chunk, "full_text": full, "is_final": is_final}
+    if task_id is not None:
+        data["task_id"] = task_id
+    return {"event_type": "llm_stream", "data": data}
+
+
+class _RecordingDispatcher(CLIEventDispatcher):
+    def __init__(self):
+        super().__init__(layout=None, verbose=True)
+        self.seen = []
+
+    def dispatch(self, event):
+        self.seen.append(event)
+
+
+def test_coalesce_merges_consecutive_stream_chunks():
+    merged = _coalesce_llm_stream(
+        [_stream("a", "a"), _stream("b", "ab"), _stream("c", "abc", is_final=True)]
+    )
+    assert len(merged) == 1
+    assert merged[0]["data"] == {"chunk_text": "abc", "full_text": "abc", "is_final": True}
+
+
+def test_coalesce_keeps_order_and_boundaries():
+    plan = {"event_type": "plan_task_update", "data": {"task_id": "t1"}}
+    events = [
+        _stream("a", "a"),
+        plan,
+        _stream("b", "b"),
+        _stream("!", "b!", is_final=True),
+        _stream("c", "c"),
+        _stream("x", "x", task_id="t2"),
+    ]
+    merged = _coalesce_llm_stream(events)
+    assert [e["data"]["chunk_text"] if e is not plan else "plan" for e in merged] == [
+        "a", "plan", "b!", "c", "x"
+    ]
+
+
+async def test_deferred_events_render_once_per_frame():
+    dispatcher = _RecordingDispatcher()
+    for i in range(5):
+        dispatcher.dispatch_deferred(_stream(str(i), "01234"[: i + 1]))
+    assert dispatcher.seen == []
+
+    await asyncio.sleep(dispatcher_module.FRAME_INTERVAL * 3)
+    assert [e["data"]["chunk_text"] for e in dispatcher.seen] == ["01234"]
+
+
+async def test_flush_renders_pending_events_immediately():
+    dispatcher = _RecordingDispatcher()
+    dispatcher.dispatch_deferred(_stream("a", "a"))
+    dispatcher.flush()
+    assert len(dispatcher.seen) == 1
+    assert dispatcher._flush_handle is None
+
+
+def test_deferred_dispatch_without_loop_is_immediate():
+    dispatcher = _RecordingDispatcher()
+    dispatcher.dispatch_deferred(_stream("a", "a"))
+    assert len(dispatcher.seen) == 1
+
+
+class _PrintingDispatcher(CLIEventDispatcher):
+    def __init__(self):
+        super().__init__(layout=None, verbose=True)
+
+    def dispatch(self, event):
+        print(f"STREAM {event['data']['chunk_text']}")
+
+
+class _Agent:
+    def get_context(self):
+        return None
+
+
+async def test_direct_console_write_flushes_deferred_events_first(capsys):
+    from dolphin.cli.runner.modules.execution import _dispatch_output_events
+    from dolphin.core.logging.logger import console_skill_call
+
+    dispatcher = _PrintingDispatcher()
+    with _dispatch_output_events(_Agent(), dispatcher):
+        dispatcher.dispatch_deferred(_stream("tokens", "tokens", is_final=True))
+        console_skill_call("search", {"q": "x"}, is_cli=False)
+        await asyncio.sleep(dispatcher_module.FRAME_INTERVAL * 3)
+
+    out = capsys.readouterr().out
+    assert out.count("STREAM tokens") == 1
+    assert out.index("STREAM tokens") < out.index("CALL SKILL")
+
+
+def test_deferred_dispatch_from_another_loop_is_immediate():
+    dispatcher = _RecordingDispatcher()
+
+    async def owner():
+        dispatcher.dispatch_deferred(_stream("a", "a"))
+        await asyncio.to_thread(asyncio.run, other())
+        assert [e["data"]["chunk_text"] for e in dispatcher.seen] == ["b"]
+        dispatcher.flush()
+
+    async def other():
+        dispatcher.dispatch_deferred(_stream("b", "b", task_id="t2"))
+
+    asyncio.run(owner())
+    assert [e["data"]["chunk_text"] for e in dispatcher.seen] == ["b", "a"]
@@ -0,0 +1,117 @@
+import os
+import signal
+import threading
+
+import pytest
+
+from dolphin.cli.ui.components import input_layout
+from dolphin.cli.ui.components.input_layout import FixedInputLayout
+
+
+def test_draw_fixed_bottom_writes_once(monkeypatch):
+    writes = []
+    monkeypatch.setattr(input_layout, "safe_write", lambda text, flush=True: writes.append(text))
+    layout = FixedInputLayout(info_line="model: test")
+    layout._terminal_height, layout._terminal_width = 20, 10
+
+    layout._draw_fixed_bottom()
+
+    assert len(writes) == 1
+    payload = writes[0]
+    assert payload.startswith("\0337") and payload.endswith("\0338")
+    for row in range(16, 21):
+        assert f"\033[{row};1H\033[K" in payload
+    assert payload.index("─" * 9) < payload.index("model: test") < payload.index("\033[19;1H", payload.index("model: test"))
+
+
+def test_separator_is_rebuilt_only_on_width_change():
+    layout = FixedInputLayout()
+
+    first = layout._get_separator(10)
+    assert layout._get_separator(10) is first
+    assert "─" * 9 in first
+
+    wider = layout._get_separator(20)
+    assert "─" * 19 in wider
+
+
+def test_terminal_size_falls_back_without_stdout_fd():
+    layout = FixedInputLayout()
+    layout._stdout_fd = None
+    assert layout._get_terminal_size() == (24, 80)
+
+
+def test_terminal_size_reads_stdout_fd(monkeypatch):
+    monkeypatch.setattr(input_layout.os, "get_terminal_size", lambda fd: os.terminal_size((120, 40)))
+    layout = FixedInputLayout()
+    layout._stdout_fd = 1
+    assert layout._get_terminal_size() == (40, 120)
+
+
+def test_resize_is_applied_on_next_redraw(monkeypatch):
+    writes = []
+    monkeypatch.setattr(input_layout, "safe_write", lambda text, flush=True: writes.append(text))
+    layout = FixedInputLayout()
+    layout._terminal_height, layout._terminal_width = 20, 10
+    monkeypatch.setattr(layout, "_get_terminal_size", lambda: (30, 40))
+
+    layout._draw_fixed_bottom()
+    assert layout._terminal_height == 20
+
+    layout._handle_resize(None, None)
+    layout._draw_fixed_bottom()
+    assert (layout._terminal_height, layout._terminal_width) == (30, 40)
+    assert len(writes) == 2
+    assert "\033[1;25r" in writes[1]
+    assert "─" * 39 in writes[1]
+
+
+def test_start_and_stop_write_once_each(monkeypatch):
+    writes = []
+    monkeypatch.setattr(input_layout, "safe_write", lambda text, flush=True: writes.append(text))
+    layout = FixedInputLayout()
+    monkeypatch.setattr(layout, "_get_terminal_size", lambda: (20, 10))
+
+    layout.start()
+    try:
+        assert len(writes) == 1
+        assert writes[0].startswith("\033[1;15r\033[2J\033[1;1H\0337")
+    finally:
+        layout.stop()
+    assert writes[1:] == ["\033[r\033[20;1H"]
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH")
+def test_stop_restores_default_sigwinch_handler(monkeypatch):
+    monkeypatch.setattr(input_layout, "safe_write", lambda text, flush=True: None)
+    previous = signal.signal(signal.SIGWINCH, signal.SIG_DFL)
+    try:
+        layout = FixedInputLayout()
+        layout.start()
+        assert signal.getsignal(signal.SIGWINCH) == layout._handle_resize
+        layout.stop()
+        assert signal.getsignal(signal.SIGWINCH) == signal.SIG_DFL
+    finally:
+        signal.signal(signal.SIGWINCH, previous)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="no SIGWINCH")
+def test_start_off_main_thread_skips_resize_handler(monkeypatch):
+    monkeypatch.setattr(input_layout, "safe_write", lambda text, flush=True: None)
+    before = signal.getsignal(signal.SIGWINCH)
+    layout = FixedInputLayout()
+    errors = []
+
+    def run():
+        try:
+            layout.start()
+            layout.stop()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+
+    assert errors == []
+    assert signal.getsignal(signal.SIGWINCH) == before
@@ -0,0 +1,97 @@
+import io
+import os
+import time
+
+import pytest
+
+from dolphin.cli.interrupt.handler import InterruptToken
+from dolphin.cli.interrupt.keyboard import KeyboardMonitor
+
+pty = pytest.importorskip("pty")
+termios = pytest.importorskip("termios")
+
+
+@pytest.fixture
+def terminal():
+    master, slave = pty.openpty()
+    stdin = os.fdopen(slave, "r", buffering=1)
+    yield master, stdin
+    stdin.close()
+    os.close(master)
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_monitor_is_noop_without_terminal():
+    monitor = KeyboardMonitor(InterruptToken(), stdin=io.StringIO())
+    monitor.start()
+    monitor.arm()
+    monitor.disarm()
+    monitor.close()
+    assert monitor._thread is None
+
+
+def test_monitor_interrupts_only_while_armed(terminal):
+    master, stdin = terminal
+    fd = stdin.fileno()
+    original = termios.tcgetattr(fd)
+    token = InterruptToken()
+    monitor = KeyboardMonitor(token, stdin=stdin)
+    monitor.start()
+    thread = monitor._thread
+    try:
+        # Not armed: the terminal is left alone and nothing is read
+        time.sleep(0.05)
+        assert termios.tcgetattr(fd) == original
+
+        for _ in range(2):
+            token.clear()
+            monitor.arm()
+            assert _wait_for(lambda: termios.tcgetattr(fd) != original)
+            os.write(master, b"\x1b")
+            assert _wait_for(token.is_interrupted)
+            monitor.disarm()
+
+        # Same thread serves every turn
+        assert monitor._thread is thread
+    finally:
+        monitor.close()
+    assert not thread.is_alive()
+
+
+def test_disarm_restores_terminal_settings(terminal):
+    _, stdin = terminal
+    original = termios.tcgetattr(stdin.fileno())
+    monitor = KeyboardMonitor(InterruptToken(), stdin=stdin)
+    monitor.start()
+    try:
+        monitor.arm()
+        assert _wait_for(lambda: termios.tcgetattr(stdin.fileno()) != original)
+        monitor.disarm()
+        assert termios.tcgetattr(stdin.fileno()) == original
+    finally:
+        monitor.close()
+
+
+def test_monitor_can_restart_after_close(terminal):
+    master, stdin = terminal
+    token = InterruptToken()
+    monitor = KeyboardMonitor(token, stdin=stdin)
+    monitor.start()
+    monitor.close()
+
+    monitor.start()
+    try:
+        monitor.arm()
+        assert _wait_for(lambda: termios.tcgetattr(stdin.fileno())[3] & termios.ICANON == 0)
+        os.write(master, b"\x1b")
+        assert _wait_for(token.is_interrupted)
+    finally:
+        monitor.close()
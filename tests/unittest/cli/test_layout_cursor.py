@@ -0,0 +1,32 @@
+import io
+
+from dolphin.cli.ui.layout import LayoutManager
+
+
+def test_set_cursor_visible_writes_only_on_change(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr("sys.stdout", out)
+    layout = LayoutManager(enabled=False)
+
+    layout.set_cursor_visible(True)
+    layout.set_cursor_visible(True)
+    assert out.getvalue() == "\033[?25h"
+
+    layout.set_cursor_visible(False)
+    layout.set_cursor_visible(True)
+    assert out.getvalue() == "\033[?25h\033[?25l\033[?25h"
+
+
+def test_status_bar_makes_cursor_state_unknown(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr("sys.stdout", out)
+    layout = LayoutManager(enabled=False)
+    layout.set_cursor_visible(True)
+
+    layout.show_status("Working")
+    layout.hide_status()
+    out.seek(0)
+    out.truncate()
+
+    layout.set_cursor_visible(True)
+    assert out.getvalue().endswith("\033[?25h")
@@ -0,0 +1,75 @@
+from dolphin.cli.ui.components import plan_card
+from dolphin.cli.ui.components.plan_card import LivePlanCard
+
+
+def test_fixed_rows_sequence_only_redraws_changed_rows():
+    card = LivePlanCard(fixed_row_start=5)
+
+    output = card._fixed_rows_sequence(["a", "b", "c"], ["a", "x", "c"])
+
+    assert output == "\0337\033[6;1H\033[Kb\0338"
+
+
+def test_fixed_rows_sequence_is_empty_when_unchanged():
+    card = LivePlanCard(fixed_row_start=5)
+
+    assert card._fixed_rows_sequence(["a", "b"], ["a", "b"]) == ""
+
+
+def test_fixed_rows_sequence_draws_everything_without_previous_frame():
+    card = LivePlanCard(fixed_row_start=2)
+
+    output = card._fixed_rows_sequence(["a", "b"], [])
+
+    assert output == "\0337\033[2;1H\033[Ka\033[3;1H\033[Kb\0338"
+
+
+def test_fixed_rows_sequence_clears_rows_of_a_taller_frame():
+    card = LivePlanCard(fixed_row_start=1)
+
+    output = card._fixed_rows_sequence(["a"], ["a", "b", "c"])
+
+    assert output == "\0337\033[2;1H\033[K\033[3;1H\033[K\0338"
+
+
+def test_update_swaps_snapshot_and_keeps_unset_fields():
+    card = LivePlanCard()
+    card.update(tasks=[{"content": "a", "status": "running"}], current_task_id=1)
+    before = card._state
+
+    card.update(current_action="start")
+
+    assert card._state is not before
+    assert before.current_action is None
+    assert card.current_action == "start"
+    assert card.current_task_id == 1
+    assert card.tasks == ({"content": "a", "status": "running"},)
+
+
+def test_update_does_not_wait_for_animation_lock():
+    card = LivePlanCard()
+    with card._lock:
+        card.update(current_task_id=2)
+    assert card.current_task_id == 2
+
+
+def test_update_wakes_animation_thread(monkeypatch):
+    woken = []
+    monkeypatch.setattr(plan_card._ui_ticker, "wake", woken.append)
+    card = LivePlanCard()
+    card.update()
+    assert woken == []
+
+    card.update(current_action="start")
+    assert woken == [card]
+
+
+def test_frame_interval_backs_off_without_spinner():
+    card = LivePlanCard()
+    card.update(tasks=[{"content": "a", "status": "running"}], current_task_id=1)
+    card._build_card_lines()
+    assert card._body_spinning
+
+    card.update(tasks=[{"content": "a", "status": "completed"}])
+    card._build_card_lines()
+    assert not card._body_spinning
@@ -0,0 +1,151 @@
+import os
+import signal
+
+import pytest
+
+from dolphin.cli.ui.components import plan_card
+from dolphin.cli.ui.components.plan_card import LivePlanCard, _truncate_to_width, _visual_width
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", 0),
+        ("plan", 4),
+        ("\033[1mbold\033[0m task", 9),
+        ("计划", 4),
+        ("  📋 Plan Update", 16),
+    ],
+)
+def test_visual_width(text, expected):
+    assert _visual_width(text) == expected
+
+
+def test_card_measures_through_shared_cache():
+    _visual_width.cache_clear()
+    card = LivePlanCard()
+    card.update(tasks=[{"content": "Read files", "status": "pending"}])
+    card._build_card_lines()
+    misses = _visual_width.cache_info().misses
+
+    card._build_card_lines()
+    assert _visual_width.cache_info().misses == misses
+
+
+def test_visual_width_ignores_non_sgr_sequences():
+    assert _visual_width("\033[2Kdone\033[1A") == 4
+
+
+@pytest.mark.parametrize(
+    "text, budget, expected",
+    [
+        ("short", 10, ("short", 5)),
+        ("abcdefghijkl", 10, ("abcdefg...", 10)),
+        ("分析数据并生成报告", 10, ("分析数...", 9)),
+        ("ab分析数据", 8, ("ab分...", 7)),
+        ("\033[1mabcdefghijkl\033[0m", 8, ("\033[1mabcde...", 8)),
+    ],
+)
+def test_truncate_to_width(text, budget, expected):
+    result = _truncate_to_width(text, budget)
+    assert result == expected
+    assert _visual_width(result[0]) == result[1] <= budget
+
+
+def _fresh_lines(card):
+    other = LivePlanCard()
+    other.update(tasks=card.tasks, current_task_id=card.current_task_id)
+    other.frame_index = card.frame_index
+    other.start_time = card.start_time
+    return other._build_card_lines()
+
+
+def test_cached_body_matches_fresh_render(monkeypatch):
+    monkeypatch.setattr(LivePlanCard, "_get_terminal_width", lambda self: 100)
+    card = LivePlanCard()
+    card.update(
+        tasks=[
+            {"content": "Read files", "status": "completed"},
+            {"content": "分析数据", "status": "running"},
+        ],
+        current_task_id=2,
+    )
+    card.start_time = 0
+
+    first = card._build_card_lines()
+    body = card._body
+    card.frame_index = 3
+    second = card._build_card_lines()
+
+    assert card._body is body
+    assert first[4] != second[4]
+    assert second[:-1] == _fresh_lines(card)[:-1]
+
+    card.update(tasks=[card.tasks[0], {"content": "分析数据", "status": "completed"}])
+    third = card._build_card_lines()
+    assert card._body is not body
+    assert third[:-1] == _fresh_lines(card)[:-1]
+    assert "completed" in third[-1]
+
+
+def test_footer_rebuilt_once_per_second(monkeypatch):
+    now = [100.4]
+    monkeypatch.setattr(plan_card.time, "time", lambda: now[0])
+    card = LivePlanCard()
+    card.update(tasks=[{"content": "Read files", "status": "running"}])
+    card.start_time = 100.0
+
+    first = card._build_card_lines()
+    footer = card._footer
+    now[0] = 100.9
+    assert card._build_card_lines()[-1] is footer
+
+    now[0] = 101.2
+    second = card._build_card_lines()
+    assert second[-1] is not footer
+    assert "1s •" in second[-1] and "0s •" in first[-1]
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="POSIX only")
+def test_terminal_width_cached_until_sigwinch(monkeypatch):
+    calls = []
+
+    def fake_size():
+        calls.append(1)
+        return os.terminal_size((100 + len(calls), 40))
+
+    monkeypatch.setattr(plan_card.shutil, "get_terminal_size", fake_size)
+    chained = []
+    original = signal.signal(signal.SIGWINCH, lambda signum, frame: chained.append(signum))
+    card = LivePlanCard()
+    try:
+        card._install_resize_handler()
+        assert card._get_terminal_width() == 101
+        assert card._get_terminal_width() == 101
+
+        signal.getsignal(signal.SIGWINCH)(signal.SIGWINCH, None)
+        assert card._get_terminal_width() == 102
+        assert chained == [signal.SIGWINCH]
+
+        card._restore_resize_handler()
+        assert signal.getsignal(signal.SIGWINCH) is not card._handle_resize
+        assert card._get_terminal_width() == 103
+        assert card._get_terminal_width() == 104
+    finally:
+        signal.signal(signal.SIGWINCH, original)
+
+
+@pytest.mark.skipif(not hasattr(signal, "SIGWINCH"), reason="POSIX only")
+def test_restore_falls_back_to_default_for_foreign_handler(monkeypatch):
+    original = signal.getsignal(signal.SIGWINCH)
+    real_getsignal = signal.getsignal
+    # A handler installed outside Python reads back as None
+    monkeypatch.setattr(signal, "getsignal", lambda signum: None)
+    card = LivePlanCard()
+    try:
+        card._install_resize_handler()
+        monkeypatch.setattr(signal, "getsignal", real_getsignal)
+        card._restore_resize_handler()
+        assert signal.getsignal(signal.SIGWINCH) == signal.SIG_DFL
+    finally:
+        signal.signal(signal.SIGWINCH, original)
@@ -0,0 +1,66 @@
+from dolphin.core.common.exceptions import DolphinException
+from dolphin.cli.runner.modules.errors import (
+    extract_root_cause,
+    extract_skill_error_message,
+)
+
+
+def _chain(*excs, attr="__cause__"):
+    for outer, inner in zip(excs, excs[1:]):
+        setattr(outer, attr, inner)
+    return excs[0]
+
+
+def test_root_cause_returns_dolphin_exception_itself():
+    exc = DolphinException("E", "boom")
+    assert extract_root_cause(exc) is exc
+
+
+def test_root_cause_follows_cause_and_context_links():
+    root = DolphinException("E", "boom")
+    assert extract_root_cause(_chain(RuntimeError(), ValueError(), root)) is root
+    assert (
+        extract_root_cause(_chain(RuntimeError(), ValueError(), root, attr="__context__"))
+        is root
+    )
+
+
+def test_root_cause_terminates_on_cyclic_chain():
+    first, second = RuntimeError("a"), ValueError("b")
+    first.__context__ = second
+    second.__context__ = first
+    assert extract_root_cause(first) is first
+
+
+def test_skill_error_message_extracted_from_wrapped_text():
+    message = (
+        "Skill 'search' not found.\n\nAvailable skills: a, b\n\n"
+        "Possible fixes:\n- Verify that the required skillkit module is loaded"
+    )
+    wrapped = RuntimeError(f"Execution failed: {message}\nTraceback...")
+    assert extract_skill_error_message(wrapped) == message
+
+
+def test_skill_error_message_from_skill_not_found_code():
+    wrapped = RuntimeError(
+        "SKILL_NOT_FOUND: Skill 'x' missing. Available skills: a. Load its module is loaded? tail"
+    )
+    assert (
+        extract_skill_error_message(wrapped)
+        == "Skill 'x' missing. Available skills: a. Load its module is loaded"
+    )
+
+
+def test_skill_error_message_none_without_skill_text():
+    assert extract_skill_error_message(RuntimeError("boom")) is None
+
+
+def test_root_cause_finds_context_branch_of_explicit_cause():
+    root = DolphinException("E", "boom")
+    try:
+        try:
+            raise root
+        except DolphinException:
+            raise RuntimeError("wrapped") from ValueError("detail")
+    except RuntimeError as exc:
+        assert extract_root_cause(exc) is root
@@ -0,0 +1,39 @@
+import builtins
+
+from dolphin.cli.ui.components.status_bar import StatusBar
+
+
+def test_debug_log_opens_file_once(monkeypatch, tmp_path):
+    log_file = tmp_path / "statusbar.log"
+    monkeypatch.setattr(StatusBar, "_DEBUG_ENABLED", True)
+    monkeypatch.setattr(StatusBar, "_DEBUG_LOG_FILE", str(log_file))
+    monkeypatch.setattr(StatusBar, "_debug_file", None)
+
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    try:
+        StatusBar._debug_log("loop=%s", 1)
+        StatusBar._debug_log("plain 计划")
+    finally:
+        StatusBar._debug_file.close()
+
+    assert opened == [str(log_file)]
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert [line.split("] ", 1)[1] for line in lines] == ["loop=1", "plain 计划"]
+
+
+def test_debug_log_disabled_does_not_open(monkeypatch, tmp_path):
+    monkeypatch.setattr(StatusBar, "_DEBUG_ENABLED", False)
+    monkeypatch.setattr(StatusBar, "_DEBUG_LOG_FILE", str(tmp_path / "statusbar.log"))
+    monkeypatch.setattr(StatusBar, "_debug_file", None)
+
+    StatusBar._debug_log("ignored %r", object())
+
+    assert StatusBar._debug_file is None
+    assert not (tmp_path / "statusbar.log").exists()
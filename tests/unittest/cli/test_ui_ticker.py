@@ -0,0 +1,86 @@
+import threading
+import time
+
+from dolphin.cli.ui.state import UiTicker
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class _Component:
+    def __init__(self, delay):
+        self.delay = delay
+        self.threads = []
+
+    def tick(self):
+        self.threads.append(threading.current_thread())
+        return self.delay
+
+
+def test_components_share_one_thread():
+    ticker = UiTicker()
+    fast, slow = _Component(0.01), _Component(0.05)
+    ticker.register(fast)
+    ticker.register(slow)
+    try:
+        assert _wait_for(lambda: len(fast.threads) >= 5 and len(slow.threads) >= 2)
+    finally:
+        ticker.unregister(fast)
+        ticker.unregister(slow)
+
+    assert len(set(fast.threads + slow.threads)) == 1
+    assert len(fast.threads) > len(slow.threads)
+
+
+def test_thread_exits_after_last_unregister_and_restarts():
+    ticker = UiTicker()
+    component = _Component(0.01)
+    ticker.register(component)
+    first = ticker._thread
+    ticker.unregister(component)
+    assert _wait_for(lambda: not first.is_alive())
+    assert ticker._thread is None
+
+    ticker.register(component)
+    try:
+        assert ticker._thread is not None and ticker._thread is not first
+    finally:
+        ticker.unregister(component)
+
+
+def test_wake_ticks_before_the_next_frame():
+    ticker = UiTicker()
+    component = _Component(60)
+    ticker.register(component)
+    try:
+        assert _wait_for(lambda: len(component.threads) == 1)
+        ticker.wake(component)
+        assert _wait_for(lambda: len(component.threads) == 2)
+    finally:
+        ticker.unregister(component)
+
+
+def test_failing_component_is_dropped():
+    ticker = UiTicker()
+    healthy = _Component(0.01)
+
+    class _Broken:
+        calls = 0
+
+        def tick(self):
+            _Broken.calls += 1
+            raise RuntimeError("boom")
+
+    ticker.register(_Broken())
+    ticker.register(healthy)
+    try:
+        assert _wait_for(lambda: len(healthy.threads) >= 3)
+    finally:
+        ticker.unregister(healthy)
+    assert _Broken.calls == 1
@@ -0,0 +1,35 @@
+from dolphin.core.context.context import Context
+
+
+def test_write_output_buffers_without_sink():
+    context = Context()
+    context.write_output("plan_created", {"plan_id": "p1"})
+
+    events = context.drain_output_events()
+    assert [e["event_type"] for e in events] == ["plan_created"]
+    assert context.drain_output_events() == []
+
+
+def test_output_sink_receives_events_as_written():
+    context = Context()
+    received = []
+    context.set_output_sink(received.append)
+
+    context.write_output("plan_task_update", {"task_id": "t1"})
+
+    assert [e["data"] for e in received] == [{"task_id": "t1"}]
+    assert context.drain_output_events() == []
+
+
+def test_set_output_sink_flushes_buffer_and_unbinds():
+    context = Context()
+    context.write_output("plan_created", {"plan_id": "p1"})
+
+    received = []
+    context.set_output_sink(received.append)
+    assert [e["event_type"] for e in received] == ["plan_created"]
+
+    context.set_output_sink(None)
+    context.write_output("plan_finished", {"plan_id": "p1"})
+    assert len(received) == 1
+    assert [e["event_type"] for e in context.drain_output_events()] == ["plan_finished"]
@@ -588,3 +588,33 @@ class TestBaseAgentInterrupt:
 
         assert agent.state == AgentState.RUNNING
         assert agent._pause_type is None
+
+    @pytest.mark.asyncio
+    async def test_reset_for_resume_clears_user_interrupt(self):
+        """reset_for_resume() should clear pause state and transition PAUSED -> RUNNING."""
+        agent = MockInterruptAgent()
+        await agent.initialize()
+        await agent._change_state(AgentState.RUNNING, "starting")
+        await agent.mark_user_interrupted("user interrupt")
+        agent._interrupt_event.set()
+        agent._pending_user_input = "new input"
+
+        await agent.reset_for_resume("resumed")
+
+        assert agent.state == AgentState.RUNNING
+        assert agent._pause_type is None
+        assert agent._resume_handle is None
+        assert agent._pending_user_input is None
+        assert not agent._interrupt_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_reset_for_resume_requires_paused_state(self):
+        """reset_for_resume() should reject agents that are not PAUSED."""
+        agent = MockInterruptAgent()
+        await agent.initialize()
+
+        with pytest.raises(AgentLifecycleException) as exc_info:
+            await agent.reset_for_resume()
+
+        assert exc_info.value.code == "INVALID_STATE"
+        assert agent.state == AgentState.INITIALIZED
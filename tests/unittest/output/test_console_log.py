@@ -0,0 +1,33 @@
+from dolphin.core.logging.logger import console, console_log, console_plain
+
+
+class _Exploding:
+    def __str__(self):
+        raise AssertionError("formatted a suppressed message")
+
+
+def test_console_log_formats_template(capsys):
+    console_log("[Flag] %s: %s", "debug", "Enabled")
+    console_log("100% literal")
+    assert capsys.readouterr().out == "[Flag] debug: Enabled\n100% literal\n"
+
+
+def test_console_log_skips_formatting_when_suppressed(capsys):
+    console_log("value: %s", _Exploding(), verbose=False)
+    assert capsys.readouterr().out == ""
+
+
+def test_console_plain_matches_console(capsys):
+    console("Conversation ended")
+    console_plain("Conversation ended")
+    console_plain("Conversation ended", verbose=False)
+    assert capsys.readouterr().out == "Conversation ended\n" * 2
+
+
+def test_console_plain_writes_through_stdout_lock(monkeypatch):
+    from dolphin.cli.ui import state
+
+    writes = []
+    monkeypatch.setattr(state, "safe_write", lambda text, flush=True: writes.append(text))
+    console_plain("Goodbye")
+    assert writes == ["Goodbye\n"]
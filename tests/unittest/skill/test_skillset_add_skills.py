@@ -0,0 +1,31 @@
+from dolphin.core.skill.skill_function import SkillFunction
+from dolphin.core.skill.skillset import Skillset
+
+
+def search(query: str) -> str:
+    """Search for a query.
+
+    Args:
+        query: Text to search for
+    """
+    return query
+
+
+def fetch(url: str) -> str:
+    """Fetch a URL.
+
+    Args:
+        url: Address to fetch
+    """
+    return url
+
+
+def test_add_skills_keeps_existing_names():
+    first = SkillFunction(search)
+    skillset = Skillset()
+    skillset.addSkill(first)
+
+    skillset.addSkills([SkillFunction(search), SkillFunction(fetch)])
+
+    assert list(skillset.getSkillNames()) == ["search", "fetch"]
+    assert skillset.skills["search"] is first
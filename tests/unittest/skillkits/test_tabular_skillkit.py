@@ -0,0 +1,210 @@
+import importlib.util
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SKILLKIT_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "examples"
+    / "tabular_analyst"
+    / "skillkits"
+    / "tabular_skillkit.py"
+)
+
+
+def _load_module():
+    spec = importlib.util.spec_from_file_location("tabular_skillkit", SKILLKIT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+tabular = _load_module()
+
+CSV_FIXTURES = {
+    # Row 0 repeats as row 5, in another chunk; "name" is categorized only in
+    # the low-cardinality chunks
+    "split_duplicate": "id,name\n1,a\n2,a\n3,b\n4,c\n5,d\n1,a\n6,a\n",
+    # The second chunk of "score" is all NaN (float64), the first int64
+    "all_nan_chunk": "id,score\n1,10\n2,20\n3,\n4,\n3,\n5,30\n",
+    # "x" is int64 in the first chunk and float64 (with NaN) in the second
+    "int_float_drift": "x,y\n1,a\n2,b\n1,a\n,c\n2.5,d\n2.5,d\n",
+    # Repeats within a chunk and of rows from several earlier chunks
+    "repeated_rows": "a,b\n1,x\n1,x\n2,y\n1,x\n2,y\n3,z\n2,y\n1,x\n",
+    # Distinct ids that are equal once cast to float64
+    "large_ints": "id\n9007199254740992\n9007199254740993\n",
+}
+
+
+@pytest.fixture(params=["arrow", "pandas"])
+def skillkit(request, monkeypatch):
+    if request.param == "pandas":
+        monkeypatch.setattr(tabular, "pa", None)
+    elif tabular.pa is None:
+        pytest.skip("pyarrow is not installed")
+    kit = tabular.TabularSkillkit()
+    # Tiny chunks and blocks so every fixture spans several of them
+    kit.chunk_size = 2
+    kit.csv_block_size = 24
+    return kit
+
+
+@pytest.mark.parametrize("name", sorted(CSV_FIXTURES))
+def test_column_info_matches_pandas(tmp_path, skillkit, name):
+    path = tmp_path / f"{name}.csv"
+    path.write_text(CSV_FIXTURES[name])
+    df = pd.read_csv(path)
+
+    info = json.loads(skillkit.get_column_info(str(path)))
+
+    structure = info["structure_analysis"]
+    assert structure["duplicate_rows"] == df.duplicated().sum()
+    assert structure["has_duplicates"] == df.duplicated().any()
+    for col in df.columns:
+        column = info["column_analysis"][col]
+        assert column["unique_count"] == df[col].nunique()
+        assert column["non_null_count"] == df[col].count()
+
+
+def test_hash_rows_agrees_across_int_and_float_chunks():
+    ints = pd.DataFrame({"x": [1, 2**53 + 1, -3]})
+    floats = pd.DataFrame({"x": [1.0, 2.0**53, -3.0]})
+
+    int_hashes = tabular._hash_rows(ints)
+    float_hashes = tabular._hash_rows(floats)
+
+    assert int_hashes[0] == float_hashes[0]
+    assert int_hashes[2] == float_hashes[2]
+    assert int_hashes[1] != float_hashes[1]
+
+
+TYPED_CSV = (
+    "i,i_null,b,b_null,f,s,d,ts,t,empty\n"
+    "1,1,True,True,1.5,a,2024-01-01,2024-01-01 10:00:00,10:00:00,\n"
+    "2,,False,,2.5,b,2024-01-02,2024-01-02 11:00:00,11:00:00,\n"
+)
+
+
+def _reported(info, field):
+    return {col: column[field] for col, column in info["column_analysis"].items()}
+
+
+def test_csv_types_and_memory_match_pandas(tmp_path, skillkit):
+    path = tmp_path / "typed.csv"
+    path.write_text(TYPED_CSV)
+    # One chunk, so per-chunk dtypes equal the whole-file dtypes
+    skillkit.chunk_size = 1000
+    skillkit.csv_block_size = 1 << 20
+    df = pd.read_csv(path)
+
+    info = json.loads(skillkit.get_column_info(str(path)))
+
+    assert _reported(info, "data_type") == {col: str(t) for col, t in df.dtypes.items()}
+    expected_kb = df.memory_usage().sum() / 1024
+    assert info["file_info"]["memory_usage"] == f"{expected_kb:.2f} KB"
+
+
+@pytest.mark.parametrize("metadata_only", [False, True])
+def test_parquet_types_match_pandas(tmp_path, metadata_only):
+    if tabular.pa is None:
+        pytest.skip("pyarrow is not installed")
+    path = tmp_path / "typed.parquet"
+    table = tabular.pa.table(
+        {
+            "i": [1, 2, 3],
+            "i_null": [1, None, 3],
+            "b_null": [True, None, False],
+            "f": [0.5, None, 1.5],
+        }
+    )
+    tabular.pq.write_table(table, path)
+    df = pd.read_parquet(path)
+
+    kit = tabular.TabularSkillkit()
+    info = json.loads(kit.get_column_info(str(path), metadata_only=metadata_only))
+
+    assert _reported(info, "data_type") == {col: str(t) for col, t in df.dtypes.items()}
+
+
+def test_parquet_unique_counts_ignore_nan(tmp_path):
+    if tabular.pa is None:
+        pytest.skip("pyarrow is not installed")
+    path = tmp_path / "nan.parquet"
+    tabular.pq.write_table(
+        tabular.pa.table({"f": [0.5, float("nan"), None, float("nan"), 0.5]}), path
+    )
+    kit = tabular.TabularSkillkit()
+    kit.chunk_size = 2
+
+    info = json.loads(kit.get_tabular_columns(str(path)))
+
+    assert info["columns"]["f"]["unique_count"] == pd.read_parquet(path)["f"].nunique()
+
+
+def test_merge_sorted_unique_adds_only_unseen_values():
+    seen = np.array([2, 5, 9])
+
+    merged = tabular._merge_sorted_unique(seen, np.array([9, 1, 5, 7, 1, 12]))
+
+    assert merged.tolist() == [1, 2, 5, 7, 9, 12]
+    assert tabular._merge_sorted_unique(merged, np.array([7, 2])) is merged
+
+
+def _counting_skillkit(monkeypatch, cache_dir, scans):
+    kit = tabular.TabularSkillkit()
+    kit.cache_dir = cache_dir
+    collect = kit._collect_stats
+
+    def counting_collect(*args, **kwargs):
+        scans.append(1)
+        return collect(*args, **kwargs)
+
+    monkeypatch.setattr(kit, "_collect_stats", counting_collect)
+    return kit
+
+
+def test_disk_cache_is_opt_in():
+    assert tabular.TabularSkillkit().cache_dir is None
+
+
+@pytest.mark.parametrize("change", ["mtime", "size"])
+def test_file_change_invalidates_both_cache_layers(tmp_path, monkeypatch, change):
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n2\n")
+    cache_dir = tmp_path / "cache"
+    scans = []
+    kit = _counting_skillkit(monkeypatch, cache_dir, scans)
+
+    first = kit.get_tabular_columns(str(path))
+    # Memory layer, then disk layer (a new instance has an empty memory cache)
+    assert kit.get_tabular_columns(str(path)) == first
+    assert _counting_skillkit(monkeypatch, cache_dir, scans).get_tabular_columns(
+        str(path)
+    ) == first
+    assert len(scans) == 1
+
+    st = path.stat()
+    if change == "size":
+        path.write_text("a\n1\n2\n3\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    else:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    kit.get_tabular_columns(str(path))
+    assert len(scans) == 2
+    _counting_skillkit(monkeypatch, cache_dir, scans).get_tabular_columns(str(path))
+    # The entry rewritten by the first rescan is current again
+    assert len(scans) == 2
+
+    stale = _counting_skillkit(monkeypatch, cache_dir, scans)
+    if change == "size":
+        path.write_text("a\n1\n")
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    else:
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 2 * 10**9))
+    stale.get_tabular_columns(str(path))
+    assert len(scans) == 3